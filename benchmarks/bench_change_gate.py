@@ -0,0 +1,51 @@
+"""
+Benchmark do portão de mudança de cena com o detector de QR code do OpenCV:
+simula um voo pairando (frames quase iguais, com ruído de sensor) em que a cena muda
+a cada N frames, e compara o detector rodando em todos os frames com o detector atrás do ChangeGate.
+
+Uso (com a biblioteca instalada, ex: pip install -e .):
+    python benchmarks/bench_change_gate.py [frames] [mudanca_a_cada]
+"""
+import sys
+import time
+import cv2
+import numpy as np
+from tello_zune.change_detector import ChangeGate
+
+def hover_frames(n: int, change_every: int) -> list[np.ndarray]:
+    """Frames 960x720 em escala de cinza: cena fixa com ruído, um objeto muda de lugar a cada change_every frames."""
+    rng = np.random.default_rng(0)
+    base = cv2.GaussianBlur(rng.integers(0, 255, (720, 960), dtype=np.uint8), (31, 31), 0)
+    frames = []
+    for i in range(n):
+        frame = base.copy()
+        x = 100 + (i // change_every) * 150 % 700
+        cv2.rectangle(frame, (x, 200), (x + 180, 420), 255, -1)
+        noise = rng.integers(-2, 3, frame.shape)
+        frames.append(np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8))
+    return frames
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    change_every = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    frames = hover_frames(n, change_every)
+    qr = cv2.QRCodeDetector()
+    detect = lambda gray: qr.detectAndDecode(gray)
+
+    start = time.perf_counter()
+    for frame in frames:
+        detect(frame)
+    full = time.perf_counter() - start
+
+    gate = ChangeGate(threshold=3.0)
+    start = time.perf_counter()
+    for i, frame in enumerate(frames):
+        gate.run(frame, detect, i)
+    gated = time.perf_counter() - start
+
+    stats = gate.stats()
+    print(f"Detector em todos os frames   {full / n * 1000:7.2f} ms/frame")
+    print(f"Detector com ChangeGate       {gated / n * 1000:7.2f} ms/frame")
+    print(f"Frames pulados                {stats['skip_ratio']:7.1%}")
+    print(f"Custo do teste de mudança     {stats['overhead_ms'] / n:7.3f} ms/frame")
+    print(f"Tempo economizado             {stats['saved_ms']:7.0f} ms ({stats['saved_ratio']:.0%})")
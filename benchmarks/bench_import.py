@@ -0,0 +1,50 @@
+"""
+Benchmark de importação: tempo e memória (RSS) do modo somente telemetria (video=False)
+comparado ao modo com vídeo (OpenCV e NumPy carregados).
+Cada medida roda num processo Python novo, para não aproveitar módulos já importados.
+
+Uso (com a biblioteca instalada, ex: pip install -e .):
+    python benchmarks/bench_import.py [repeticoes]
+"""
+import subprocess
+import sys
+from statistics import median
+
+PROBE = """
+import time, sys
+from unittest.mock import patch
+t0 = time.perf_counter()
+import tello_zune.tello_zune as tz
+with patch('socket.socket'):
+    tello = tz.TelloZune(video={video})
+if {video}:
+    tz._load_video_stack() # O que start_video/get_frame carregam
+elapsed = time.perf_counter() - t0
+rss_kb = 0
+with open('/proc/self/status') as f:
+    for line in f:
+        if line.startswith('VmRSS:'):
+            rss_kb = int(line.split()[1])
+print(elapsed, rss_kb, 'cv2' in sys.modules, 'numpy' in sys.modules)
+"""
+
+def measure(video: bool, repeat: int) -> tuple[float, float, bool, bool]:
+    """Retorna a mediana do tempo (ms) e do RSS (MB) e se cv2/numpy foram carregados."""
+    times, rss = [], []
+    loaded = (False, False)
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, '-c', PROBE.format(video=video)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(out[0]) * 1000)
+        rss.append(int(out[1]) / 1024)
+        loaded = (out[2] == 'True', out[3] == 'True')
+    return median(times), median(rss), loaded[0], loaded[1]
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'modo':<26}{'import (ms)':>12}{'RSS (MB)':>10}{'cv2':>6}{'numpy':>7}")
+    for name, video in (('telemetria (video=False)', False), ('com vídeo', True)):
+        t, r, cv, npy = measure(video, repeat)
+        print(f"{name:<26}{t:>12.1f}{r:>10.1f}{str(cv):>6}{str(npy):>7}")
@@ -0,0 +1,39 @@
+"""
+Benchmark do custo de uma mensagem no caminho quente com um terminal lento (ex: sessão SSH).
+Compara print síncrono com o logging assíncrono da biblioteca (um put na fila por mensagem).
+
+Uso (com a biblioteca instalada, ex: pip install -e .):
+    python benchmarks/bench_logging.py
+"""
+import io
+import time
+from tello_zune.log import configure_logging, get_logger, shutdown_logging
+
+N = 200
+WRITE_DELAY = 0.002 # 2 ms por escrita no terminal
+
+class SlowTerminal(io.StringIO):
+    """Terminal que demora WRITE_DELAY a cada escrita."""
+    def write(self, s: str) -> int:
+        time.sleep(WRITE_DELAY)
+        return super().write(s)
+
+def per_call(fn) -> float:
+    """Retorna o custo médio de fn em segundos."""
+    start = time.perf_counter()
+    for i in range(N):
+        fn(i)
+    return (time.perf_counter() - start) / N
+
+if __name__ == '__main__':
+    terminal = SlowTerminal()
+    sync = per_call(lambda i: print(f"forward 50\tok {i}", file=terminal))
+
+    configure_logging(stream=SlowTerminal(), rate=0)
+    logger = get_logger('bench')
+    async_cost = per_call(lambda i: logger.info("%s\t%s", 'forward 50', f"ok {i}"))
+    debug_cost = per_call(lambda i: logger.debug("%s\t%s", 'forward 50', f"ok {i}")) # Nível desativado
+    shutdown_logging()
+
+    for name, cost in (('print (síncrono)', sync), ('logger.info (fila)', async_cost), ('logger.debug (desativado)', debug_cost)):
+        print(f"{name:<28}{cost * 1e6:10.1f} us")
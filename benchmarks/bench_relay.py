@@ -0,0 +1,46 @@
+"""
+Benchmark do custo de publicação do relay de telemetria por quantidade de assinantes:
+no multicast o publicador faz um único envio por pacote; no transporte unix, um por assinante.
+
+Uso (com a biblioteca instalada, ex: pip install -e .):
+    python benchmarks/bench_relay.py [pacotes]
+"""
+import sys
+import socket
+import tempfile
+import time
+from tello_zune.relay import StateRelay, RelayClient
+
+STATE = dict(zip(
+    ('pitch', 'roll', 'yaw', 'vgx', 'vgy', 'vgz', 'templ', 'temph', 'tof', 'h', 'bat', 'baro', 'time', 'agx', 'agy', 'agz'),
+    ('0', '0', '-45', '0', '0', '0', '60', '62', '90', '80', '50', '10.5', '5', '-2.00', '1.00', '-999.00')
+))
+
+def publish_cost(pub: StateRelay, clients: list[RelayClient], n: int) -> float:
+    """Tempo médio (µs) de publish_state, esvaziando os assinantes a cada lote para não encher os buffers."""
+    total = 0.0
+    for start in range(0, n, 100):
+        t0 = time.perf_counter()
+        for i in range(start, min(start + 100, n)):
+            pub.publish_state(float(i), STATE)
+        total += time.perf_counter() - t0
+        for client in clients:
+            while client.recv(timeout=0.001) is not None:
+                pass
+    return total / n * 1e6
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    for transport in ('multicast', 'unix'):
+        for count in (0, 1, 4, 16):
+            with tempfile.TemporaryDirectory() as path:
+                clients = [RelayClient(transport, port=port, path=path) for _ in range(count)]
+                pub = StateRelay(transport, port=port, path=path)
+                cost = publish_cost(pub, clients, n)
+                print(f"{transport:<9} {count:>2} assinantes   {cost:6.2f} µs por pacote")
+                pub.close()
+                for client in clients:
+                    client.close()
@@ -0,0 +1,78 @@
+"""
+Benchmark do tempo de reação do intertravamento de segurança, de ponta a ponta no loopback:
+um "drone" falso envia um pacote de estado com bateria baixa e mede quando o 'land' chega de volta.
+Compara o intertravamento (avaliado na thread de estado) com um laço do usuário que
+consulta get_battery() na taxa de frames (30 Hz) e envia o pouso.
+
+Uso (com a biblioteca instalada, ex: pip install -e .):
+    python benchmarks/bench_safety.py [repeticoes]
+"""
+import socket
+import sys
+import threading
+import time
+from statistics import median, quantiles
+from tello_zune.tello_zune import TelloZune
+from tello_zune.safety import min_battery
+
+GOOD = b"pitch:0;roll:0;yaw:0;vgx:0;vgy:0;vgz:0;templ:60;temph:62;tof:90;h:80;bat:50;baro:10.0;time:5;agx:0;agy:0;agz:0;\r\n"
+LOW = GOOD.replace(b"bat:50", b"bat:10")
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def measure(tello: TelloZune, drone: socket.socket, state_port: int, n: int, rearm) -> list[float]:
+    """Envia n pacotes com bateria baixa e mede até a chegada do 'land'."""
+    latencies = []
+    for _ in range(n):
+        drone.sendto(GOOD, ('127.0.0.1', state_port))
+        time.sleep(0.02)
+        rearm()
+        t0 = time.perf_counter()
+        drone.sendto(LOW, ('127.0.0.1', state_port))
+        while True:
+            data, _ = drone.recvfrom(64)
+            if data == b'land':
+                latencies.append(time.perf_counter() - t0)
+                break
+    return latencies
+
+def report(name: str, latencies: list[float]) -> None:
+    p = quantiles(latencies, n=100)
+    print(f"{name:<34} mediana {median(latencies) * 1000:7.3f} ms   p99 {p[98] * 1000:7.3f} ms")
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    cmd_port, state_port = free_port(), free_port()
+    drone = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    drone.bind(('127.0.0.1', 0))
+    drone.settimeout(2.0)
+
+    tello = TelloZune('127.0.0.1', cmd_port, UDPSTATEPORT=state_port, video=False)
+    tello.telloaddr = drone.getsockname() # Comandos vão para o drone falso
+    tello.stateThread.start()
+
+    safety = tello.enable_safety([min_battery(20)])
+    report("Intertravamento (por pacote)", measure(tello, drone, state_port, n, safety.reset))
+    tello.disable_safety()
+
+    # Laço do usuário na taxa de frames
+    stop = threading.Event()
+    armed = threading.Event()
+    def user_loop():
+        while not stop.is_set():
+            try:
+                if armed.is_set() and tello.get_battery() < 20:
+                    armed.clear()
+                    tello.send_cmd('land')
+            except ValueError:
+                pass
+            time.sleep(1 / 30)
+    threading.Thread(target=user_loop, daemon=True).start()
+    report("Laço do usuário a 30 Hz", measure(tello, drone, state_port, n, armed.set))
+    stop.set()
+
+    tello.stateThread.stop()
+    drone.close()
@@ -0,0 +1,35 @@
+import cv2
+from tello_zune import TelloZune
+from tello_zune.dataset import DatasetWriter, DatasetReader
+
+# inicializa e conecta com o Tello
+tello = TelloZune()
+tello.start_tello()
+# frames reduzidos para 320x240 com a telemetria do instante de captura, em blocos de 1000 frames
+writer = DatasetWriter('dataset_voo', size=(320, 240), chunk_size=1000)
+# rotulo atual (teclas 0-9), gravado junto com cada frame
+label = -1
+
+while True:
+    # frame e estado interpolado no instante de captura (yaw, pitch, roll, tof, velocidades...)
+    frame, state = tello.get_frame_with_state()
+    # a gravacao acontece numa thread propria: aqui so entra numa fila
+    writer.write(frame, tello.frame_timestamp, state, label)
+    cv2.imshow('Video', frame)
+    key = cv2.waitKey(1) & 0xFF
+    if ord('0') <= key <= ord('9'):
+        label = key - ord('0')
+    if key == ord('q'):
+        break
+
+index = writer.close()
+print(f"{index['frames']} frames em {len(index['chunks'])} blocos ({index['dropped']} descartados)")
+# desliga a transmissao de video
+tello.end_tello()
+cv2.destroyAllWindows()
+
+# leitura para treino: acesso aleatorio via memmap, sem decodificar arquivos
+reader = DatasetReader('dataset_voo')
+for frames, meta in reader.batches(batch_size=64, seed=0):
+    print(frames.shape, meta['label'][:8], meta['yaw'][:8])
+    break
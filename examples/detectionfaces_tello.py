@@ -1,35 +1,42 @@
 import cv2
 from tello_zune import TelloZune
+from tello_zune.face_detector import FaceDetector
+from tello_zune.change_detector import ChangeGate
 
 # inicializa e conecta com o Tello
 tello = TelloZune()
 tello.start_tello()
-# cria o objeto face_detector para fazer a deteccao de faces
-face_detector = cv2.CascadeClassifier('examples/haarcascade_frontalface_default.xml')
+# cria o detector: Haar completo so a cada 30 frames ou quando perde o rosto,
+# redeteccao nas janelas dos rostos a cada 10 frames e rastreamento por template entre elas
+face_detector = FaceDetector('examples/haarcascade_frontalface_default.xml', detect_every=10, full_scan_every=30)
+# com a cena parada (drone pairando) reaproveita os rostos do frame anterior
+gate = ChangeGate(threshold=3.0)
 
 while True:
-    # captura cada frame do objeto frame do tello
-    frame = tello.get_frame()
-    # converte a imagem de frame BGR para escala de cinza para a deteccao
-    image_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    # faz a deteccao a cada frame
-    detections = face_detector.detectMultiScale(image_gray, minSize=(130, 130), minNeighbors=9, maxSize=(290, 290), scaleFactor=1.05)
+    # captura cada frame no formato do decodificador (com o PyAV, YUV sem conversao)
+    video_frame = tello.get_video_frame()
+    # a deteccao usa so a luminancia: com o PyAV e o plano Y do frame, sem converter BGR para cinza
+    image_gray = video_frame.gray
+    # detecta ou rastreia os rostos
+    detections = gate.run(image_gray, face_detector.detect, tello.frame_timestamp)
 
-    #exibe o numero de rostos detectados
-    if len(detections) >= 1:
-        print(f"Rostos detectados: {len(detections)}")
-    else:
-        print(f"Rostos detectados: 0")
+    #exibe o numero de rostos detectados e o custo do frame
+    print(f"Rostos detectados: {len(detections)} ({face_detector.last_mode}, {face_detector.last_cost:.1f} ms)")
 
-    # desenha a bounding box no frame 
+    # a cor so e necessaria para exibir
+    frame = video_frame.bgr.copy()
+    # desenha a bounding box no frame
     for x, y, w, h in detections:
         cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 255), 2)
-    # exibe o frame 
+    # exibe o frame
     cv2.imshow("Video", frame)
 
     # quebra o laco de repeticao ao apertar a tecla 'q'
     if cv2.waitKey(1) & 0xFF == ord('q'):
         break
+# aproveitamento do portao de mudanca de cena
+stats = gate.stats()
+print(f"Detector pulado em {stats['skip_ratio']:.0%} dos frames ({stats['saved_ms']:.0f} ms economizados)")
 # desliga a transmissao do video
 tello.end_tello()
 cv2.destroyAllWindows()
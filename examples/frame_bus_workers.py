@@ -0,0 +1,48 @@
+import multiprocessing
+import cv2
+from tello_zune import TelloZune
+from tello_zune.frame_bus import FrameSubscriber, ResultChannel
+from tello_zune.face_detector import FaceDetector
+
+NUM_WORKERS = 2
+
+def face_worker(bus_name: str, results: ResultChannel, index: int) -> None:
+    """Processo de deteccao: le o frame mais recente direto da memoria compartilhada."""
+    sub = FrameSubscriber(bus_name)
+    detector = FaceDetector()
+    while True:
+        item = sub.wait_next(timeout=1.0)
+        if item is None:
+            continue
+        seq, frame, timestamp = item
+        if seq % NUM_WORKERS != index: # os processos se revezam nos frames
+            continue
+        faces = detector.detect(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+        if sub.is_valid(seq): # descarta o resultado se o slot foi sobrescrito durante a deteccao
+            results.put((seq, timestamp, faces))
+
+if __name__ == '__main__':
+    tello = TelloZune()
+    tello.start_tello()
+    bus_name = tello.start_frame_bus() # cada frame passa a ser publicado no anel compartilhado
+    results = ResultChannel()
+
+    # um processo de deteccao por nucleo livre, sem disputar o GIL com as threads do TelloZune
+    workers = [multiprocessing.Process(target=face_worker, args=(bus_name, results, i), daemon=True) for i in range(NUM_WORKERS)]
+    for w in workers:
+        w.start()
+
+    faces = []
+    try:
+        while True:
+            frame = tello.get_frame()
+            for seq, timestamp, found in results.get_all():
+                faces = found
+            for x, y, w, h in faces:
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 255), 2)
+            cv2.imshow('Tello', frame)
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+    finally:
+        tello.end_tello()
+        cv2.destroyAllWindows()
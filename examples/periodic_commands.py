@@ -1,25 +1,24 @@
 import cv2
 
 from tello_zune.tello_zune import TelloZune
+from tello_zune.hud import Hud
+from tello_zune.log import configure_logging
 
+configure_logging() # Mostra no terminal as respostas e os comandos enviados
 tello = TelloZune() # Cria objeto da classe TelloZune
 tello.start_tello() # Inicia a comunicação com o drone
 tello.add_periodic_event("forward 50 e cw 90", 100, "Vigilância", 10) # Adiciona evento periódico
 
+hud = Hud() # HUD de telemetria pré-renderizado
+
 try:
     while True:
         # Captura
         frame = tello.get_frame()
 
         # Tratamento
-        bat, height, temph, pres, time_elapsed = tello.get_info()
-        fps = tello.calc_fps()
-        cv2.putText(frame, f"FPS: {fps}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (10, 255, 0), 2)
-        cv2.putText(frame, f"Bat: {bat}%", (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 1, (10, 255, 0), 2)
-        cv2.putText(frame, f"Height: {height}cm", (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 1, (10, 255, 0), 2)
-        cv2.putText(frame, f"Max. Temp.: {temph}C", (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 1, (10, 255, 0), 2)
-        cv2.putText(frame, f"Press.: {pres}", (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 1, (10, 255, 0), 2)
-        cv2.putText(frame, f"TOF: {time_elapsed}s", (10, 180), cv2.FONT_HERSHEY_SIMPLEX, 1, (10, 255, 0), 2)
+        hud.update_from_tello(tello) # Só redesenha o texto quando a telemetria muda
+        hud.apply(frame)
 
         # Exibição
         cv2.imshow('QR Code', frame)
@@ -1,11 +1,13 @@
 import cv2
 import numpy as np
 from tello_zune import TelloZune
+from tello_zune.log import configure_logging
 
 import modules.tello_control as tello_control
 from ui.display_utils import write_info
 
 # Inicialização
+configure_logging() # Mostra no terminal as respostas e os comandos enviados
 tello = TelloZune(simulate=True, text_input=True) # Cria objeto da classe TelloZune
 tello.start_tello() # Inicia a comunicação com o drone
 
@@ -37,5 +39,7 @@ try:
             break
 finally:
     # Finalização
+    stats_gate = tello_control.gate.stats()
+    print(f"Detector de QR pulado em {stats_gate['skip_ratio']:.0%} dos frames ({stats_gate['saved_ms']:.0f} ms economizados)")
     tello.end_tello()
     cv2.destroyAllWindows()
\ No newline at end of file
@@ -1,6 +1,8 @@
 import time
 import threading
-from .tracking_base import follow, draw
+from tello_zune.adaptive import AdaptiveResolution
+from tello_zune.change_detector import ChangeGate
+from .tracking_base import follow, draw, stop
 from .qr_processing import process
 
 old_move = ''
@@ -15,6 +17,10 @@ stop_searching = threading.Event()
 response = ''
 log_messages = []
 last_command_time = {} # Dicionário para armazenar o tempo do último envio de cada comando
+# Reduz a resolução e pula frames do detector quando ele fica para trás, mantendo ~250 ms de latência
+adaptive = AdaptiveResolution(target_latency=0.25)
+# Com o drone parado a cena quase nao muda: reaproveita a ultima leitura do QR ate a miniatura mudar
+gate = ChangeGate(threshold=3.0)
 
 def process_ai_command(tello: object, command: str):
      """
@@ -38,11 +44,16 @@ def moves(tello: object, frame: object) -> object:
     """
     global old_move, pace, searching, stop_searching, following_qr
     
-    frame, x1, y1, x2, y2, detections, text = process(frame)
+    result = adaptive.run(frame, tello.frame_timestamp, lambda small: gate.run(small, process, tello.frame_timestamp)) # type: ignore
+    if result is None: # Frame pulado pelo controle adaptativo
+        return frame
+    (_, x1, y1, x2, y2, detections, text), scale = result
+    # Coordenadas de volta para o tamanho original do frame
+    x1, y1, x2, y2 = int(x1 / scale), int(y1 / scale), int(x2 / scale), int(y2 / scale)
     
     if following_qr and (detections != 1 or text != 'follow'):
-        # Para o drone se perder o QR code de follow
-        tello.send_rc_control(0, 0, 0, 0) # type: ignore
+        # Para o drone se perder o QR code de follow (o controlador envia rc 0 no próximo tick)
+        stop()
         following_qr = False
 
     if detections == 1:
@@ -57,7 +68,7 @@ def moves(tello: object, frame: object) -> object:
                 tello.add_command(text) # type: ignore
                 log_messages.append(text)
 
-            current_time = time.time()
+            current_time = time.monotonic()
             if text in VALID_COMMANDS[2:]:
                 last = last_command_time.get(text, 0)
                 if old_move != text or (current_time - last > 10):
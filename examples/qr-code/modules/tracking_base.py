@@ -1,20 +1,26 @@
-import numpy as np
+import time
 import cv2
+from tello_zune.controller import PIDController, VisualServo
+from tello_zune.log import get_logger
+
+logger = get_logger('qr')
 
 Width = 960
 Height = 720
 #coordenadas do centro
 CenterX = Width // 2
 CenterY = Height // 2
-#erro anterior
-prevErrorX = 0
-prevErrorY = 0
 #coeficiente proporcional (obtido testando)
 #determina o quanto a velocidade deve mudar em resposta ao erro atual
 Kp = 0.2
-#coeficiente derivativo (obtido testando)
+#coeficiente derivativo, em segundos (equivale ao antigo 0.2 por frame a ~30 FPS)
 #responsável por controlar a taxa de variação do erro
-Kd = 0.2
+Kd = 0.007
+#frequencia fixa do controle, independente do FPS do detector
+CONTROL_RATE = 20
+
+#controlador criado no primeiro follow
+servo = None
 
 width_detect = 0
 text = ''
@@ -34,55 +40,53 @@ def follow(tello: object, frame: object, x1: int, y1: int, x2: int, y2: int, det
     Returns:
         frame: Frame processado após a detecção e execução dos comandos.
     '''
-    global prevErrorX, prevErrorY, CenterX, CenterY, Kp, Kd
-    #_, x1, y1, x2, y2, detections, text = process(frame)
+    global servo
+    if servo is None:
+        servo = VisualServo(
+            tello,
+            rate_hz=CONTROL_RATE,
+            frame_size=(Width, Height),
+            yaw_pid=PIDController(kp=Kp, kd=Kd, slew_rate=400),
+            ud_pid=PIDController(kp=Kp, kd=Kd, slew_rate=400),
+            #guinada atual interpolada do historico de telemetria, para descontar a rotacao do drone
+            yaw_source=lambda: tello.get_state_at(time.monotonic()).get('yaw')
+        )
+        servo.start()
+
     speedFB = 0
     cxDetect = (x2 + x1) // 2
     cyDetect = (y2 + y1) // 2
 
     #PID - Speed Control
     area = (x2 - x1) * (y2 - y1)
-    #print(f"Area: {area}")
-    #print(f"DETECTIONS: {detections}")
-    #se o centro da detecção encontrar-se na esquerda, o erro na horizontal será negativo
-    #se o objeto estiver na direita, o erro será positivo
     if (detections > 0):
-        errorX = cxDetect - CenterX
-        #print(errorX)
-        errorY = CenterY - cyDetect
-        #print(errorY)
         cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 0, 255), 2)
         cv2.circle(frame, (cxDetect, cyDetect), 5, (0, 0, 255), -1)
         cv2.putText(frame, text, (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0,255,0), 2)
         cv2.circle(frame, (CenterX, CenterY), 5, (0, 255, 255), -1)
         cv2.line(frame, (CenterX, CenterY), (cxDetect, cyDetect), (255, 255, 0), 2)
-        if area < 20000: 
+        if area < 20000:
             speedFB = 25
         elif area > 80000: # menor
             speedFB = -25
-            #print(f"AREA: {area}")
+        #a observacao leva o instante de captura do frame; a thread de controle
+        #projeta o alvo para frente pela idade do frame e envia o rc na sua propria frequencia
+        #a guinada no instante de captura separa o movimento do alvo do movimento do drone
+        servo.update_target(cxDetect, cyDetect, tello.frame_timestamp, speedFB, tello.get_frame_state().get('yaw'))
     else:
-        errorX = 0
-        errorY = 0
-        #print("0 DETECTIONS")
-        #print(f"AREA: {area_land}")
+        servo.release()
 
-    #velocidade de rotação em torno do próprio eixo é calculada em relação ao erro horizontal
-    speedYaw = Kp*errorX + Kd*(errorX - prevErrorX)
-    speedUD = Kp*errorY + Kd*(errorY - prevErrorY)
-    #não permite que a velocidade 'vaze' o intervalo -100 / 100
-    speedYaw = int(np.clip(speedYaw,-100,100))
-    speedUD = int(np.clip(speedUD,-100,100))
-    
-    #print(f"FB: {speedFB}, UD: {speedUD}, YAW: {speedYaw}")
-    tello.send_rc_control(0, speedFB, speedUD, speedYaw)
-    print(f'FB: {speedFB}, UD: {speedUD}, Yaw: {speedYaw}')
-    
-    #o erro atual vira o erro anterior
-    prevErrorX = errorX
-    prevErrorY = errorY
+    #nivel debug: a cada frame custa so um put na fila de logs (configure_logging(logging.DEBUG) para ver)
+    logger.debug('Velocidades', extra={'fields': {'fb': speedFB, 'ud': servo.last_output[2], 'yaw': servo.last_output[3]}})
     return frame
 
+def stop() -> None:
+    '''
+    Descarta o alvo seguido; o controlador para o drone no próximo tick.
+    '''
+    if servo is not None:
+        servo.release()
+
 def draw(frame: object, x1: int, y1: int, x2: int, y2: int, text: str) -> object:
     '''
     Desenha um retângulo e o texto detectado no frame.
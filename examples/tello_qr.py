@@ -1,12 +1,23 @@
 import cv2
 from pyzbar.pyzbar import decode
 from tello_zune import TelloZune
+from tello_zune.hud import Hud
 
 #cap = cv2.VideoCapture(0)
 data = []
 
 tello = TelloZune()
 tello.start_tello()
+hud = Hud(
+    lines=[
+        ('bat', 'Battery: {}%'),
+        ('tof', 'Height: {}cm'),
+        ('temph', 'Temperature: {}C'),
+        ('baro', 'Pressure: {}Pa'),
+        ('time', 'Time: {}s'),
+    ],
+    position=(10, 8), font_scale=0.5, color=(0, 255, 0), line_height=20
+) # HUD de telemetria pré-renderizado
 
 def process(frame: cv2.Mat) -> cv2.Mat:
     """
@@ -33,11 +44,8 @@ while True:
     #ret, frame = cap.read()
     ret, frame = tello.get_frame()
     battery, height, temperature, pressure, time = tello.get_info()
-    cv2.putText(frame, f'Battery: {battery}%', (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(frame, f'Height: {height}cm', (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(frame, f'Temperature: {temperature}C', (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(frame, f'Pressure: {pressure}Pa', (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(frame, f'Time: {time}s', (10, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+    hud.update(bat=battery, tof=height, temph=temperature, baro=pressure, time=time) # Só redesenha quando muda
+    hud.apply(frame)
     if not ret:
         print('erro na captura do frame')
         break
@@ -1,17 +1,25 @@
 import cv2
 from tello_zune import TelloZune
+from tello_zune.hud import Hud
 
 tello = TelloZune()
 tello.start_tello()
+hud = Hud(
+    lines=[
+        ('bat', 'Battery: {}%'),
+        ('tof', 'Height: {}cm'),
+        ('temph', 'Temperature: {}C'),
+        ('baro', 'Pressure: {}Pa'),
+        ('time', 'Time: {}s'),
+    ],
+    position=(10, 8), font_scale=0.5, color=(0, 255, 0), line_height=20
+) # HUD de telemetria pré-renderizado
 
 while True:
     img = tello.get_frame()
     battery, height, temperature, pressure, time = tello.get_info()
-    cv2.putText(img, f'Battery: {battery}%', (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(img, f'Height: {height}cm', (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(img, f'Temperature: {temperature}C', (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(img, f'Pressure: {pressure}Pa', (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    cv2.putText(img, f'Time: {time}s', (10, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+    hud.update(bat=battery, tof=height, temph=temperature, baro=pressure, time=time) # Só redesenha quando muda
+    hud.apply(img)
 
     cv2.imshow('Tello', img)
 
@@ -20,4 +20,8 @@ setup(
         'opencv-python',
         'numpy'
     ],
+    extras_require={
+        'yaml': ['PyYAML'],
+        'av': ['av'],
+    },
 )
@@ -0,0 +1,147 @@
+import time
+import logging
+from statistics import median
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveResolution:
+    """
+    Ajusta a resolução de processamento e o salto de frames do detector para manter a latência alvo.
+    A latência de ponta a ponta é a idade do frame quando o consumidor o pega somada ao tempo
+    de processamento do estágio. Acima do alvo o controlador desce um degrau (menor escala, depois
+    mais frames pulados); bem abaixo do alvo sobe um degrau. Cada ajuste é registrado.
+    Args:
+        target_latency (float): Latência alvo em segundos.
+        scales (tuple): Escalas de processamento permitidas, da maior para a menor.
+        max_skip (int): Máximo de frames pulados entre dois processamentos.
+        window (int): Quantidade de amostras usadas na mediana.
+        hysteresis (float): Faixa relativa em torno do alvo em que nada muda.
+        cooldown (int): Amostras mínimas entre dois ajustes.
+    """
+    def __init__(
+        self,
+        target_latency: float = 0.2,
+        scales: tuple[float, ...] = (1.0, 0.75, 0.5, 0.35),
+        max_skip: int = 3,
+        window: int = 15,
+        hysteresis: float = 0.2,
+        cooldown: int = 10
+    ) -> None:
+        self.target_latency = target_latency
+        # Degraus: primeiro reduz a escala, depois passa a pular frames na menor escala
+        self.levels = [(s, 0) for s in scales] + [(scales[-1], k) for k in range(1, max_skip + 1)]
+        self.window = window
+        self.hysteresis = hysteresis
+        self.cooldown = cooldown
+
+        self.level = 0
+        self.ages: list[float] = []
+        self.proc_times: list[float] = []
+        self.samples_since_change = 0
+        self.frame_count = 0
+        self.adjustments: list[dict] = []
+
+    @property
+    def scale(self) -> float:
+        """Escala de processamento atual."""
+        return self.levels[self.level][0]
+
+    @property
+    def skip(self) -> int:
+        """Frames pulados entre dois processamentos."""
+        return self.levels[self.level][1]
+
+    def should_process(self) -> bool:
+        """
+        Indica se o frame atual deve ser processado (conta os frames para o salto).
+        Returns:
+            bool: True se o detector deve rodar neste frame.
+        """
+        self.frame_count += 1
+        return (self.frame_count - 1) % (self.skip + 1) == 0
+
+    def prepare(self, frame: np.ndarray) -> tuple[np.ndarray, float]:
+        """
+        Reduz o frame para a escala de processamento atual.
+        Args:
+            frame (np.ndarray): Frame original.
+        Returns:
+            tuple: (frame reduzido, escala). Divida as coordenadas detectadas pela escala.
+        """
+        scale = self.scale
+        if scale >= 1.0:
+            return frame, 1.0
+        return cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA), scale
+
+    def observe(self, frame_age: float, processing_time: float) -> None:
+        """
+        Registra uma amostra e ajusta o degrau se necessário.
+        Args:
+            frame_age (float): Idade do frame ao ser pego pelo consumidor, em segundos.
+            processing_time (float): Tempo de processamento do estágio, em segundos.
+        """
+        self.ages.append(max(frame_age, 0.0))
+        self.proc_times.append(processing_time)
+        if len(self.ages) > self.window:
+            del self.ages[0], self.proc_times[0]
+        self.samples_since_change += 1
+        if self.samples_since_change < self.cooldown:
+            return
+
+        latency = self.latency()
+        if latency > self.target_latency * (1 + self.hysteresis) and self.level < len(self.levels) - 1:
+            self._set_level(self.level + 1, latency)
+        elif latency < self.target_latency * (1 - self.hysteresis) and self.level > 0:
+            self._set_level(self.level - 1, latency)
+
+    def latency(self) -> float:
+        """
+        Retorna a latência estimada de ponta a ponta (mediana da janela).
+        Returns:
+            float: Latência em segundos.
+        """
+        if not self.ages:
+            return 0.0
+        return median(self.ages) + median(self.proc_times)
+
+    def run(self, frame: np.ndarray, frame_timestamp: float, fn) -> tuple[object, float] | None:
+        """
+        Executa um estágio de processamento sob o controle adaptativo.
+        Args:
+            frame (np.ndarray): Frame original.
+            frame_timestamp (float): Instante de captura do frame (time.monotonic).
+            fn (callable): Estágio que recebe o frame reduzido.
+        Returns:
+            tuple | None: (resultado de fn, escala usada), ou None se o frame foi pulado.
+        """
+        if not self.should_process():
+            return None
+        start = time.monotonic()
+        small, scale = self.prepare(frame)
+        result = fn(small)
+        self.observe(start - frame_timestamp, time.monotonic() - start)
+        return result, scale
+
+    def _set_level(self, level: int, latency: float) -> None:
+        """Troca de degrau, registra o ajuste e reinicia a janela."""
+        old = self.level
+        self.level = level
+        self.samples_since_change = 0
+        self.ages.clear()
+        self.proc_times.clear()
+        adjustment = {
+            'time': time.time(),
+            'from': old,
+            'to': level,
+            'scale': self.scale,
+            'skip': self.skip,
+            'latency': latency,
+        }
+        self.adjustments.append(adjustment)
+        logger.info(
+            "Resolução adaptativa: nível %d -> %d (escala %.2f, pular %d), latência %.0f ms, alvo %.0f ms",
+            old, level, self.scale, self.skip, latency * 1000, self.target_latency * 1000,
+            extra={'fields': adjustment}
+        )
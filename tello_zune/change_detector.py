@@ -0,0 +1,151 @@
+import time
+import cv2
+import numpy as np
+
+class ChangeDetector:
+    """
+    Detector barato de mudança de cena: cada frame vira uma miniatura de luminância (ex: 32x24),
+    calculada uma única vez por id de frame e compartilhada por todos os estágios que a consultam.
+    A diferença entre duas miniaturas é a média do erro absoluto em níveis de cinza (0~255);
+    com o drone parado no ar fica perto do ruído do sensor (~1), e um objeto novo ou um giro passa de 5.
+    Args:
+        size (tuple): Tamanho da miniatura (largura, altura).
+    """
+    def __init__(self, size: tuple[int, int] = (32, 24)) -> None:
+        self.size = size
+        self.last_id: object = None
+        self.last_thumbnail: np.ndarray | None = None
+        self.computed = 0 # Miniaturas calculadas (para conferir o reaproveitamento por id)
+        self.cost = 0.0 # Tempo total (s) gasto nas miniaturas
+
+    def thumbnail(self, frame: np.ndarray, frame_id: object = None) -> np.ndarray:
+        """
+        Retorna a miniatura de luminância do frame.
+        Args:
+            frame (np.ndarray): Frame BGR ou em escala de cinza.
+            frame_id (object, optional): Identificador do frame (ex: tello.frame_timestamp). Consultas
+                repetidas com o mesmo id reaproveitam a miniatura; sem id ela é sempre recalculada.
+        Returns:
+            np.ndarray: Miniatura float32 (altura, largura).
+        """
+        if frame_id is not None and frame_id == self.last_id and self.last_thumbnail is not None:
+            return self.last_thumbnail
+        start = time.perf_counter()
+        # Reduz antes de converter: a conversão de cor roda sobre poucos pixels
+        small = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        thumb = small.astype(np.float32)
+        self.cost += time.perf_counter() - start
+        self.computed += 1
+        self.last_id, self.last_thumbnail = frame_id, thumb
+        return thumb
+
+    @staticmethod
+    def difference(a: np.ndarray, b: np.ndarray) -> float:
+        """
+        Diferença entre duas miniaturas.
+        Returns:
+            float: Média do erro absoluto em níveis de cinza.
+        """
+        return float(np.mean(np.abs(a - b)))
+
+class ChangeGate:
+    """
+    Roda um estágio de processamento (detector de QR, Haar, ...) só quando a cena mudou desde a
+    última execução; caso contrário devolve o resultado anterior.
+    A comparação é sempre contra a miniatura do frame em que o estágio rodou pela última vez,
+    então mudanças lentas se acumulam até passar do limiar.
+    Args:
+        detector (ChangeDetector, optional): Detector compartilhado entre estágios. Padrão: um novo.
+        threshold (float): Diferença mínima (níveis de cinza) para rodar o estágio de novo.
+        max_skips (int): Máximo de frames seguidos reaproveitando o resultado (0 desativa o limite).
+    """
+    def __init__(self, detector: ChangeDetector | None = None, threshold: float = 3.0, max_skips: int = 30) -> None:
+        self.detector = detector or ChangeDetector()
+        self.threshold = threshold
+        self.max_skips = max_skips
+
+        self.reference: np.ndarray | None = None # Miniatura do frame da última execução
+        self.current: np.ndarray | None = None # Miniatura do frame consultado por último
+        self.reference_shape: tuple | None = None
+        self.result: object = None
+        self.skips = 0
+        self.last_difference = 0.0
+
+        # Estatísticas
+        self.frames = 0
+        self.processed = 0
+        self.skipped = 0
+        self.run_time = 0.0 # Tempo total (s) dentro do estágio
+        self.overhead = 0.0 # Tempo total (s) do teste de mudança
+
+    def changed(self, frame: np.ndarray, frame_id: object = None) -> bool:
+        """
+        Indica se a cena mudou o bastante desde a última execução do estágio.
+        Args:
+            frame (np.ndarray): Frame atual.
+            frame_id (object, optional): Identificador do frame (ver ChangeDetector.thumbnail).
+        Returns:
+            bool: True se o estágio deve rodar.
+        """
+        thumb = self.current = self.detector.thumbnail(frame, frame_id)
+        if self.reference is None or frame.shape != self.reference_shape:
+            self.last_difference = float('inf') # Primeiro frame ou escala de processamento trocada
+            return True
+        self.last_difference = ChangeDetector.difference(thumb, self.reference)
+        if self.max_skips and self.skips >= self.max_skips:
+            return True
+        return self.last_difference >= self.threshold
+
+    def run(self, frame: np.ndarray, fn, frame_id: object = None) -> object:
+        """
+        Executa fn(frame) se a cena mudou; senão devolve o último resultado.
+        Args:
+            frame (np.ndarray): Frame atual.
+            fn (callable): Estágio que recebe o frame.
+            frame_id (object, optional): Identificador do frame (ver ChangeDetector.thumbnail).
+        Returns:
+            object: Resultado de fn (novo ou reaproveitado).
+        """
+        self.frames += 1
+        start = time.perf_counter()
+        changed = self.changed(frame, frame_id)
+        checked = time.perf_counter()
+        self.overhead += checked - start
+        if not changed:
+            self.skips += 1
+            self.skipped += 1
+            return self.result
+        self.result = fn(frame)
+        self.run_time += time.perf_counter() - checked
+        self.reference = self.current
+        self.reference_shape = frame.shape
+        self.skips = 0
+        self.processed += 1
+        return self.result
+
+    def invalidate(self) -> None:
+        """Força a execução do estágio no próximo frame (ex: após trocar um parâmetro do detector)."""
+        self.reference = None
+
+    def stats(self) -> dict:
+        """
+        Retorna o aproveitamento do portão.
+        O tempo economizado é o custo médio do estágio vezes os frames pulados, menos o custo dos testes.
+        Returns:
+            dict: {'frames', 'processed', 'skipped', 'skip_ratio', 'avg_run_ms', 'overhead_ms', 'saved_ms', 'saved_ratio'}
+        """
+        avg_run = self.run_time / self.processed if self.processed else 0.0
+        saved = self.skipped * avg_run - self.overhead
+        would_cost = self.frames * avg_run
+        return {
+            'frames': self.frames,
+            'processed': self.processed,
+            'skipped': self.skipped,
+            'skip_ratio': self.skipped / self.frames if self.frames else 0.0,
+            'avg_run_ms': avg_run * 1000,
+            'overhead_ms': self.overhead * 1000,
+            'saved_ms': saved * 1000,
+            'saved_ratio': saved / would_cost if would_cost > 0 else 0.0,
+        }
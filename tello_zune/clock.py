@@ -0,0 +1,80 @@
+import time
+import threading
+
+class Clock:
+    """
+    Relógio usado pelo TelloZune para toda a temporização (instantes, esperas e pausas).
+    Esta implementação usa o tempo real; VirtualClock a substitui em testes e simulações.
+    """
+    def time(self) -> float:
+        """Instante de parede em segundos (epoch)."""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Instante monotônico em segundos."""
+        return time.monotonic()
+
+    def monotonic_ns(self) -> int:
+        """Instante monotônico em nanossegundos (mesma base de monotonic)."""
+        return time.monotonic_ns()
+
+    def sleep(self, seconds: float) -> None:
+        """Pausa a thread atual."""
+        time.sleep(max(seconds, 0.0))
+
+    def wait(self, event: threading.Event, timeout: float | None = None) -> bool:
+        """
+        Espera o evento até timeout segundos.
+        Returns:
+            bool: True se o evento foi sinalizado.
+        """
+        return event.wait(timeout)
+
+class VirtualClock(Clock):
+    """
+    Relógio virtual e determinístico: pausas e esperas avançam o tempo na hora, sem dormir.
+    Com ele, horas de eventos periódicos, rotas ('delay x') e timeouts rodam em segundos; o teste
+    chama os corpos das threads (ex: tello._periodic_cmd()) em vez de iniciá-las.
+    Esperas por um evento já sinalizado retornam sem avançar o tempo; esperas sem timeout
+    bloqueiam de verdade (não há instante virtual em que terminariam).
+    Args:
+        start (float): Instante monotônico inicial.
+        epoch (float): Instante de parede correspondente ao início.
+    """
+    def __init__(self, start: float = 0.0, epoch: float = 1_700_000_000.0) -> None:
+        self.now = start
+        self.epoch = epoch - start
+        self.lock = threading.Lock()
+        self.sleeps: list[float] = [] # Pausas pedidas, em ordem (para conferência nos testes)
+
+    def time(self) -> float:
+        return self.epoch + self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def monotonic_ns(self) -> int:
+        return round(self.now * 1e9)
+
+    def advance(self, seconds: float) -> float:
+        """
+        Avança o tempo virtual.
+        Returns:
+            float: Novo instante monotônico.
+        """
+        with self.lock:
+            self.now += max(seconds, 0.0)
+            return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self.lock:
+            self.sleeps.append(seconds)
+            self.now += max(seconds, 0.0)
+
+    def wait(self, event: threading.Event, timeout: float | None = None) -> bool:
+        if event.is_set():
+            return True
+        if timeout is None:
+            return event.wait()
+        self.advance(timeout)
+        return event.is_set()
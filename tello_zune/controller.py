@@ -0,0 +1,267 @@
+import time
+import logging
+import threading
+
+from .tello_zune import SafeThread
+
+logger = logging.getLogger(__name__)
+
+class PIDController:
+    """
+    Controlador PID normalizado pelo tempo.
+    Os termos integral e derivativo usam o intervalo real entre amostras (por segundo),
+    então os ganhos não mudam quando a taxa de quadros muda.
+    Args:
+        kp (float): Ganho proporcional.
+        ki (float): Ganho integral (por segundo).
+        kd (float): Ganho derivativo (segundos).
+        output_limit (float): Saída limitada a -output_limit~output_limit.
+        integral_limit (float, optional): Limite absoluto da contribuição do termo integral (anti-windup).
+        derivative_tau (float): Constante de tempo (s) do filtro passa-baixas do termo derivativo.
+        slew_rate (float, optional): Variação máxima da saída por segundo.
+        nominal_dt (float): Período nominal (s) entre amostras, usado pelo limite de taxa na primeira amostra
+            depois de reset (ainda sem intervalo medido), partindo da última saída.
+    """
+    def __init__(
+        self,
+        kp: float,
+        ki: float = 0.0,
+        kd: float = 0.0,
+        output_limit: float = 100.0,
+        integral_limit: float | None = None,
+        derivative_tau: float = 0.05,
+        slew_rate: float | None = None,
+        nominal_dt: float = 0.05
+    ) -> None:
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.output_limit = output_limit
+        self.integral_limit = output_limit if integral_limit is None else integral_limit
+        self.derivative_tau = derivative_tau
+        self.slew_rate = slew_rate
+        self.nominal_dt = nominal_dt
+        self.reset()
+
+    def reset(self) -> None:
+        """Zera o estado interno do controlador."""
+        self.integral = 0.0
+        self.derivative = 0.0
+        self.prev_error: float | None = None
+        self.prev_time: float | None = None
+        self.output = 0.0
+
+    def update(self, error: float, timestamp: float) -> float:
+        """
+        Calcula a saída para um novo erro.
+        Args:
+            error (float): Erro atual.
+            timestamp (float): Instante da amostra, em segundos (relógio monotônico).
+        Returns:
+            float: Saída do controlador.
+        """
+        dt = 0.0 if self.prev_time is None else timestamp - self.prev_time
+        if dt > 0:
+            # Derivativo por segundo, filtrado para não amplificar ruído de detecção
+            raw = (error - self.prev_error) / dt
+            alpha = dt / (self.derivative_tau + dt)
+            self.derivative += alpha * (raw - self.derivative)
+
+            # Anti-windup: não integra se a saída já está saturada no mesmo sentido do erro
+            saturated = abs(self.output) >= self.output_limit and self.output * error > 0
+            if self.ki and not saturated:
+                self.integral += error * dt
+                limit = self.integral_limit / abs(self.ki)
+                self.integral = max(-limit, min(limit, self.integral))
+        elif dt < 0:
+            return self.output # Amostra fora de ordem: mantém a saída anterior
+
+        output = self.kp * error + self.ki * self.integral + self.kd * self.derivative
+        output = max(-self.output_limit, min(self.output_limit, output))
+
+        # Limita a taxa de variação da saída; sem intervalo medido, a primeira amostra usa o período nominal
+        # e amostras repetidas no mesmo instante não mudam a saída
+        if self.slew_rate is not None:
+            max_step = self.slew_rate * (self.nominal_dt if self.prev_time is None else dt)
+            output = max(self.output - max_step, min(self.output + max_step, output))
+
+        self.prev_error = error
+        self.prev_time = timestamp
+        self.output = output
+        return output
+
+class VisualServo:
+    """
+    Servo visual de guinada e altura com tick de controle fixo.
+    O detector informa a posição do alvo com o instante de captura do frame; a thread de controle
+    roda na sua própria frequência, projeta o alvo para frente pela latência medida e envia rc.
+    Args:
+        tello (object): Objeto da classe TelloZune.
+        rate_hz (float): Frequência do tick de controle.
+        frame_size (tuple): Tamanho do frame (largura, altura).
+        yaw_pid (PIDController, optional): Controlador de guinada (erro horizontal em pixels).
+        ud_pid (PIDController, optional): Controlador de subida/descida (erro vertical em pixels).
+        video_latency (float): Atraso (s) entre a captura real e o instante registrado do frame.
+        max_prediction (float): Horizonte máximo (s) de projeção do alvo.
+        lost_timeout (float): Tempo (s) sem observações até considerar o alvo perdido.
+        clock (callable): Relógio monotônico em segundos.
+        horizontal_fov (float): Campo de visão horizontal da câmera em graus (converte guinada em pixels).
+        yaw_source (callable, optional): Retorna a guinada atual do drone em graus (ex: do histórico de
+            telemetria). Com ela e a guinada de cada frame, a rotação do próprio drone é descontada.
+    """
+    def __init__(
+        self,
+        tello: object,
+        rate_hz: float = 20.0,
+        frame_size: tuple[int, int] = (960, 720),
+        yaw_pid: PIDController | None = None,
+        ud_pid: PIDController | None = None,
+        video_latency: float = 0.0,
+        max_prediction: float = 0.5,
+        lost_timeout: float = 0.5,
+        clock=time.monotonic,
+        horizontal_fov: float = 70.0,
+        yaw_source=None
+    ) -> None:
+        self.tello = tello
+        self.period = 1.0 / rate_hz
+        self.center = (frame_size[0] // 2, frame_size[1] // 2)
+        self.yaw_pid = yaw_pid or PIDController(kp=0.2, kd=0.04, slew_rate=400, nominal_dt=self.period)
+        self.ud_pid = ud_pid or PIDController(kp=0.2, kd=0.04, slew_rate=400, nominal_dt=self.period)
+        self.video_latency = video_latency
+        self.max_prediction = max_prediction
+        self.lost_timeout = lost_timeout
+        self.clock = clock
+        self.px_per_degree = frame_size[0] / horizontal_fov
+        self.yaw_source = yaw_source
+
+        # Última observação do alvo e velocidade estimada do erro (pixels/s)
+        self.lock = threading.Lock()
+        self.observation: tuple[float, float, float] | None = None # (erro_x, erro_y, instante)
+        self.observation_yaw: float | None = None # Guinada do drone na captura da observação
+        self.velocity = (0.0, 0.0)
+        self.speed_fb = 0
+        self.active = False
+        self.last_output = (0, 0, 0, 0)
+
+        self.thread = SafeThread(target=self._loop)
+        self.next_tick = 0.0
+
+    def update_target(self, cx: float, cy: float, timestamp: float, speed_fb: int = 0, yaw: float | None = None) -> None:
+        """
+        Registra uma nova observação do alvo.
+        Args:
+            cx (float): Coordenada x do centro do alvo no frame.
+            cy (float): Coordenada y do centro do alvo no frame.
+            timestamp (float): Instante de captura do frame (relógio monotônico).
+            speed_fb (int): Velocidade frente/trás a aplicar enquanto o alvo estiver ativo.
+            yaw (float, optional): Guinada do drone na captura do frame (ex: get_frame_state()['yaw']).
+                Com ela, a velocidade estimada é só a do alvo, sem a rotação do drone.
+        """
+        error_x = cx - self.center[0]
+        error_y = self.center[1] - cy
+        with self.lock:
+            prev = self.observation
+            if prev is not None and timestamp > prev[2]:
+                dt = timestamp - prev[2]
+                # Girar no sentido horário (guinada crescente) desloca o alvo para a esquerda no frame
+                ego = 0.0
+                if yaw is not None and self.observation_yaw is not None:
+                    ego = _angle_diff(yaw, self.observation_yaw) * self.px_per_degree
+                vx = (error_x - prev[0] + ego) / dt
+                vy = (error_y - prev[1]) / dt
+                # Média móvel para suavizar o ruído da detecção
+                self.velocity = (
+                    0.5 * self.velocity[0] + 0.5 * vx,
+                    0.5 * self.velocity[1] + 0.5 * vy,
+                )
+            elif prev is None:
+                self.velocity = (0.0, 0.0)
+            if prev is None or timestamp >= prev[2]:
+                self.observation = (error_x, error_y, timestamp)
+                self.observation_yaw = yaw
+            self.speed_fb = speed_fb
+
+    def release(self) -> None:
+        """Descarta o alvo atual; o próximo tick para o drone."""
+        with self.lock:
+            self.observation = None
+
+    def predicted_error(self, now: float) -> tuple[float, float] | None:
+        """
+        Projeta o erro do alvo para o instante atual, compensando a idade do frame.
+        Args:
+            now (float): Instante atual (relógio monotônico).
+        Returns:
+            tuple | None: (erro_x, erro_y) previsto, ou None se o alvo estiver perdido.
+        """
+        with self.lock:
+            obs = self.observation
+            obs_yaw = self.observation_yaw
+            velocity = self.velocity
+        if obs is None:
+            return None
+        age = now - obs[2]
+        if age > self.lost_timeout:
+            return None
+        horizon = min(max(age, 0.0) + self.video_latency, self.max_prediction)
+        error_x = obs[0] + velocity[0] * horizon
+        if obs_yaw is not None and self.yaw_source is not None:
+            yaw = self.yaw_source()
+            if yaw is not None: # Desconta o quanto o drone já girou desde a captura do frame
+                error_x -= _angle_diff(yaw, obs_yaw) * self.px_per_degree
+        return error_x, obs[1] + velocity[1] * horizon
+
+    def tick(self) -> tuple[int, int, int, int] | None:
+        """
+        Executa um passo de controle e envia o comando rc.
+        Returns:
+            tuple | None: Comando rc enviado, ou None se nada foi enviado.
+        """
+        now = self.clock()
+        error = self.predicted_error(now)
+        if error is None:
+            if not self.active:
+                return None
+            # Alvo perdido: para o drone uma única vez e libera o rc para outros usos
+            self.active = False
+            self.yaw_pid.reset()
+            self.ud_pid.reset()
+            self.last_output = (0, 0, 0, 0)
+            self.tello.send_rc_control(0, 0, 0, 0)
+            return self.last_output
+
+        self.active = True
+        yaw = int(self.yaw_pid.update(error[0], now))
+        ud = int(self.ud_pid.update(error[1], now))
+        self.last_output = (0, self.speed_fb, ud, yaw)
+        self.tello.send_rc_control(*self.last_output)
+        return self.last_output
+
+    def start(self) -> None:
+        """Inicia a thread de controle."""
+        if not self.thread.is_alive():
+            self.next_tick = self.clock()
+            self.thread.start()
+
+    def stop(self) -> None:
+        """Para a thread de controle."""
+        self.thread.stop()
+
+    def _loop(self) -> None:
+        """Thread de controle em frequência fixa."""
+        try:
+            self.tick()
+        except Exception as e:
+            logger.error("Erro na thread de controle visual: %s", e)
+        # Agenda pelo prazo absoluto para não acumular atraso
+        self.next_tick += self.period
+        delay = self.next_tick - self.clock()
+        if delay > 0:
+            self.thread.stop_ev.wait(delay)
+        else:
+            self.next_tick = self.clock()
+
+def _angle_diff(a: float, b: float) -> float:
+    """Diferença a - b em graus pelo menor arco (-180~180)."""
+    return (a - b + 180.0) % 360.0 - 180.0
@@ -0,0 +1,192 @@
+import time
+import cv2
+import numpy as np
+
+class FaceDetector:
+    """
+    Detector de faces no esquema "detectar e rastrear".
+    A detecção Haar completa só roda a cada N frames ou quando um rastreamento é perdido; sem nenhuma
+    face rastreada, a busca por faces novas roda a cada empty_scan_every frames (modo 'idle' entre elas).
+    Entre essas execuções cada face é acompanhada por template matching numa janela de busca
+    em torno da última posição, e as redetecções periódicas ficam restritas a essas janelas.
+    Args:
+        cascade_path (str, optional): Caminho do XML do Haar cascade. Padrão: cascade frontal do OpenCV.
+        detect_every (int): Intervalo, em frames, entre redetecções nas janelas das faces conhecidas.
+        full_scan_every (int): Intervalo, em frames, entre varreduras completas (para achar faces novas).
+        empty_scan_every (int): Intervalo, em frames, entre varreduras completas sem nenhuma face rastreada
+            (limitado a full_scan_every).
+        search_margin (float): Margem da janela de busca, em fração do tamanho da face.
+        match_threshold (float): Correlação mínima do template para manter o rastreamento.
+        min_size (tuple): Tamanho mínimo da face (largura, altura).
+        max_size (tuple): Tamanho máximo da face (largura, altura).
+        min_neighbors (int): Parâmetro minNeighbors do detectMultiScale.
+        scale_factor (float): Parâmetro scaleFactor do detectMultiScale.
+        classifier (object, optional): Classificador já criado (útil para testes).
+    """
+    def __init__(
+        self,
+        cascade_path: str | None = None,
+        detect_every: int = 10,
+        full_scan_every: int = 30,
+        empty_scan_every: int = 5,
+        search_margin: float = 0.5,
+        match_threshold: float = 0.6,
+        min_size: tuple[int, int] = (130, 130),
+        max_size: tuple[int, int] = (290, 290),
+        min_neighbors: int = 9,
+        scale_factor: float = 1.05,
+        classifier: object | None = None
+    ) -> None:
+        if classifier is None:
+            if cascade_path is None:
+                cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+            classifier = cv2.CascadeClassifier(cascade_path)
+        self.classifier = classifier
+        self.detect_every = max(1, int(detect_every))
+        self.full_scan_every = max(self.detect_every, int(full_scan_every))
+        self.empty_scan_every = max(1, min(int(empty_scan_every), self.full_scan_every))
+        self.search_margin = search_margin
+        self.match_threshold = match_threshold
+        self.min_size = min_size
+        self.max_size = max_size
+        self.min_neighbors = min_neighbors
+        self.scale_factor = scale_factor
+
+        # Estado do rastreamento
+        self.tracks: list[dict] = [] # Cada track: {'box': (x, y, w, h), 'template': np.ndarray}
+        self.frame_index = 0
+        self.last_detect = 0
+        self.last_full_scan = -self.full_scan_every # O primeiro frame já é varrido
+        self.track_lost = False
+
+        # Custo por frame
+        self.last_cost = 0.0 # Custo do último frame em milissegundos
+        self.last_mode = ''
+        self.mode_count = {'full': 0, 'roi': 0, 'track': 0, 'idle': 0}
+        self.mode_time = {'full': 0.0, 'roi': 0.0, 'track': 0.0, 'idle': 0.0}
+
+    def detect(self, gray: np.ndarray) -> list[tuple[int, int, int, int]]:
+        """
+        Processa um frame em escala de cinza e retorna as faces atuais.
+        Args:
+            gray (np.ndarray): Frame em escala de cinza.
+        Returns:
+            list[tuple]: Caixas (x, y, w, h) das faces.
+        """
+        start = time.perf_counter()
+        self.frame_index += 1
+
+        since_full = self.frame_index - self.last_full_scan
+        if not self.tracks:
+            # Nada a rastrear: a varredura completa é o único custo, então também é espaçada
+            mode = 'full' if self.track_lost or since_full >= self.empty_scan_every else 'idle'
+        elif self.track_lost or since_full >= self.full_scan_every:
+            mode = 'full'
+        elif self.frame_index - self.last_detect >= self.detect_every:
+            mode = 'roi'
+        else:
+            mode = 'track'
+
+        if mode == 'track' and not self._track(gray):
+            mode = 'full' # Rastreamento perdido: varre o frame inteiro agora mesmo
+        if mode == 'roi':
+            self._rescan_windows(gray)
+        if mode == 'full':
+            self._full_scan(gray)
+
+        self.last_mode = mode
+        self.last_cost = (time.perf_counter() - start) * 1000
+        self.mode_count[mode] += 1
+        self.mode_time[mode] += self.last_cost
+        return [t['box'] for t in self.tracks]
+
+    def reset(self) -> None:
+        """Descarta todas as faces rastreadas, forçando uma varredura completa no próximo frame."""
+        self.tracks = []
+        self.track_lost = False
+        self.last_full_scan = self.frame_index - self.full_scan_every
+
+    def stats(self) -> dict:
+        """
+        Retorna estatísticas de custo por modo de processamento.
+        Returns:
+            dict: {'frames', 'last_cost_ms', 'last_mode', 'modes': {modo: {'count', 'avg_ms'}}}
+        """
+        modes = {}
+        for mode, count in self.mode_count.items():
+            avg = self.mode_time[mode] / count if count else 0.0
+            modes[mode] = {'count': count, 'avg_ms': avg}
+        return {
+            'frames': self.frame_index,
+            'last_cost_ms': self.last_cost,
+            'last_mode': self.last_mode,
+            'modes': modes,
+        }
+
+    def _haar(self, gray: np.ndarray) -> list[tuple[int, int, int, int]]:
+        """Executa o detectMultiScale com os parâmetros configurados."""
+        detections = self.classifier.detectMultiScale(
+            gray,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=self.min_size,
+            maxSize=self.max_size
+        )
+        return [tuple(int(v) for v in d) for d in detections]
+
+    def _full_scan(self, gray: np.ndarray) -> None:
+        """Detecção Haar no frame inteiro; recria todos os rastreamentos."""
+        self.tracks = [self._new_track(gray, box) for box in self._haar(gray)]
+        self.last_full_scan = self.frame_index
+        self.last_detect = self.frame_index
+        self.track_lost = False
+
+    def _rescan_windows(self, gray: np.ndarray) -> None:
+        """Detecção Haar restrita às janelas de busca das faces conhecidas."""
+        tracks = []
+        for track in self.tracks:
+            x0, y0, x1, y1 = self._window(gray, track['box'])
+            found = self._haar(gray[y0:y1, x0:x1])
+            if not found:
+                self.track_lost = True # Força varredura completa no próximo frame
+                continue
+            # Fica com a detecção mais próxima da posição anterior
+            px, py, pw, ph = track['box']
+            fx, fy, fw, fh = min(found, key=lambda b: abs(b[0] + x0 - px) + abs(b[1] + y0 - py))
+            tracks.append(self._new_track(gray, (fx + x0, fy + y0, fw, fh)))
+        self.tracks = tracks
+        self.last_detect = self.frame_index
+
+    def _track(self, gray: np.ndarray) -> bool:
+        """
+        Atualiza cada face por template matching na sua janela de busca.
+        Returns:
+            bool: False se alguma face foi perdida.
+        """
+        for track in self.tracks:
+            x0, y0, x1, y1 = self._window(gray, track['box'])
+            window = gray[y0:y1, x0:x1]
+            template = track['template']
+            if window.shape[0] < template.shape[0] or window.shape[1] < template.shape[1]:
+                return False
+            result = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if max_val < self.match_threshold:
+                return False
+            _, _, w, h = track['box']
+            track['box'] = (x0 + max_loc[0], y0 + max_loc[1], w, h)
+        return True
+
+    def _window(self, gray: np.ndarray, box: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
+        """Retorna a janela de busca (x0, y0, x1, y1) em torno de uma caixa, limitada ao frame."""
+        x, y, w, h = box
+        mx = int(w * self.search_margin)
+        my = int(h * self.search_margin)
+        height, width = gray.shape[:2]
+        return max(0, x - mx), max(0, y - my), min(width, x + w + mx), min(height, y + h + my)
+
+    @staticmethod
+    def _new_track(gray: np.ndarray, box: tuple[int, int, int, int]) -> dict:
+        """Cria um rastreamento guardando o template da face."""
+        x, y, w, h = box
+        return {'box': (x, y, w, h), 'template': gray[y:y + h, x:x + w].copy()}
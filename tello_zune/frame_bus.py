@@ -0,0 +1,267 @@
+import os
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+from queue import Empty, Full
+import numpy as np
+
+MAGIC = 0x54454C4C4F # "TELLO"
+VERSION = 1
+HEADER_FIELDS = 8 # magic, versão, slots, altura, largura, canais, último seq, resource_tracker do publicador
+ALIGN = 64
+
+def _layout(slots: int, shape: tuple[int, int, int]) -> tuple[int, int, int, int]:
+    """Calcula os offsets (seq, tempo, frames) e o tamanho total do bloco compartilhado."""
+    seq_offset = HEADER_FIELDS * 8
+    time_offset = seq_offset + slots * 8
+    frames_offset = -(-(time_offset + slots * 8) // ALIGN) * ALIGN
+    frame_bytes = shape[0] * shape[1] * shape[2]
+    return seq_offset, time_offset, frames_offset, frames_offset + slots * frame_bytes
+
+def _tracker_id() -> int:
+    """
+    Identifica o resource_tracker deste processo pelo inode do seu pipe. Processos filhos
+    (fork ou spawn) herdam o pipe do pai e portanto o mesmo tracker.
+    O pipe não é API pública: se o atributo privado mudar ou sumir numa versão do Python, retorna 0
+    e _attach cai no caminho conservador (desfaz o registro, como num processo independente).
+    Returns:
+        int: Inode do pipe do tracker, ou 0 se não der para saber.
+    """
+    try:
+        from multiprocessing import resource_tracker
+    except ImportError:
+        return 0
+    tracker = getattr(resource_tracker, '_resource_tracker', None)
+    fd = getattr(tracker, '_fd', None)
+    if not isinstance(fd, int) or fd < 0:
+        return 0
+    try:
+        return os.fstat(fd).st_ino
+    except OSError:
+        return 0
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Anexa um bloco existente sem deixar o resource_tracker deste processo removê-lo ao sair.
+    Se o tracker é o mesmo do publicador (mesmo processo ou processo filho), o registro é o mesmo
+    e fica como está: o unlink do publicador o remove. Só um tracker próprio (processo independente)
+    tem o registro desfeito, senão ele apagaria o bloco quando o leitor terminasse.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False) # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        publisher_tracker = int(header[7])
+        del header
+        own_tracker = _tracker_id()
+        if not own_tracker or own_tracker != publisher_tracker:
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, 'shared_memory') # type: ignore[attr-defined]
+            except Exception:
+                pass
+        return shm
+
+class _FrameRing:
+    """Visões numpy sobre o anel de frames em memória compartilhada."""
+    def __init__(self, shm: shared_memory.SharedMemory) -> None:
+        self.shm = shm
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        if self.header[0] != MAGIC:
+            raise ValueError(f"Bloco '{shm.name}' não é um frame bus do TelloZune.")
+        self.slots = int(self.header[2])
+        self.shape = (int(self.header[3]), int(self.header[4]), int(self.header[5]))
+        seq_offset, time_offset, frames_offset, _ = _layout(self.slots, self.shape)
+        self.slot_seq = np.ndarray((self.slots,), dtype=np.int64, buffer=shm.buf, offset=seq_offset)
+        self.slot_time = np.ndarray((self.slots,), dtype=np.float64, buffer=shm.buf, offset=time_offset)
+        self.frames = np.ndarray((self.slots,) + self.shape, dtype=np.uint8, buffer=shm.buf, offset=frames_offset)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def latest_seq(self) -> int:
+        return int(self.header[6])
+
+    def release(self) -> None:
+        """Libera as visões antes de fechar o bloco."""
+        del self.header, self.slot_seq, self.slot_time, self.frames
+
+class FramePublisher:
+    """
+    Publica frames num anel em memória compartilhada (multiprocessing.shared_memory).
+    Cada slot carrega um número de sequência; enquanto o slot é escrito seu seq vale 0,
+    então leitores detectam frames incompletos ou sobrescritos sem locks entre processos.
+    Args:
+        shape (tuple): Formato dos frames (altura, largura, canais).
+        slots (int): Quantidade de slots do anel.
+        name (str, optional): Nome do bloco compartilhado. Padrão: gerado pelo sistema.
+    """
+    def __init__(self, shape: tuple[int, int, int], slots: int = 4, name: str | None = None) -> None:
+        if slots < 2:
+            raise ValueError("O anel precisa de pelo menos 2 slots.")
+        *_, size = _layout(slots, shape)
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        header[:] = (MAGIC, VERSION, slots, shape[0], shape[1], shape[2], 0, _tracker_id())
+        del header
+        self.ring = _FrameRing(self.shm)
+        self.ring.slot_seq[:] = 0
+        self.seq = 0
+
+    @property
+    def name(self) -> str:
+        """Nome do bloco compartilhado, usado pelos processos leitores."""
+        return self.ring.name
+
+    def publish(self, frame: np.ndarray, timestamp: float | None = None) -> int:
+        """
+        Copia um frame para o próximo slot do anel.
+        Args:
+            frame (np.ndarray): Frame com o formato configurado.
+            timestamp (float, optional): Instante de captura. Padrão: time.monotonic().
+        Returns:
+            int: Número de sequência do frame publicado.
+        """
+        if frame.shape != self.ring.shape:
+            raise ValueError(f"Frame com formato {frame.shape}, esperado {self.ring.shape}.")
+        seq = self.seq + 1
+        slot = seq % self.ring.slots
+        self.ring.slot_seq[slot] = 0 # Marca o slot como em escrita
+        self.ring.frames[slot] = frame
+        self.ring.slot_time[slot] = time.monotonic() if timestamp is None else timestamp
+        self.ring.slot_seq[slot] = seq
+        self.ring.header[6] = seq
+        self.seq = seq
+        return seq
+
+    def close(self) -> None:
+        """Fecha e remove o bloco compartilhado."""
+        self.ring.release()
+        try:
+            self.shm.close()
+        except BufferError:
+            pass # Ainda há visões do bloco em uso; ele é liberado quando elas forem coletadas
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+class FrameSubscriber:
+    """
+    Lê frames publicados por um FramePublisher, em outro processo, sem cópia.
+    Args:
+        name (str): Nome do bloco compartilhado (FramePublisher.name).
+    """
+    def __init__(self, name: str) -> None:
+        self.ring = _FrameRing(_attach(name))
+        self.last_seq = 0
+
+    def read_latest(self, copy: bool = False) -> tuple[int, np.ndarray, float] | None:
+        """
+        Retorna o frame mais recente.
+        O frame é uma visão do slot compartilhado: confira is_valid(seq) depois de processá-lo,
+        ou use copy=True, caso o publicador possa ter dado a volta no anel.
+        Args:
+            copy (bool): Se True, retorna uma cópia do frame.
+        Returns:
+            tuple | None: (seq, frame, instante de captura), ou None se ainda não há frames.
+        """
+        for _ in range(3):
+            seq = self.ring.latest_seq
+            if seq == 0:
+                return None
+            slot = seq % self.ring.slots
+            frame = self.ring.frames[slot]
+            timestamp = float(self.ring.slot_time[slot])
+            if copy:
+                frame = frame.copy()
+            if self.ring.slot_seq[slot] == seq:
+                self.last_seq = seq
+                return seq, frame, timestamp
+        return None
+
+    def wait_next(self, timeout: float = 1.0, poll_interval: float = 0.001) -> tuple[int, np.ndarray, float] | None:
+        """
+        Espera um frame mais novo que o último lido.
+        Args:
+            timeout (float): Tempo máximo de espera em segundos.
+            poll_interval (float): Intervalo entre verificações em segundos.
+        Returns:
+            tuple | None: Igual a read_latest, ou None se o tempo acabar.
+        """
+        deadline = time.monotonic() + timeout
+        while self.ring.latest_seq <= self.last_seq:
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+        return self.read_latest()
+
+    def is_valid(self, seq: int) -> bool:
+        """
+        Verifica se o slot do frame seq ainda não foi sobrescrito.
+        Args:
+            seq (int): Número de sequência retornado por read_latest.
+        Returns:
+            bool: True se o frame continua íntegro.
+        """
+        return self.ring.slot_seq[seq % self.ring.slots] == seq
+
+    def close(self) -> None:
+        """Desanexa o bloco compartilhado (não o remove)."""
+        self.ring.release()
+        try:
+            self.ring.shm.close()
+        except BufferError:
+            pass # Ainda há frames lidos em uso; o bloco é liberado quando eles forem coletados
+
+class ResultChannel:
+    """
+    Canal leve de resultados dos processos de visão para o processo de controle.
+    Nunca bloqueia quem publica: se a fila estiver cheia o resultado é descartado.
+    Args:
+        maxsize (int): Quantidade máxima de resultados pendentes.
+        ctx (object, optional): Contexto do multiprocessing. Padrão: contexto padrão.
+    """
+    def __init__(self, maxsize: int = 64, ctx: object | None = None) -> None:
+        ctx = ctx or multiprocessing.get_context()
+        self.queue = ctx.Queue(maxsize) # type: ignore[attr-defined]
+        self.dropped = ctx.Value('i', 0) # type: ignore[attr-defined]
+
+    def put(self, result: object) -> bool:
+        """
+        Envia um resultado (ex: (seq, caixas)).
+        Returns:
+            bool: False se o resultado foi descartado.
+        """
+        try:
+            self.queue.put_nowait(result)
+            return True
+        except Full:
+            with self.dropped.get_lock():
+                self.dropped.value += 1
+            return False
+
+    def get(self, timeout: float | None = None) -> object | None:
+        """
+        Retorna o próximo resultado, ou None se não houver até o timeout.
+        Args:
+            timeout (float, optional): Tempo máximo de espera. None não espera.
+        """
+        try:
+            if timeout is None:
+                return self.queue.get_nowait()
+            return self.queue.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def get_all(self) -> list:
+        """Retorna todos os resultados pendentes, sem bloquear."""
+        results = []
+        while True:
+            result = self.get()
+            if result is None:
+                return results
+            results.append(result)
@@ -0,0 +1,120 @@
+import cv2
+import numpy as np
+
+class Hud:
+    """
+    Camada de HUD (texto de telemetria) pré-renderizada.
+    O texto é desenhado numa imagem pequena com máscara, refeita apenas quando algum valor
+    inscrito muda; em cada frame a camada é copiada com uma única operação vetorizada
+    restrita à região do overlay.
+    Args:
+        lines (list, optional): Linhas como (chave, modelo), ex: ('bat', 'Bat: {}%'). Padrão: DEFAULT_LINES.
+        position (tuple): Canto superior esquerdo do overlay no frame (x, y).
+        font_scale (float): Escala da fonte.
+        color (tuple): Cor BGR do texto.
+        thickness (int): Espessura do traço.
+        line_height (int): Distância em pixels entre as linhas.
+    """
+    DEFAULT_LINES = [
+        ('fps', 'FPS: {}'),
+        ('bat', 'Bat: {}%'),
+        ('tof', 'Height: {}cm'),
+        ('temph', 'Max. Temp.: {}C'),
+        ('baro', 'Press.: {}'),
+        ('time', 'TOF: {}s'),
+    ]
+
+    def __init__(
+        self,
+        lines: list[tuple[str, str]] | None = None,
+        position: tuple[int, int] = (10, 8),
+        font_scale: float = 1.0,
+        color: tuple[int, int, int] = (10, 255, 0),
+        thickness: int = 2,
+        line_height: int = 30
+    ) -> None:
+        self.lines = list(lines) if lines is not None else list(self.DEFAULT_LINES)
+        self.keys = [key for key, _ in self.lines]
+        self.position = position
+        self.font_scale = font_scale
+        self.color = color
+        self.thickness = thickness
+        self.line_height = line_height
+        self.font = cv2.FONT_HERSHEY_SIMPLEX
+
+        self.values: dict = {key: None for key in self.keys}
+        self.overlay: np.ndarray | None = None
+        self.mask: np.ndarray | None = None
+        self.render_count = 0
+
+    def update(self, values: dict | None = None, **kwargs) -> bool:
+        """
+        Atualiza os valores inscritos. Só refaz o overlay se algum valor mudou.
+        Args:
+            values (dict, optional): Valores por chave. Chaves não inscritas são ignoradas.
+        Returns:
+            bool: True se o overlay foi refeito.
+        """
+        if values:
+            kwargs.update(values)
+        changed = False
+        for key, val in kwargs.items():
+            if key in self.values and self.values[key] != val:
+                self.values[key] = val
+                changed = True
+        if changed or self.overlay is None:
+            self._render()
+            return True
+        return False
+
+    def update_from_tello(self, tello: object) -> bool:
+        """
+        Atualiza os valores a partir de get_info() e calc_fps() do TelloZune.
+        Args:
+            tello (object): Objeto da classe TelloZune.
+        Returns:
+            bool: True se o overlay foi refeito.
+        """
+        bat, tof, temph, baro, flight_time = tello.get_info() # type: ignore
+        return self.update(fps=tello.calc_fps(), bat=bat, tof=tof, temph=temph, baro=baro, time=flight_time) # type: ignore
+
+    def apply(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Compõe o overlay sobre o frame (no próprio frame).
+        Args:
+            frame (np.ndarray): Frame BGR.
+        Returns:
+            np.ndarray: O mesmo frame, com o HUD.
+        """
+        if self.overlay is None:
+            self._render()
+        x, y = self.position
+        h = min(self.overlay.shape[0], frame.shape[0] - y)
+        w = min(self.overlay.shape[1], frame.shape[1] - x)
+        if h <= 0 or w <= 0:
+            return frame
+        np.copyto(frame[y:y + h, x:x + w], self.overlay[:h, :w], where=self.mask[:h, :w])
+        return frame
+
+    def _render(self) -> None:
+        """Desenha o texto atual no overlay e recalcula a máscara."""
+        texts = [template.format(self.values[key]) for key, template in self.lines]
+        sizes = [cv2.getTextSize(t, self.font, self.font_scale, self.thickness) for t in texts]
+        ascent = max((size[1] for size, _ in sizes), default=0)
+        descent = max((baseline for _, baseline in sizes), default=0)
+        width = max((size[0] for size, _ in sizes), default=0) + self.thickness
+        height = ascent + self.line_height * max(len(texts) - 1, 0) + descent + self.thickness
+
+        shape = (max(height, 1), max(width, 1))
+        coverage = np.zeros(shape, dtype=np.uint8)
+        for i, text in enumerate(texts):
+            org = (0, ascent + i * self.line_height)
+            cv2.putText(coverage, text, org, self.font, self.font_scale, 255, self.thickness, cv2.LINE_8)
+        # Máscara binária (algumas versões do OpenCV suavizam o texto mesmo com LINE_8),
+        # assim a composição é uma cópia simples, sem mistura em ponto flutuante
+        mask = coverage >= 128
+        overlay = np.zeros(shape + (3,), dtype=np.uint8)
+        overlay[mask] = self.color
+        self.overlay = overlay
+        self.mask = mask[:, :, None]
+        self.render_count += 1
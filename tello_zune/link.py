@@ -0,0 +1,161 @@
+import time
+import threading
+
+from .timeouts import RttEstimator
+
+KEEPALIVE_CMD = 'command'
+
+# Faixas do sinal de qualidade (0~1)
+QUALITY_LEVELS = ((0.8, 'good'), (0.5, 'degraded'), (0.0, 'poor'))
+
+class LinkMonitor:
+    """
+    Saúde do link com o drone: último envio e recebimento nos sockets de comando e de estado,
+    RTT suavizado, perda estimada e um sinal de qualidade.
+    O keep alive só é necessário quando nada foi enviado (comandos, rc ou o próprio keep alive)
+    por keepalive_after segundos: o Tello pousa sozinho após 15 s sem comandos.
+    Args:
+        rtt (RttEstimator, optional): Estimador de RTT (compartilhado com o TimeoutModel).
+        keepalive_after (float): Segundos sem envios até o keep alive.
+        state_interval (float): Intervalo nominal entre pacotes de estado (o Tello envia a ~10 Hz).
+        alpha (float): Ganho das médias de perda.
+        good_rtt (float): RTT (s) considerado bom; a qualidade cai até bad_rtt.
+        bad_rtt (float): RTT (s) considerado ruim.
+        stale_after (float): Segundos sem pacotes de estado a partir dos quais o link é dado como perdido.
+        clock (callable): Relógio monotônico.
+    """
+    def __init__(
+        self,
+        rtt: RttEstimator | None = None,
+        keepalive_after: float = 10.0,
+        state_interval: float = 0.1,
+        alpha: float = 0.05,
+        good_rtt: float = 0.05,
+        bad_rtt: float = 0.5,
+        stale_after: float = 2.0,
+        clock=time.monotonic
+    ) -> None:
+        self.rtt = rtt or RttEstimator()
+        self.keepalive_after = keepalive_after
+        self.state_interval = state_interval
+        self.alpha = alpha
+        self.good_rtt = good_rtt
+        self.bad_rtt = bad_rtt
+        self.stale_after = stale_after
+        self.clock = clock
+
+        now = clock()
+        self.last_cmd_send = now
+        self.last_cmd_recv: float | None = None
+        self.last_state_recv: float | None = None
+        self.cmd_loss = 0.0 # Média móvel de comandos sem resposta
+        self.state_loss = 0.0 # Média móvel de pacotes de estado perdidos
+        self.sent = 0
+        self.replies = 0
+        self.timeouts = 0
+        self.state_packets = 0
+        self.state_missing = 0
+        self.keepalives = 0
+        self.probe_lock = threading.Lock() # Um keep alive por vez
+        self.status = 'unknown'
+
+    def record_send(self, now: float | None = None) -> None:
+        """Registra um envio no socket de comando (qualquer comando, inclusive rc)."""
+        self.last_cmd_send = self.clock() if now is None else now
+        self.sent += 1
+
+    def record_receive(self, now: float | None = None) -> None:
+        """Registra um pacote recebido no socket de comando."""
+        self.last_cmd_recv = self.clock() if now is None else now
+
+    def record_reply(self) -> None:
+        """Registra um comando respondido dentro do timeout."""
+        self.replies += 1
+        self.cmd_loss *= 1 - self.alpha
+
+    def record_timeout(self) -> None:
+        """Registra um comando sem resposta."""
+        self.timeouts += 1
+        self.cmd_loss = self.cmd_loss * (1 - self.alpha) + self.alpha
+
+    def record_state(self, now: float | None = None) -> None:
+        """Registra um pacote de estado; lacunas maiores que o intervalo nominal contam como perdas."""
+        now = self.clock() if now is None else now
+        missing = 0
+        if self.last_state_recv is not None:
+            missing = max(0, round((now - self.last_state_recv) / self.state_interval) - 1)
+        self.last_state_recv = now
+        self.state_packets += 1
+        self.state_missing += missing
+        keep = 1 - self.alpha
+        # Cada pacote perdido conta 1 e o recebido conta 0 (limitado para não iterar em pausas longas)
+        for _ in range(min(missing, 100)):
+            self.state_loss = self.state_loss * keep + self.alpha
+        self.state_loss *= keep
+
+    def keepalive_due(self, now: float | None = None) -> bool:
+        """
+        Indica se o link está ocioso há tempo suficiente para um keep alive.
+        Returns:
+            bool: True se nada foi enviado nos últimos keepalive_after segundos e nenhum keep alive está em andamento.
+        """
+        now = self.clock() if now is None else now
+        return now - self.last_cmd_send >= self.keepalive_after and not self.probe_lock.locked()
+
+    def quality(self, now: float | None = None) -> float:
+        """
+        Sinal de qualidade do link, de 0 (perdido) a 1 (perfeito).
+        Combina a perda de comandos e de pacotes de estado, o RTT suavizado e há quanto tempo chegou o último estado.
+        Returns:
+            float: Qualidade.
+        """
+        now = self.clock() if now is None else now
+        if self.last_state_recv is not None and now - self.last_state_recv >= self.stale_after:
+            return 0.0
+        loss = max(self.cmd_loss, self.state_loss)
+        rtt_score = 1.0
+        if self.rtt.srtt is not None and self.rtt.srtt > self.good_rtt:
+            rtt_score = max(0.0, 1 - (self.rtt.srtt - self.good_rtt) / (self.bad_rtt - self.good_rtt))
+        return max(0.0, (1 - loss) ** 2 * (0.5 + 0.5 * rtt_score))
+
+    def update_status(self, now: float | None = None) -> tuple[str, str] | None:
+        """
+        Atualiza a classificação do link ('good', 'degraded', 'poor', 'lost').
+        Returns:
+            tuple | None: (anterior, nova) se mudou.
+        """
+        now = self.clock() if now is None else now
+        if self.last_state_recv is None and self.last_cmd_recv is None:
+            return None # Ainda não conectou
+        q = self.quality(now)
+        status = 'lost' if q == 0.0 else next(name for limit, name in QUALITY_LEVELS if q >= limit)
+        if status == self.status:
+            return None
+        previous, self.status = self.status, status
+        return previous, status
+
+    def snapshot(self, now: float | None = None) -> dict:
+        """
+        Retorna o estado do link.
+        Returns:
+            dict: qualidade, status, RTT, perdas, tempos desde o último envio/recebimento e contadores.
+        """
+        now = self.clock() if now is None else now
+        since = lambda t: None if t is None else now - t
+        return {
+            'quality': self.quality(now),
+            'status': self.status,
+            'srtt': self.rtt.srtt,
+            'rttvar': self.rtt.rttvar,
+            'cmd_loss': self.cmd_loss,
+            'state_loss': self.state_loss,
+            'since_cmd_send': since(self.last_cmd_send),
+            'since_cmd_recv': since(self.last_cmd_recv),
+            'since_state_recv': since(self.last_state_recv),
+            'sent': self.sent,
+            'replies': self.replies,
+            'timeouts': self.timeouts,
+            'state_packets': self.state_packets,
+            'state_missing': self.state_missing,
+            'keepalives': self.keepalives,
+        }
@@ -0,0 +1,231 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+LOGGER_NAME = 'tello_zune'
+DEFAULT_FORMAT = '%(message)s'
+
+_lock = threading.Lock()
+_listener: QueueListener | None = None
+_handler: 'AsyncHandler | None' = None
+_atexit_registered = False
+
+def get_logger(name: str = '') -> logging.Logger:
+    """
+    Retorna o logger da biblioteca (ou um filho, ex: get_logger('video') -> 'tello_zune.video').
+    Campos estruturados vão em extra={'fields': {...}}.
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler que sempre escreve no sys.stdout atual (acompanha redirecionamentos)."""
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+class AsyncHandler(QueueHandler):
+    """
+    Handler que só coloca o registro numa fila: a formatação e a escrita no terminal acontecem
+    na thread do QueueListener. Com a fila cheia o registro é descartado (e contado), nunca bloqueia.
+    Args:
+        maxsize (int): Tamanho máximo da fila.
+    """
+    def __init__(self, maxsize: int = 10000) -> None:
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record # A fila é da mesma memória: não formata na thread que chamou
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limita a frequência de cada mensagem e agrupa erros repetidos.
+    A chave de limite é o texto-modelo da mensagem (antes dos argumentos), então "Erro %s" com valores
+    diferentes conta como a mesma mensagem. Avisos e erros com o texto final idêntico dentro de
+    dedup_window são suprimidos; a próxima ocorrência aceita informa quantas foram omitidas.
+    Args:
+        rate (float): Mensagens por segundo permitidas por chave, após a rajada.
+        burst (int): Rajada inicial permitida por chave.
+        dedup_window (float): Janela em segundos para agrupar avisos/erros idênticos.
+    """
+    def __init__(self, rate: float = 5.0, burst: int = 10, dedup_window: float = 5.0) -> None:
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.dedup_window = dedup_window
+        self.lock = threading.Lock()
+        self.buckets: dict[tuple, list[float]] = {} # chave -> [tokens, último instante]
+        self.seen: dict[tuple, float] = {} # (logger, mensagem) -> instante em que foi aceita
+        self.suppressed: dict[tuple, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        rate_key = (record.name, record.levelno, str(record.msg))
+        with self.lock:
+            if record.levelno >= logging.WARNING:
+                text_key = (record.name, record.getMessage())
+                last = self.seen.get(text_key)
+                if last is not None and now - last < self.dedup_window:
+                    self.suppressed[text_key] = self.suppressed.get(text_key, 0) + 1
+                    return False
+                self.seen[text_key] = now
+                if len(self.seen) > 1000: # Esquece erros antigos
+                    self.seen = {k: t for k, t in self.seen.items() if now - t < self.dedup_window}
+                repeated = self.suppressed.pop(text_key, 0)
+            else:
+                repeated = 0
+
+            bucket = self.buckets.get(rate_key)
+            if bucket is None:
+                bucket = self.buckets[rate_key] = [float(self.burst), now]
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1.0:
+                self.suppressed[rate_key] = self.suppressed.get(rate_key, 0) + 1
+                return False
+            bucket[0] -= 1.0
+            repeated += self.suppressed.pop(rate_key, 0)
+        record.suppressed = repeated # type: ignore[attr-defined]
+        return True
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formata a mensagem seguida dos campos estruturados (chave=valor), ou uma linha JSON por registro.
+    Args:
+        fmt (str): Formato do logging para o texto.
+        as_json (bool): Se True, emite JSON com time, level, logger, message e os campos.
+    """
+    def __init__(self, fmt: str = DEFAULT_FORMAT, as_json: bool = False) -> None:
+        super().__init__(fmt)
+        self.as_json = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, 'fields', None) or {}
+        suppressed = getattr(record, 'suppressed', 0)
+        if self.as_json:
+            data = {
+                'time': record.created,
+                'level': record.levelname,
+                'logger': record.name,
+                'thread': record.threadName,
+                'message': record.getMessage(),
+                **fields,
+            }
+            if suppressed:
+                data['suppressed'] = suppressed
+            if record.exc_info:
+                data['exc'] = self.formatException(record.exc_info)
+            return json.dumps(data, default=str, ensure_ascii=False)
+        text = super().format(record)
+        if fields:
+            text += ' ' + ' '.join(f"{k}={v}" for k, v in fields.items())
+        if suppressed:
+            text += f" (+{suppressed} mensagens semelhantes suprimidas)"
+        return text
+
+def configure_logging(
+    level: int | str = logging.INFO,
+    stream=None,
+    handler: logging.Handler | None = None,
+    as_json: bool = False,
+    rate: float = 5.0,
+    burst: int = 10,
+    dedup_window: float = 5.0,
+    propagate: bool = False
+) -> logging.Logger:
+    """
+    Configura o logging assíncrono da biblioteca. Pode ser chamada de novo para trocar as opções.
+    Sem esta chamada a biblioteca não instala nenhum handler: os registros seguem para o logger raiz da aplicação.
+    Nas threads da biblioteca um log custa um put numa fila; a escrita acontece numa thread própria.
+    Args:
+        level (int | str): Nível mínimo, ex: logging.DEBUG ou 'WARNING'.
+        stream (file, optional): Saída do texto. Padrão: sys.stdout.
+        handler (logging.Handler, optional): Destino final no lugar do stream (ex: FileHandler).
+        as_json (bool): Uma linha JSON por registro.
+        rate (float): Mensagens por segundo permitidas por mensagem-modelo (0 desativa o limite).
+        burst (int): Rajada inicial permitida por mensagem-modelo.
+        dedup_window (float): Janela de agrupamento de avisos e erros idênticos.
+        propagate (bool): Se True, também repassa os registros aos handlers do logger raiz. O limite de
+            frequência vale só para o handler assíncrono: a cópia repassada não é limitada, e um logger raiz
+            com saída no terminal duplicaria as mensagens. Padrão: False.
+    Returns:
+        logging.Logger: Logger 'tello_zune'.
+    """
+    global _listener, _handler, _atexit_registered
+    logger = get_logger()
+    with _lock:
+        if not _atexit_registered:
+            atexit.register(shutdown_logging) # Grava o que ainda estiver na fila ao sair
+            _atexit_registered = True
+        if _listener is not None:
+            _listener.stop()
+        if _handler is not None:
+            logger.removeHandler(_handler)
+
+        target = handler or (logging.StreamHandler(stream) if stream is not None else _StdoutHandler())
+        if target.formatter is None:
+            target.setFormatter(StructuredFormatter(as_json=as_json))
+        _handler = AsyncHandler()
+        if rate > 0:
+            _handler.addFilter(RateLimitFilter(rate, burst, dedup_window))
+        _listener = QueueListener(_handler.queue, target, respect_handler_level=True)
+        _listener.start()
+
+        logger.addHandler(_handler)
+        logger.setLevel(level)
+        logger.propagate = propagate
+    return logger
+
+def ensure_logging() -> None:
+    """
+    Instala um NullHandler no logger da biblioteca (uma única vez), como recomenda o logging do Python
+    para bibliotecas: nenhuma saída é imposta e os registros propagam para a configuração da aplicação
+    (logging.basicConfig, por exemplo), mesmo que ela seja feita depois do import.
+    """
+    logger = get_logger()
+    if not any(isinstance(h, logging.NullHandler) for h in logger.handlers):
+        logger.addHandler(logging.NullHandler())
+
+def flush_logging(timeout: float = 1.0) -> None:
+    """
+    Espera a fila de logs esvaziar (útil antes de encerrar o programa).
+    Args:
+        timeout (float): Tempo máximo de espera em segundos.
+    """
+    if _handler is None:
+        return
+    deadline = time.monotonic() + timeout
+    while not _handler.queue.empty() and time.monotonic() < deadline: # type: ignore[attr-defined]
+        time.sleep(0.005)
+
+def shutdown_logging() -> None:
+    """Para a thread de escrita, gravando o que ainda estiver na fila, e desfaz a configuração."""
+    global _listener, _handler
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        if _handler is not None:
+            logger = get_logger()
+            logger.removeHandler(_handler)
+            logger.setLevel(logging.NOTSET)
+            logger.propagate = True
+            _handler = None
@@ -0,0 +1,213 @@
+import threading
+from bisect import bisect_left
+
+# Buckets padrão (segundos), cobrindo de RTTs de comando a movimentos longos
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _label_key(labels: dict | None) -> tuple:
+    return tuple(sorted((labels or {}).items()))
+
+def _escape(value: object) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(key: tuple, extra: tuple = ()) -> str:
+    items = key + extra
+    if not items:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in items) + '}'
+
+class Counter:
+    """Contador monotônico."""
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+class Gauge:
+    """
+    Valor instantâneo. Com fn, o valor é lido apenas na hora da coleta (custo zero no caminho quente).
+    """
+    def __init__(self, fn=None) -> None:
+        self.fn = fn
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        if self.fn is not None:
+            try:
+                return float(self.fn())
+            except Exception:
+                return float('nan')
+        return self._value
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._value -= amount
+
+class Histogram:
+    """
+    Histograma de buckets fixos, sem lock no caminho quente: observe faz uma busca binária
+    e dois incrementos. Cada série deve ser atualizada por uma única thread (use labels por thread).
+    """
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1) # Último bucket: +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def snapshot(self) -> dict:
+        """Retorna {'count', 'sum', 'buckets': {limite: acumulado}}."""
+        counts = list(self.counts)
+        cumulative, acc = {}, 0
+        for bound, c in zip(self.buckets + (float('inf'),), counts):
+            acc += c
+            cumulative[bound] = acc
+        return {'count': acc, 'sum': self.sum, 'buckets': cumulative}
+
+class MetricsRegistry:
+    """
+    Registro de métricas (contadores, gauges e histogramas) com exportação no formato texto do Prometheus.
+    Os métodos counter/gauge/histogram devolvem a série existente se ela já foi criada.
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock() # Usado só na criação das séries e na coleta
+        self.families: dict[str, dict] = {} # nome -> {'type', 'help', 'series': {labels: métrica}}
+
+    def _get(self, kind: str, name: str, help: str, labels: dict | None, factory):
+        key = _label_key(labels)
+        family = self.families.get(name)
+        if family is not None:
+            metric = family['series'].get(key)
+            if metric is not None:
+                return metric
+        with self.lock:
+            family = self.families.setdefault(name, {'type': kind, 'help': help, 'series': {}})
+            if family['type'] != kind:
+                raise ValueError(f"Métrica '{name}' já registrada como {family['type']}.")
+            return family['series'].setdefault(key, factory())
+
+    def counter(self, name: str, help: str = '', labels: dict | None = None) -> Counter:
+        """
+        Retorna (criando se preciso) um contador.
+        Args:
+            name (str): Nome no padrão do Prometheus, ex: 'tello_frames_total'.
+            help (str): Descrição.
+            labels (dict, optional): Rótulos da série.
+        """
+        return self._get('counter', name, help, labels, Counter)
+
+    def gauge(self, name: str, help: str = '', labels: dict | None = None, fn=None) -> Gauge:
+        """
+        Retorna (criando se preciso) um gauge.
+        Args:
+            fn (callable, optional): Função lida na coleta, em vez de valores atribuídos.
+        """
+        return self._get('gauge', name, help, labels, lambda: Gauge(fn))
+
+    def histogram(self, name: str, help: str = '', labels: dict | None = None,
+                  buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """
+        Retorna (criando se preciso) um histograma.
+        Args:
+            buckets (tuple): Limites superiores dos buckets.
+        """
+        return self._get('histogram', name, help, labels, lambda: Histogram(buckets))
+
+    def snapshot(self) -> dict:
+        """
+        Retorna os valores atuais.
+        Returns:
+            dict: {nome: {labels (tuple): valor ou {'count', 'sum', 'buckets'}}}
+        """
+        with self.lock:
+            families = {name: (f['type'], dict(f['series'])) for name, f in self.families.items()}
+        result = {}
+        for name, (kind, series) in families.items():
+            if kind == 'histogram':
+                result[name] = {key: m.snapshot() for key, m in series.items()}
+            else:
+                result[name] = {key: m.value for key, m in series.items()}
+        return result
+
+    def render_prometheus(self) -> str:
+        """
+        Retorna as métricas no formato texto do Prometheus (versão 0.0.4).
+        """
+        with self.lock:
+            families = {name: dict(f, series=dict(f['series'])) for name, f in self.families.items()}
+        lines = []
+        for name, family in sorted(families.items()):
+            if family['help']:
+                lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            for key, metric in family['series'].items():
+                if family['type'] == 'histogram':
+                    snap = metric.snapshot()
+                    for bound, acc in snap['buckets'].items():
+                        le = '+Inf' if bound == float('inf') else repr(float(bound))
+                        lines.append(f"{name}_bucket{_format_labels(key, (('le', le),))} {acc}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {snap['sum']}")
+                    lines.append(f"{name}_count{_format_labels(key)} {snap['count']}")
+                else:
+                    lines.append(f"{name}{_format_labels(key)} {metric.value}")
+        return '\n'.join(lines) + '\n'
+
+class MetricsServer:
+    """
+    Endpoint HTTP /metrics no formato do Prometheus.
+    Args:
+        registry (MetricsRegistry): Registro exportado.
+        host (str): Endereço de escuta. Padrão: apenas localhost.
+        port (int): Porta TCP. 0 escolhe uma porta livre.
+    """
+    def __init__(self, registry: MetricsRegistry, host: str = '127.0.0.1', port: int = 9100) -> None:
+        # Importado aqui: http.server traz http.client, email e ssl (~35 ms), pagos só por quem serve métricas
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        self.registry = registry
+        registry_ref = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry_ref.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Endereço (host, porta) em que o servidor está escutando."""
+        return self.httpd.server_address[:2] # type: ignore[return-value]
+
+    def start(self) -> None:
+        """Inicia o servidor numa thread própria."""
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Para o servidor."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,361 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+
+from . import route as _route
+from .route import RoutePlan, PlanStep, RouteError, compile_route, _axis_commands, DEFAULT_SPEED, SPEED_MIN, SPEED_MAX
+
+logger = logging.getLogger(__name__)
+
+MISSION_FORMAT = 1 # Incrementar quando o formato do cache mudar (mudanças no compilador já mudam a chave, ver _compiler_digest)
+DEFAULT_INTERVAL = 10 # Mesmo padrão de add_periodic_event
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'tello_zune', 'missions')
+
+MISSION_KEYS = {'name', 'speed', 'optimize', 'routes', 'triggers', 'branches'}
+ROUTE_KEYS = {'steps', 'waypoints', 'interval', 'use_curve'}
+TRIGGER_KEYS = {'route', 'period', 'info'}
+WAYPOINT_KEYS = {'at', 'dwell'}
+
+class MissionError(ValueError):
+    """
+    Erro de validação de uma missão.
+    Attributes:
+        errors (list): Todos os problemas encontrados, no formato 'caminho: mensagem'.
+    """
+    def __init__(self, errors: list[str], source: str = '') -> None:
+        self.errors = errors
+        where = f" em '{source}'" if source else ''
+        super().__init__(f"Missão inválida{where}:\n  " + '\n  '.join(errors))
+
+@dataclass
+class MissionRoute:
+    """
+    Rota compilada de uma missão.
+    Attributes:
+        plan (RoutePlan): Plano de comandos validado.
+        interval (int): Intervalo em segundos entre os comandos.
+    """
+    plan: RoutePlan
+    interval: int = DEFAULT_INTERVAL
+
+@dataclass
+class Mission:
+    """
+    Missão validada e compilada.
+    Attributes:
+        name (str): Nome da missão.
+        routes (dict): Rotas compiladas por nome.
+        triggers (list): Gatilhos periódicos [{'route', 'period', 'info'}].
+        branches (dict): Texto de QR code -> nome da rota.
+        digest (str): Hash sha256 do arquivo de origem.
+    """
+    name: str
+    routes: dict[str, MissionRoute]
+    triggers: list[dict] = field(default_factory=list)
+    branches: dict[str, str] = field(default_factory=dict)
+    digest: str = ''
+
+    def branch(self, text: str) -> MissionRoute | None:
+        """
+        Retorna a rota associada a um texto de QR code.
+        Args:
+            text (str): Texto lido.
+        Returns:
+            MissionRoute | None: Rota, ou None se o texto não tem desvio.
+        """
+        name = self.branches.get(text)
+        return self.routes[name] if name is not None else None
+
+    def to_dict(self) -> dict:
+        """Serializa a missão compilada (formato do cache)."""
+        return {
+            'format': MISSION_FORMAT,
+            'name': self.name,
+            'digest': self.digest,
+            'routes': {
+                name: {
+                    'interval': route.interval,
+                    'source': route.plan.source,
+                    'steps': [[s.command, s.duration, s.source] for s in route.plan.steps],
+                }
+                for name, route in self.routes.items()
+            },
+            'triggers': self.triggers,
+            'branches': self.branches,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Mission':
+        """Reconstrói uma missão compilada a partir de to_dict."""
+        routes = {
+            name: MissionRoute(
+                RoutePlan([PlanStep(c, d, s) for c, d, s in r['steps']], r['source']),
+                r['interval'],
+            )
+            for name, r in data['routes'].items()
+        }
+        return cls(data['name'], routes, data['triggers'], data['branches'], data['digest'])
+
+def _parse_text(text: str, path: str) -> dict:
+    """Lê o conteúdo como JSON ou, para .yaml/.yml, como YAML (requer PyYAML)."""
+    if path.lower().endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise MissionError(["PyYAML não está instalado (pip install pyyaml); use uma missão em JSON."], path) from None
+        try:
+            return yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise MissionError([f"YAML inválido: {e}"], path) from None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise MissionError([f"JSON inválido: {e}"], path) from None
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _check_keys(obj: dict, allowed: set, where: str, errors: list[str]) -> None:
+    for key in obj:
+        if key not in allowed:
+            errors.append(f"{where}: campo desconhecido '{key}' (permitidos: {', '.join(sorted(allowed))})")
+
+def _compile_route(name: str, spec: object, speed: int, optimize: bool, errors: list[str]) -> MissionRoute | None:
+    """Valida e compila uma rota da missão, acumulando os erros."""
+    where = f"routes.{name}"
+    if isinstance(spec, (str, list)):
+        spec = {'steps': spec}
+    if not isinstance(spec, dict):
+        errors.append(f"{where}: esperado texto, lista de passos ou objeto")
+        return None
+    _check_keys(spec, ROUTE_KEYS, where, errors)
+    if ('steps' in spec) == ('waypoints' in spec):
+        errors.append(f"{where}: informe exatamente um entre 'steps' e 'waypoints'")
+        return None
+    interval = spec.get('interval', DEFAULT_INTERVAL)
+    if not _is_number(interval) or interval < 0:
+        errors.append(f"{where}.interval: deve ser um número >= 0")
+        return None
+    use_curve = bool(spec.get('use_curve', False))
+
+    try:
+        if 'steps' in spec:
+            steps = spec['steps']
+            if isinstance(steps, list) and not all(isinstance(s, str) for s in steps):
+                errors.append(f"{where}.steps: todos os passos devem ser texto")
+                return None
+            if not isinstance(steps, (str, list)) or not steps:
+                errors.append(f"{where}.steps: rota vazia")
+                return None
+            plan = compile_route(steps, optimize=optimize, use_curve=use_curve, speed=speed)
+        else:
+            waypoints = spec['waypoints']
+            if not isinstance(waypoints, list) or not waypoints:
+                errors.append(f"{where}.waypoints: esperada uma lista não vazia")
+                return None
+            n_errors = len(errors)
+            plan_steps: list[PlanStep] = []
+            for steps, dwell in _waypoint_legs(waypoints, where, errors):
+                if steps:
+                    leg = compile_route(steps, optimize=True, use_curve=use_curve, speed=speed)
+                    plan_steps.extend(leg.steps)
+                if dwell:
+                    plan_steps.extend(compile_route([f"delay {dwell}"]).steps)
+            if len(errors) > n_errors:
+                return None
+            plan = RoutePlan(plan_steps, json.dumps(waypoints))
+    except RouteError as e:
+        errors.append(f"{where}: {e}")
+        return None
+    if not plan.steps: # Ex: waypoints que não saem do lugar
+        errors.append(f"{where}: o plano compilado está vazio")
+        return None
+    return MissionRoute(plan, int(interval))
+
+def _waypoint_legs(waypoints: list, where: str, errors: list[str]) -> list[tuple[list[str], float]]:
+    """
+    Converte waypoints (posições em cm relativas ao início da rota, x: frente, y: esquerda, z: cima)
+    em trechos de passos por eixo, já dentro dos limites do SDK. Cada trecho é compilado separadamente,
+    então nenhum waypoint é pulado.
+    """
+    legs = []
+    current = (0, 0, 0)
+    for i, wp in enumerate(waypoints):
+        wp_where = f"{where}.waypoints[{i}]"
+        dwell = 0
+        if isinstance(wp, dict):
+            _check_keys(wp, WAYPOINT_KEYS, wp_where, errors)
+            dwell = wp.get('dwell', 0)
+            wp = wp.get('at')
+        if (not isinstance(wp, (list, tuple)) or len(wp) != 3
+                or not all(_is_number(v) and v == int(v) for v in wp)):
+            errors.append(f"{wp_where}: esperado [x, y, z] em cm inteiros")
+            continue
+        if not _is_number(dwell) or dwell < 0:
+            errors.append(f"{wp_where}.dwell: deve ser um número >= 0")
+            continue
+        target = tuple(int(v) for v in wp)
+        delta = [t - c for t, c in zip(target, current)]
+        current = target
+        steps = [cmd for axis in range(3) for cmd in _axis_commands(axis, delta[axis])]
+        legs.append((steps, dwell))
+    return legs
+
+def compile_mission(data: object, source: str = '', digest: str = '') -> Mission:
+    """
+    Valida uma missão inteira e compila todas as rotas. Nenhum erro fica para a hora do voo:
+    passos inválidos, campos desconhecidos e referências a rotas inexistentes são todos reportados juntos.
+    Args:
+        data (dict): Missão já lida do arquivo.
+        source (str): Origem, para as mensagens de erro.
+        digest (str): Hash do arquivo.
+    Returns:
+        Mission: Missão compilada.
+    Raises:
+        MissionError: Com a lista de todos os problemas encontrados.
+    """
+    errors: list[str] = []
+    if not isinstance(data, dict):
+        raise MissionError(["a missão deve ser um objeto"], source)
+    _check_keys(data, MISSION_KEYS, 'missão', errors)
+
+    speed = data.get('speed', DEFAULT_SPEED)
+    if not _is_number(speed) or not SPEED_MIN <= speed <= SPEED_MAX:
+        errors.append(f"speed: deve estar entre {SPEED_MIN} e {SPEED_MAX}")
+        speed = DEFAULT_SPEED
+    optimize = bool(data.get('optimize', True))
+
+    routes: dict[str, MissionRoute] = {}
+    specs = data.get('routes')
+    if not isinstance(specs, dict) or not specs:
+        errors.append("routes: esperado um objeto com ao menos uma rota")
+        specs = {}
+    for name, spec in specs.items():
+        route = _compile_route(str(name), spec, int(speed), optimize, errors)
+        if route is not None:
+            routes[str(name)] = route
+
+    triggers = []
+    trigger_specs = data.get('triggers', []) or []
+    if not isinstance(trigger_specs, list):
+        errors.append("triggers: esperada uma lista de gatilhos")
+        trigger_specs = []
+    for i, trigger in enumerate(trigger_specs):
+        where = f"triggers[{i}]"
+        if not isinstance(trigger, dict):
+            errors.append(f"{where}: esperado um objeto")
+            continue
+        _check_keys(trigger, TRIGGER_KEYS, where, errors)
+        if not isinstance(trigger.get('route'), str): # Listas e objetos nem podem ser buscados em specs
+            errors.append(f"{where}.route: esperado o nome de uma rota")
+        elif trigger['route'] not in specs:
+            errors.append(f"{where}.route: rota '{trigger.get('route')}' não existe")
+        elif trigger['route'] in routes:
+            route = routes[trigger['route']]
+            if len(route.plan) > 1 and route.interval <= 0:
+                # Eventos periódicos com mais de um comando só disparam com intervalo > 0
+                errors.append(f"{where}: a rota '{trigger['route']}' precisa de interval > 0 para um gatilho periódico")
+        period = trigger.get('period')
+        if not isinstance(period, int) or isinstance(period, bool) or period <= 0:
+            errors.append(f"{where}.period: deve ser um inteiro > 0 (em ciclos de 0.1 s)")
+            continue
+        triggers.append({'route': trigger.get('route'), 'period': period, 'info': str(trigger.get('info', trigger.get('route')))})
+
+    branches = data.get('branches', {}) or {}
+    if not isinstance(branches, dict):
+        errors.append("branches: esperado um objeto {texto do QR: rota}")
+        branches = {}
+    for text, name in branches.items():
+        if not isinstance(name, str):
+            errors.append(f"branches.{text}: esperado o nome de uma rota")
+        elif name not in specs:
+            errors.append(f"branches.{text}: rota '{name}' não existe")
+
+    if errors:
+        raise MissionError(errors, source)
+    return Mission(str(data.get('name', os.path.basename(source))), routes, triggers,
+                   {str(k): str(v) for k, v in branches.items()}, digest)
+
+_memory_cache: dict[str, Mission] = {}
+_compiler_hash: str | None = None
+
+def _compiler_digest() -> str:
+    """
+    Hash do código do compilador (route.py e mission.py), parte da chave do cache: qualquer mudança
+    no compilador invalida os planos já gravados, sem depender de incrementar MISSION_FORMAT.
+    """
+    global _compiler_hash
+    if _compiler_hash is None:
+        h = hashlib.sha256(f"{MISSION_FORMAT}".encode())
+        for module_file in (_route.__file__, __file__):
+            try:
+                with open(module_file, 'rb') as f: # type: ignore[arg-type]
+                    h.update(f.read())
+            except (OSError, TypeError): # Código sem fonte acessível (ex: empacotado em zip)
+                h.update(str(module_file).encode())
+        _compiler_hash = h.hexdigest()
+    return _compiler_hash
+
+def load_mission(path: str, cache_dir: str | None = DEFAULT_CACHE_DIR) -> Mission:
+    """
+    Carrega uma missão em JSON ou YAML, validando e compilando tudo antes do voo.
+    O resultado compilado fica em cache pelo hash sha256 do arquivo e do compilador, em memória e em disco
+    (cache_dir), então missões já vistas carregam sem revalidar. Alterar o arquivo ou atualizar a biblioteca muda o hash.
+    Formato:
+        {
+          "name": "vigilancia", "speed": 50,
+          "routes": {
+            "patrulha": {"steps": "forward 100 e cw 90", "interval": 2},
+            "quadrado": {"waypoints": [[100, 0, 0], {"at": [100, 100, 0], "dwell": 3}], "interval": 0},
+            "pousar": "land"
+          },
+          "triggers": [{"route": "patrulha", "period": 100, "info": "Vigilância"}],
+          "branches": {"pouse": "pousar"}
+        }
+    Args:
+        path (str): Caminho do arquivo (.json, .yaml ou .yml).
+        cache_dir (str | None): Pasta do cache em disco. None desativa o cache em disco.
+    Returns:
+        Mission: Missão compilada.
+    Raises:
+        MissionError: Se o arquivo for inválido.
+        OSError: Se o arquivo não puder ser lido.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw + f"|{_compiler_digest()}".encode()).hexdigest()
+
+    mission = _memory_cache.get(digest)
+    if mission is not None:
+        return mission
+
+    cache_file = os.path.join(cache_dir, f"{digest}.json") if cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') == MISSION_FORMAT and data.get('digest') == digest:
+                mission = Mission.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            mission = None # Cache corrompido: recompila
+
+    if mission is None:
+        try:
+            text = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            raise MissionError(["o arquivo não está em UTF-8"], path) from None
+        mission = compile_mission(_parse_text(text, path), path, digest)
+        if cache_file:
+            try:
+                os.makedirs(cache_dir, exist_ok=True) # type: ignore[arg-type]
+                tmp = f"{cache_file}.{os.getpid()}.tmp"
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(mission.to_dict(), f)
+                os.replace(tmp, cache_file) # Escrita atômica
+            except OSError as e:
+                logger.warning("Não foi possível gravar o cache da missão: %s", e)
+
+    _memory_cache[digest] = mission
+    return mission
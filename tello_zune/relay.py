@@ -0,0 +1,319 @@
+import os
+import time
+import socket
+import struct
+import tempfile
+import itertools
+from dataclasses import dataclass
+
+# Campos do pacote de estado do SDK 2.0, na ordem da codificação binária
+STATE_FIELDS = (
+    'pitch', 'roll', 'yaw', 'vgx', 'vgy', 'vgz', 'templ', 'temph',
+    'tof', 'h', 'bat', 'baro', 'time', 'agx', 'agy', 'agz',
+)
+FIELD_INDEX = {name: i for i, name in enumerate(STATE_FIELDS)}
+
+MAGIC = b'TZ'
+VERSION = 1
+KIND_STATE = 1
+KIND_RESPONSE = 2
+HEADER = struct.Struct('<2sBBId') # magic, versão, tipo, seq, instante (time.monotonic do dono)
+STATE = struct.Struct(f'<{len(STATE_FIELDS)}f') # Campos ausentes vão como NaN
+
+DEFAULT_GROUP = '239.255.77.77'
+DEFAULT_PORT = 8891
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'tello_zune_relay')
+SUBSCRIBER_SCAN_INTERVAL = 1.0 # Segundos entre as buscas por novos assinantes (transporte unix)
+
+_NAN = float('nan')
+
+@dataclass(slots=True)
+class RelayMessage:
+    """
+    Mensagem recebida do relay.
+    Attributes:
+        kind (int): KIND_STATE ou KIND_RESPONSE.
+        seq (int): Número de sequência do publicador (estado e respostas compartilham a sequência).
+        timestamp (float): Instante em que o dono recebeu o pacote (time.monotonic, válido entre processos).
+        values (tuple, optional): Campos do estado na ordem de STATE_FIELDS.
+        text (str, optional): Resposta de comando.
+    """
+    kind: int
+    seq: int
+    timestamp: float
+    values: tuple[float, ...] | None = None
+    text: str | None = None
+
+    def get(self, field: str) -> float:
+        """Valor de um campo do estado (NaN se ausente)."""
+        return self.values[FIELD_INDEX[field]] if self.values is not None else _NAN
+
+    @property
+    def state(self) -> dict[str, float]:
+        """Campos do estado como dicionário (montado só quando pedido)."""
+        return dict(zip(STATE_FIELDS, self.values)) if self.values is not None else {}
+
+def encode_state(seq: int, timestamp: float, state: dict) -> bytes:
+    """Codifica um pacote de estado ({'bat': '80', ...}) em 80 bytes."""
+    values = []
+    for name in STATE_FIELDS:
+        try:
+            values.append(float(state[name]))
+        except (KeyError, ValueError):
+            values.append(_NAN)
+    return HEADER.pack(MAGIC, VERSION, KIND_STATE, seq & 0xFFFFFFFF, timestamp) + STATE.pack(*values)
+
+def encode_response(seq: int, timestamp: float, text: str) -> bytes:
+    """Codifica uma resposta de comando."""
+    return HEADER.pack(MAGIC, VERSION, KIND_RESPONSE, seq & 0xFFFFFFFF, timestamp) + text.encode('utf-8')
+
+def decode(data: bytes) -> RelayMessage | None:
+    """
+    Decodifica uma mensagem do relay.
+    Returns:
+        RelayMessage | None: None se os bytes não forem uma mensagem válida.
+    """
+    if len(data) < HEADER.size:
+        return None
+    magic, version, kind, seq, timestamp = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        return None
+    if kind == KIND_STATE and len(data) == HEADER.size + STATE.size:
+        return RelayMessage(kind, seq, timestamp, values=STATE.unpack_from(data, HEADER.size))
+    if kind == KIND_RESPONSE:
+        return RelayMessage(kind, seq, timestamp, text=data[HEADER.size:].decode('utf-8', 'replace'))
+    return None
+
+def _resolve(transport: str) -> str:
+    if transport == 'auto':
+        return 'multicast'
+    if transport not in ('multicast', 'unix'):
+        raise ValueError(f"Transporte inválido '{transport}'. Use 'auto', 'multicast' ou 'unix'.")
+    if transport == 'unix' and not hasattr(socket, 'AF_UNIX'):
+        raise OSError("Sockets Unix não são suportados nesta plataforma.")
+    return transport
+
+class StateRelay:
+    """
+    Republica o estado (e opcionalmente as respostas de comandos) do TelloZune dono da porta 8890
+    para outros processos da estação: logger, dashboard, controlador...
+    No transporte 'multicast' (padrão) cada pacote é um único sendto para um grupo multicast
+    restrito à máquina (TTL 0, interface de loopback): o kernel entrega uma cópia a cada assinante,
+    então um assinante a mais não custa nada ao publicador. No transporte 'unix' (para sistemas
+    sem multicast no loopback) cada assinante cria um socket de datagrama num diretório e recebe
+    um sendto próprio. O envio nunca bloqueia: um assinante lento perde pacotes (ver seq).
+    Args:
+        transport (str): 'auto', 'multicast' ou 'unix'. 'auto' usa multicast e cai para unix se falhar.
+        group (str): Grupo multicast.
+        port (int): Porta UDP do grupo.
+        path (str): Diretório dos sockets dos assinantes (transporte unix).
+    """
+    def __init__(
+        self,
+        transport: str = 'auto',
+        group: str = DEFAULT_GROUP,
+        port: int = DEFAULT_PORT,
+        path: str = DEFAULT_PATH
+    ) -> None:
+        self.group = group
+        self.port = port
+        self.path = path
+        self.seq = 0 # Última sequência publicada
+        self._counter = itertools.count(1) # next() é atômico: estado e respostas vêm de threads diferentes
+        self.sent = 0
+        self.errors = 0
+        self.subscribers: list[str] = [] # Sockets dos assinantes (transporte unix)
+        self.last_scan = float('-inf')
+
+        self.transport = _resolve(transport)
+        try:
+            self.sock = self._open(self.transport)
+        except OSError:
+            if transport != 'auto' or not hasattr(socket, 'AF_UNIX'):
+                raise
+            self.transport = 'unix'
+            self.sock = self._open('unix')
+
+    def _open(self, transport: str) -> socket.socket:
+        if transport == 'multicast':
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 0) # Não sai da máquina
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton('127.0.0.1'))
+        else:
+            os.makedirs(self.path, exist_ok=True)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        return sock
+
+    def publish_state(self, timestamp: float, state: dict) -> None:
+        """
+        Publica um pacote de estado.
+        Args:
+            timestamp (float): Instante de recebimento do pacote.
+            state (dict): Campos do pacote ({'bat': '80', ...}).
+        """
+        self._send(encode_state(self._next_seq(), timestamp, state))
+
+    def publish_response(self, timestamp: float, text: str) -> None:
+        """
+        Publica uma resposta de comando.
+        Args:
+            timestamp (float): Instante de recebimento da resposta.
+            text (str): Resposta.
+        """
+        self._send(encode_response(self._next_seq(), timestamp, text))
+
+    def _next_seq(self) -> int:
+        self.seq = next(self._counter)
+        return self.seq
+
+    def _send(self, data: bytes) -> None:
+        if self.transport == 'multicast':
+            try:
+                self.sock.sendto(data, (self.group, self.port))
+                self.sent += 1
+            except OSError:
+                self.errors += 1
+            return
+        self._scan()
+        for path in list(self.subscribers):
+            try:
+                self.sock.sendto(data, path)
+                self.sent += 1
+            except BlockingIOError:
+                self.errors += 1 # Assinante com o buffer cheio: perde este pacote
+            except OSError: # Assinante encerrado sem remover o socket
+                self.subscribers.remove(path)
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def _scan(self, force: bool = False) -> None:
+        """Atualiza a lista de assinantes do transporte unix (no máximo uma vez por segundo)."""
+        now = time.monotonic()
+        if not force and now - self.last_scan < SUBSCRIBER_SCAN_INTERVAL:
+            return
+        self.last_scan = now
+        try:
+            self.subscribers = [os.path.join(self.path, n) for n in os.listdir(self.path) if n.endswith('.sock')]
+        except OSError:
+            self.subscribers = []
+
+    def stats(self) -> dict:
+        """
+        Retorna contadores do publicador.
+        Returns:
+            dict: {'transport', 'seq', 'sent', 'errors', 'subscribers'} (assinantes só no transporte unix).
+        """
+        return {
+            'transport': self.transport,
+            'seq': self.seq,
+            'sent': self.sent,
+            'errors': self.errors,
+            'subscribers': len(self.subscribers) if self.transport == 'unix' else None,
+        }
+
+    def close(self) -> None:
+        """Fecha o socket do publicador."""
+        self.sock.close()
+
+class RelayClient:
+    """
+    Assinante do relay, para processos que não são donos da porta de estado.
+    Cada mensagem custa uma chamada a struct.unpack_from; o dicionário só é montado em .state.
+    Args:
+        transport (str): 'multicast' ou 'unix' (o mesmo do publicador; 'auto' = multicast).
+        group (str): Grupo multicast.
+        port (int): Porta UDP do grupo.
+        path (str): Diretório dos sockets dos assinantes (transporte unix).
+        responses (bool): Se False, descarta as respostas de comandos.
+    """
+    _ids = itertools.count()
+
+    def __init__(
+        self,
+        transport: str = 'multicast',
+        group: str = DEFAULT_GROUP,
+        port: int = DEFAULT_PORT,
+        path: str = DEFAULT_PATH,
+        responses: bool = True
+    ) -> None:
+        self.transport = _resolve(transport)
+        self.responses = responses
+        self.address: str | None = None
+        if self.transport == 'multicast':
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1) # Vários assinantes na mesma porta
+            if hasattr(socket, 'SO_REUSEPORT'):
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.sock.bind(('', port))
+            mreq = struct.pack('4s4s', socket.inet_aton(group), socket.inet_aton('127.0.0.1'))
+            self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.address = os.path.join(path, f"{os.getpid()}-{next(self._ids)}.sock")
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self.sock.bind(self.address)
+
+        self.last: RelayMessage | None = None # Último estado recebido
+        self.last_seq: int | None = None
+        self.received = 0
+        self.missed = 0 # Mensagens perdidas, pelas lacunas na sequência
+
+    def recv(self, timeout: float | None = None) -> RelayMessage | None:
+        """
+        Espera a próxima mensagem.
+        Args:
+            timeout (float, optional): Espera máxima em segundos. Padrão: sem limite.
+        Returns:
+            RelayMessage | None: Mensagem, ou None se o tempo acabou.
+        """
+        self.sock.settimeout(timeout)
+        while True:
+            try:
+                data = self.sock.recv(2048)
+            except socket.timeout:
+                return None
+            msg = decode(data)
+            if msg is None:
+                continue
+            if self.last_seq is not None:
+                gap = (msg.seq - self.last_seq - 1) & 0xFFFFFFFF
+                if gap >= 0x80000000: # Duplicado ou fora de ordem: descarta
+                    continue
+                self.missed += gap
+            self.last_seq = msg.seq
+            self.received += 1
+            if msg.kind == KIND_STATE:
+                self.last = msg
+            elif not self.responses:
+                continue
+            return msg
+
+    def __iter__(self):
+        while True:
+            msg = self.recv()
+            if msg is not None:
+                yield msg
+
+    @property
+    def state(self) -> dict[str, float]:
+        """Último estado recebido, como dicionário."""
+        return self.last.state if self.last is not None else {}
+
+    def close(self) -> None:
+        """Fecha o socket (e remove o arquivo, no transporte unix)."""
+        self.sock.close()
+        if self.address is not None:
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+
+    def __enter__(self) -> 'RelayClient':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,373 @@
+import math
+from dataclasses import dataclass, field
+
+# Limites do SDK do Tello
+MOVE_MIN, MOVE_MAX = 20, 500 # up/down/left/right/forward/back (cm)
+ROTATE_MIN, ROTATE_MAX = 1, 360 # cw/ccw (graus)
+SPEED_MIN, SPEED_MAX = 10, 100 # speed e go (cm/s)
+CURVE_SPEED_MAX = 60 # curve (cm/s)
+GO_MIN = 20 # go: x, y e z não podem estar todos entre -20 e 20
+CURVE_RADIUS_MIN, CURVE_RADIUS_MAX = 50, 1000 # Raio do arco do curve (cm)
+
+# Estimativas de tempo (conservadoras) usadas no plano e nos timeouts
+DEFAULT_SPEED = 50 # cm/s, até um 'speed x' na rota
+YAW_RATE = 60.0 # graus/s
+MOVE_OVERHEAD = 1.0 # s de aceleração/estabilização por movimento
+ROUND_TRIP = 0.1 # s para comandos sem movimento
+FIXED_DURATION = {'takeoff': 6.0, 'land': 5.0, 'flip': 3.0, 'emergency': ROUND_TRIP, 'stop': ROUND_TRIP}
+
+# Eixos no referencial do Tello (x: frente, y: esquerda, z: cima)
+MOVE_AXES = {
+    'forward': (0, 1), 'back': (0, -1),
+    'left': (1, 1), 'right': (1, -1),
+    'up': (2, 1), 'down': (2, -1),
+}
+AXIS_NAMES = (('forward', 'back'), ('left', 'right'), ('up', 'down'))
+FLIP_DIRS = ('l', 'r', 'f', 'b')
+NO_ARG_COMMANDS = ('takeoff', 'land', 'emergency', 'stop', 'command', 'streamon', 'streamoff')
+
+class RouteError(ValueError):
+    """
+    Erro de validação de uma rota.
+    Attributes:
+        step (int): Índice (a partir de 1) do passo inválido.
+        command (str): Texto do passo inválido.
+    """
+    def __init__(self, message: str, step: int = 0, command: str = '') -> None:
+        self.step = step
+        self.command = command
+        prefix = f"Passo {step} ('{command}'): " if step else ''
+        super().__init__(prefix + message)
+
+@dataclass
+class PlanStep:
+    """
+    Um comando do plano compilado.
+    Attributes:
+        command (str): Comando do SDK a enviar.
+        duration (float): Tempo estimado de execução em segundos.
+        source (list): Passos da rota original que este comando substitui.
+    """
+    command: str
+    duration: float
+    source: list[str] = field(default_factory=list)
+
+@dataclass
+class RoutePlan:
+    """
+    Plano de comandos validado, pronto para ser reutilizado a cada período.
+    Attributes:
+        steps (list): Passos do plano.
+        source (str): Texto original da rota.
+    """
+    steps: list[PlanStep]
+    source: str = ''
+
+    @property
+    def commands(self) -> list[str]:
+        """Comandos do SDK, na ordem."""
+        return [step.command for step in self.steps]
+
+    @property
+    def total_time(self) -> float:
+        """Tempo total estimado em segundos."""
+        return sum(step.duration for step in self.steps)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+def _number(token: str, step: int, command: str) -> int:
+    try:
+        value = float(token)
+    except ValueError:
+        raise RouteError(f"'{token}' não é um número.", step, command) from None
+    if value != int(value):
+        raise RouteError(f"'{token}' deve ser inteiro.", step, command)
+    return int(value)
+
+def _check_range(value: int, low: int, high: int, what: str, step: int, command: str) -> None:
+    if not low <= value <= high:
+        raise RouteError(f"{what} deve estar entre {low} e {high} (recebido {value}).", step, command)
+
+def parse_command(command: str, step: int = 0) -> list:
+    """
+    Valida um comando e o converte para a forma [nome, argumentos...].
+    Args:
+        command (str): Comando, ex: 'forward 100'.
+        step (int): Índice do passo, para a mensagem de erro.
+    Returns:
+        list: [nome, *argumentos numéricos ou texto]
+    Raises:
+        RouteError: Se o comando for desconhecido ou estiver fora dos limites do SDK.
+    """
+    parts = command.strip().lower().split()
+    if not parts:
+        raise RouteError("Passo vazio.", step, command)
+    name, args = parts[0], parts[1:]
+
+    def expect(n: int) -> None:
+        if len(args) != n:
+            raise RouteError(f"'{name}' requer {n} argumento(s), recebeu {len(args)}.", step, command)
+
+    if name in MOVE_AXES:
+        expect(1)
+        value = _number(args[0], step, command)
+        _check_range(value, MOVE_MIN, MOVE_MAX, 'Distância', step, command)
+        return [name, value]
+    if name in ('cw', 'ccw'):
+        expect(1)
+        value = _number(args[0], step, command)
+        _check_range(value, ROTATE_MIN, ROTATE_MAX, 'Ângulo', step, command)
+        return [name, value]
+    if name == 'speed':
+        expect(1)
+        value = _number(args[0], step, command)
+        _check_range(value, SPEED_MIN, SPEED_MAX, 'Velocidade', step, command)
+        return [name, value]
+    if name == 'go':
+        expect(4)
+        x, y, z, speed = (_number(a, step, command) for a in args)
+        for v in (x, y, z):
+            _check_range(v, -MOVE_MAX, MOVE_MAX, 'Coordenada', step, command)
+        _check_range(speed, SPEED_MIN, SPEED_MAX, 'Velocidade', step, command)
+        if max(abs(x), abs(y), abs(z)) <= GO_MIN:
+            raise RouteError(f"x, y e z não podem estar todos entre -{GO_MIN} e {GO_MIN}.", step, command)
+        return [name, x, y, z, speed]
+    if name == 'curve':
+        expect(7)
+        values = [_number(a, step, command) for a in args]
+        for v in values[:6]:
+            _check_range(v, -MOVE_MAX, MOVE_MAX, 'Coordenada', step, command)
+        _check_range(values[6], SPEED_MIN, CURVE_SPEED_MAX, 'Velocidade', step, command)
+        radius = _circumradius(tuple(values[0:3]), tuple(values[3:6]))
+        if radius is None or not CURVE_RADIUS_MIN <= radius <= CURVE_RADIUS_MAX:
+            raise RouteError(
+                f"O arco deve ter raio entre {CURVE_RADIUS_MIN / 100} e {CURVE_RADIUS_MAX / 100} m.", step, command
+            )
+        return [name] + values
+    if name == 'flip':
+        expect(1)
+        if args[0] not in FLIP_DIRS:
+            raise RouteError(f"Direção de flip deve ser uma de {FLIP_DIRS}.", step, command)
+        return [name, args[0]]
+    if name == 'delay':
+        expect(1)
+        try:
+            seconds = float(args[0])
+        except ValueError:
+            raise RouteError(f"'{args[0]}' não é um número.", step, command) from None
+        if seconds < 0:
+            raise RouteError("O atraso não pode ser negativo.", step, command)
+        return [name, seconds]
+    if name in NO_ARG_COMMANDS:
+        expect(0)
+        return [name]
+    if name.endswith('?'):
+        return [name] # Leituras (battery?, speed?...) passam sem alteração
+    raise RouteError(f"Comando desconhecido '{name}'.", step, command)
+
+def _format(parsed: list) -> str:
+    return ' '.join(str(int(p)) if isinstance(p, float) and p == int(p) else str(p) for p in parsed)
+
+def _circumradius(p1: tuple, p2: tuple) -> float | None:
+    """Raio do círculo que passa pela origem, p1 e p2 (None se forem colineares)."""
+    a = math.dist((0, 0, 0), p1)
+    b = math.dist(p1, p2)
+    c = math.dist(p2, (0, 0, 0))
+    cross = (
+        p1[1] * p2[2] - p1[2] * p2[1],
+        p1[2] * p2[0] - p1[0] * p2[2],
+        p1[0] * p2[1] - p1[1] * p2[0],
+    )
+    area2 = math.hypot(*cross) # Dobro da área do triângulo
+    if area2 < 1e-9:
+        return None
+    return a * b * c / (2 * area2)
+
+def _arc_length(p1: tuple, p2: tuple) -> float:
+    """Comprimento aproximado do arco origem -> p1 -> p2."""
+    radius = _circumradius(p1, p2)
+    chord = math.dist((0, 0, 0), p1) + math.dist(p1, p2)
+    if radius is None:
+        return chord
+    total_chord = math.dist((0, 0, 0), p2)
+    angle = 2 * math.asin(min(1.0, total_chord / (2 * radius)))
+    return max(chord, radius * angle)
+
+def estimate_command_time(command: str, speed: float = DEFAULT_SPEED) -> float:
+    """
+    Estima o tempo de execução de um comando do SDK.
+    Args:
+        command (str): Comando, ex: 'forward 100'.
+        speed (float): Velocidade configurada no drone (cm/s), usada nos movimentos simples.
+    Returns:
+        float: Tempo estimado em segundos.
+    """
+    parts = command.strip().lower().split()
+    if not parts:
+        return 0.0
+    name = parts[0]
+    try:
+        if name in MOVE_AXES:
+            return abs(float(parts[1])) / speed + MOVE_OVERHEAD
+        if name in ('cw', 'ccw'):
+            return abs(float(parts[1])) / YAW_RATE + MOVE_OVERHEAD / 2
+        if name == 'go':
+            x, y, z, go_speed = (float(p) for p in parts[1:5])
+            return math.hypot(x, y, z) / go_speed + MOVE_OVERHEAD
+        if name == 'curve':
+            values = [float(p) for p in parts[1:8]]
+            return _arc_length(tuple(values[0:3]), tuple(values[3:6])) / values[6] + MOVE_OVERHEAD
+        if name == 'delay':
+            return float(parts[1])
+    except (IndexError, ValueError, ZeroDivisionError):
+        return ROUND_TRIP
+    return FIXED_DURATION.get(name, ROUND_TRIP)
+
+def _axis_commands(axis: int, distance: int) -> list[str]:
+    """Comandos de um eixo para uma distância líquida, respeitando 20~500 cm."""
+    positive, negative = AXIS_NAMES[axis]
+    name, other = (positive, negative) if distance > 0 else (negative, positive)
+    distance = abs(distance)
+    if distance == 0:
+        return []
+    if distance < MOVE_MIN:
+        # Distância menor que o mínimo do SDK: ida maior e volta mínima
+        return [f"{name} {distance + MOVE_MIN}", f"{other} {MOVE_MIN}"]
+    commands = []
+    while distance > MOVE_MAX:
+        chunk = MOVE_MAX if distance - MOVE_MAX >= MOVE_MIN else distance - MOVE_MIN
+        commands.append(f"{name} {chunk}")
+        distance -= chunk
+    commands.append(f"{name} {distance}")
+    return commands
+
+def _compile_segment(legs: list[tuple[tuple[int, int, int], str]], speed: int, use_go: bool, use_curve: bool) -> list[tuple[str, list[str]]]:
+    """
+    Compila uma sequência de translações (sem rotação entre elas).
+    Args:
+        legs (list): [(deslocamento (x, y, z), texto original)]
+    Returns:
+        list: [(comando, textos originais substituídos)]
+    """
+    # Junta movimentos consecutivos no mesmo eixo (e cancela opostos)
+    merged: list[list] = []
+    for vector, text in legs:
+        axes = [i for i in range(3) if vector[i]]
+        if merged and len(axes) == 1 and merged[-1][2] == axes[0]:
+            merged[-1][0] = tuple(a + b for a, b in zip(merged[-1][0], vector))
+            merged[-1][1].append(text)
+        else:
+            merged.append([vector, [text], axes[0] if len(axes) == 1 else None])
+    merged = [m for m in merged if any(m[0])]
+    sources = [text for _, text in legs]
+    if not merged:
+        return [] # Tudo se cancelou
+
+    total = tuple(sum(m[0][i] for m in merged) for i in range(3))
+    if use_curve and len(merged) == 2 and speed <= CURVE_SPEED_MAX:
+        p1 = merged[0][0]
+        p2 = total
+        radius = _circumradius(p1, p2)
+        if (radius is not None and CURVE_RADIUS_MIN <= radius <= CURVE_RADIUS_MAX
+                and all(abs(v) <= MOVE_MAX for v in p1 + p2)):
+            return [(f"curve {p1[0]} {p1[1]} {p1[2]} {p2[0]} {p2[1]} {p2[2]} {speed}", sources)]
+
+    if use_go and len(merged) > 1 and all(abs(v) <= MOVE_MAX for v in total):
+        if max(abs(v) for v in total) > GO_MIN:
+            return [(f"go {total[0]} {total[1]} {total[2]} {speed}", sources)]
+        if not any(total):
+            return []
+
+    # Sem go/curve: um comando por trecho de eixo já mesclado
+    result = []
+    for vector, texts, axis in merged:
+        if axis is None:
+            continue
+        for cmd in _axis_commands(axis, vector[axis]):
+            result.append((cmd, texts))
+    return result
+
+def compile_route(route: str | list[str], optimize: bool = True, use_go: bool = True,
+                  use_curve: bool = False, speed: int = DEFAULT_SPEED) -> RoutePlan:
+    """
+    Valida uma rota e a compila num plano com menos comandos.
+    A rota é o texto usado em add_periodic_event, com passos separados por ' e '
+    (ex: "forward 100 e left 50 e cw 90"), ou uma lista de passos.
+    Otimizações (com optimize=True), sempre entre duas rotações ou outros comandos:
+        - movimentos consecutivos no mesmo eixo são somados e opostos se cancelam;
+        - rotações consecutivas viram uma só, pelo menor ângulo (uma volta completa, ex: 'cw 180 e cw 180',
+          continua 'cw 360'); uma rotação isolada é mantida como escrita, preservando o sentido da varredura;
+        - translações em eixos diferentes viram um único 'go x y z speed' (use_go),
+          ou um 'curve' passando pelo canto, se use_curve e o arco respeitar o SDK.
+    Args:
+        route (str | list): Rota.
+        optimize (bool): Se False, apenas valida e estima os tempos.
+        use_go (bool): Permite juntar translações num 'go'.
+        use_curve (bool): Permite trocar duas translações por um 'curve'.
+        speed (int): Velocidade (cm/s) usada em go/curve e nas estimativas, até um 'speed x' na rota.
+    Returns:
+        RoutePlan: Plano validado com tempo estimado por passo.
+    Raises:
+        RouteError: Se algum passo for inválido ou se a rota se cancelar por completo (plano vazio).
+    """
+    source = route if isinstance(route, str) else ' e '.join(route)
+    texts = [c.strip() for c in route.split(' e ')] if isinstance(route, str) else [c.strip() for c in route]
+    parsed = [parse_command(text, i + 1) for i, text in enumerate(texts)]
+
+    steps: list[PlanStep] = []
+    current_speed = speed
+
+    def emit(command: str, sources: list[str]) -> None:
+        steps.append(PlanStep(command, estimate_command_time(command, current_speed), sources))
+
+    if not optimize:
+        for p, text in zip(parsed, texts):
+            if p[0] == 'speed':
+                current_speed = p[1]
+            emit(_format(p), [text])
+        return RoutePlan(steps, source)
+
+    i = 0
+    while i < len(parsed):
+        p, text = parsed[i], texts[i]
+        if p[0] in MOVE_AXES:
+            legs = []
+            while i < len(parsed) and parsed[i][0] in MOVE_AXES:
+                axis, sign = MOVE_AXES[parsed[i][0]]
+                vector = [0, 0, 0]
+                vector[axis] = sign * parsed[i][1]
+                legs.append((tuple(vector), texts[i]))
+                i += 1
+            go_speed = max(SPEED_MIN, min(SPEED_MAX, int(current_speed)))
+            for command, sources in _compile_segment(legs, go_speed, use_go, use_curve):
+                emit(command, sources)
+            continue
+        if p[0] in ('cw', 'ccw'):
+            net, sources = 0, []
+            while i < len(parsed) and parsed[i][0] in ('cw', 'ccw'):
+                net += parsed[i][1] if parsed[i][0] == 'cw' else -parsed[i][1]
+                sources.append(texts[i])
+                i += 1
+            if len(sources) == 1: # Rotação isolada: 'cw 270' e 'cw 360' são intencionais
+                emit(_format(p), sources)
+                continue
+            if net and net % 360 == 0:
+                net = 360 if net > 0 else -360 # Voltas completas somadas continuam uma volta
+            else:
+                net = (net + 180) % 360 - 180 # Menor ângulo equivalente
+                if net == -180:
+                    net = 180
+            if net:
+                emit(f"{'cw' if net > 0 else 'ccw'} {abs(net)}", sources)
+            continue
+        if p[0] == 'speed':
+            current_speed = p[1]
+        emit(_format(p), [text])
+        i += 1
+    if not steps:
+        raise RouteError(f"A rota '{source}' se cancela por completo: o plano compilado ficaria vazio.")
+    return RoutePlan(steps, source)
@@ -0,0 +1,215 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+
+# Ações em ordem de severidade e os comandos enviados direto ao drone (sem passar pela command_queue)
+ACTIONS = {
+    'hover': (1, ('rc 0 0 0 0',)), # Só para um movimento em andamento com 'stop' (ver STOP_COMMAND)
+    'land': (2, ('land',)),
+    'emergency': (3, ('emergency',)),
+}
+STOP_COMMAND = 'stop' # SDK 2.0: interrompe o movimento em andamento; o SDK 1.3 responde com erro
+AIRBORNE_HEIGHT = 10 # cm de 'h' acima dos quais o drone é considerado em voo
+AIRBORNE_TOF = 30 # cm de 'tof' (no chão o Tello informa ~10)
+
+@dataclass
+class SafetyRule:
+    """
+    Regra verificada a cada pacote de estado.
+    Attributes:
+        name (str): Nome da regra (aparece nos eventos).
+        fields (tuple): Campos do estado lidos; a regra usa o pior valor entre eles.
+        min (float, optional): Dispara abaixo deste valor.
+        max (float, optional): Dispara acima deste valor.
+        action (str): 'hover', 'land' ou 'emergency'.
+        use_abs (bool): Compara o valor absoluto (ex: pitch/roll).
+        airborne_only (bool): Só vale com o drone em voo.
+        skip_when_landing (bool): Ignorada durante o pouso (ex: altura mínima).
+    """
+    name: str
+    fields: tuple[str, ...]
+    min: float | None = None
+    max: float | None = None
+    action: str = 'land'
+    use_abs: bool = False
+    airborne_only: bool = True
+    skip_when_landing: bool = False
+
+    def __post_init__(self) -> None:
+        if self.action not in ACTIONS:
+            raise ValueError(f"Ação inválida '{self.action}'. Use uma de {tuple(ACTIONS)}.")
+        if self.min is None and self.max is None:
+            raise ValueError(f"A regra '{self.name}' precisa de min ou max.")
+
+    def violation(self, state: dict) -> float | None:
+        """
+        Retorna o valor que viola a regra, ou None se está tudo bem (ou os campos não existem).
+        Args:
+            state (dict): Campos do pacote de estado.
+        """
+        worst = None
+        for name in self.fields:
+            raw = state.get(name)
+            if raw is None:
+                continue
+            try:
+                value = float(raw)
+            except ValueError:
+                continue
+            if self.use_abs:
+                value = abs(value)
+            if (self.min is not None and value < self.min) or (self.max is not None and value > self.max):
+                if worst is None or abs(value) > abs(worst):
+                    worst = value
+        return worst
+
+def min_battery(percent: float = 15, action: str = 'land') -> SafetyRule:
+    """Pousa com a bateria abaixo de percent (%)."""
+    return SafetyRule('min_battery', ('bat',), min=percent, action=action)
+
+def max_temperature(celsius: float = 85, action: str = 'land') -> SafetyRule:
+    """Pousa com a temperatura máxima (temph) acima de celsius."""
+    return SafetyRule('max_temperature', ('temph',), max=celsius, action=action)
+
+def altitude_ceiling(cm: float, field: str = 'h', action: str = 'hover') -> SafetyRule:
+    """Para no ar acima de cm de altura (h: relativa à decolagem; tof: distância até o chão)."""
+    return SafetyRule('altitude_ceiling', (field,), max=cm, action=action)
+
+def altitude_floor(cm: float, field: str = 'tof', action: str = 'hover') -> SafetyRule:
+    """Para no ar abaixo de cm do chão. Ignorada durante o pouso."""
+    return SafetyRule('altitude_floor', (field,), min=cm, action=action, skip_when_landing=True)
+
+def attitude_limit(degrees: float = 60, action: str = 'emergency') -> SafetyRule:
+    """Dispara com |pitch| ou |roll| acima de degrees (desative durante flips)."""
+    return SafetyRule('attitude_limit', ('pitch', 'roll'), max=degrees, action=action, use_abs=True)
+
+class SafetyMonitor:
+    """
+    Intertravamento de segurança avaliado na thread de estado, a cada pacote recebido.
+    Cada regra dispara uma vez ao ser violada e repete a ação a cada repeat_interval enquanto
+    a violação continuar (o UDP pode perder o comando). Depois de um pouso ou emergência,
+    ações menos severas são ignoradas até a próxima decolagem.
+    Args:
+        rules (list, optional): Regras. Padrão: bateria mínima e temperatura máxima.
+        lost_link_timeout (float, optional): Segundos sem pacotes de estado, em voo, para disparar lost_link_action.
+        lost_link_action (str): Ação na perda de link.
+        repeat_interval (float): Intervalo mínimo entre repetições da ação de uma mesma regra.
+        clock (callable): Relógio monotônico em segundos.
+        stop_supported (bool): O drone aceita 'stop' (SDK 2.0). Só então o hover o envia depois do
+            'rc 0 0 0 0'; sem ele, um movimento em andamento termina antes de o drone parar no ar.
+    """
+    def __init__(
+        self,
+        rules: list[SafetyRule] | None = None,
+        lost_link_timeout: float | None = None,
+        lost_link_action: str = 'land',
+        repeat_interval: float = 1.0,
+        clock=time.monotonic,
+        stop_supported: bool = False
+    ) -> None:
+        if lost_link_action not in ACTIONS:
+            raise ValueError(f"Ação inválida '{lost_link_action}'. Use uma de {tuple(ACTIONS)}.")
+        self.rules = list(rules) if rules is not None else [min_battery(), max_temperature()]
+        self.lost_link_timeout = lost_link_timeout
+        self.lost_link_action = lost_link_action
+        self.repeat_interval = repeat_interval
+        self.clock = clock
+        self.stop_supported = stop_supported
+
+        self.active: dict[str, float] = {} # regra -> instante do último disparo
+        self.level = 0 # Maior severidade disparada desde a última decolagem
+        self.landing = False
+        self.airborne = False
+        self.last_packet: float | None = None
+        self.events: deque = deque(maxlen=100)
+
+    def notify_command(self, cmd: str) -> None:
+        """
+        Informa um comando enviado ao drone, para acompanhar decolagem e pouso.
+        Args:
+            cmd (str): Comando enviado.
+        """
+        base = cmd.split()[0] if cmd else ''
+        if base == 'takeoff':
+            self.reset()
+        elif base in ('land', 'emergency'):
+            self.landing = True
+
+    def reset(self) -> None:
+        """Libera as travas (chamado automaticamente na decolagem)."""
+        self.active.clear()
+        self.level = 0
+        self.landing = False
+
+    def evaluate(self, state: dict, received_at: float | None = None) -> list[dict]:
+        """
+        Avalia as regras para um pacote de estado.
+        Args:
+            state (dict): Campos do pacote ({'bat': '80', ...}).
+            received_at (float, optional): Instante em que o pacote chegou. Padrão: agora.
+        Returns:
+            list: Eventos disparados neste pacote (vazio quase sempre).
+        """
+        now = self.clock() if received_at is None else received_at
+        self.last_packet = now
+        self.airborne = self._is_airborne(state)
+        self.active.pop('lost_link', None) # Link voltou
+
+        trips = []
+        for rule in self.rules:
+            if rule.airborne_only and not self.airborne:
+                continue
+            if rule.skip_when_landing and self.landing:
+                continue
+            value = rule.violation(state)
+            if value is None:
+                self.active.pop(rule.name, None)
+                continue
+            limit = rule.max if rule.max is not None and value > rule.max else rule.min
+            event = self._trip(rule.name, rule.action, now, value=value, limit=limit)
+            if event is not None:
+                trips.append(event)
+        return trips
+
+    def check_link(self, now: float | None = None) -> list[dict]:
+        """
+        Verifica a perda de link (chamado quando a leitura do estado expira sem pacotes).
+        Args:
+            now (float, optional): Instante atual. Padrão: agora.
+        Returns:
+            list: Evento de perda de link, se disparou.
+        """
+        if self.lost_link_timeout is None or self.last_packet is None or not self.airborne:
+            return []
+        now = self.clock() if now is None else now
+        silence = now - self.last_packet
+        if silence < self.lost_link_timeout:
+            return []
+        event = self._trip('lost_link', self.lost_link_action, now, value=silence, limit=self.lost_link_timeout)
+        return [event] if event is not None else []
+
+    def _trip(self, name: str, action: str, now: float, **info) -> dict | None:
+        """Aplica a trava e a repetição; retorna o evento se a ação deve ser enviada."""
+        severity, commands = ACTIONS[action]
+        if action == 'hover' and self.stop_supported:
+            commands += (STOP_COMMAND,)
+        if severity < self.level:
+            return None # Já há uma ação mais severa em andamento
+        last = self.active.get(name)
+        if last is not None and now - last < self.repeat_interval:
+            return None
+        self.active[name] = now
+        self.level = severity
+        if action in ('land', 'emergency'):
+            self.landing = True
+        event = {'rule': name, 'action': action, 'commands': commands, 'severity': severity,
+                 'time': now, 'repeat': last is not None, **info}
+        self.events.append(event)
+        return event
+
+    @staticmethod
+    def _is_airborne(state: dict) -> bool:
+        try:
+            return float(state.get('h', 0)) > AIRBORNE_HEIGHT or float(state.get('tof', 0)) > AIRBORNE_TOF
+        except ValueError:
+            return False
@@ -0,0 +1,255 @@
+import json
+import time
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import cv2
+import numpy as np
+
+from .hud import Hud
+
+logger = logging.getLogger(__name__)
+
+BOUNDARY = 'tellozuneframe'
+INDEX_PAGE = b"""<!doctype html>
+<html><head><title>Tello Zune</title></head>
+<body style="margin:0;background:#000">
+<img src="/video.mjpg?hud=1" style="max-width:100%">
+</body></html>
+"""
+
+class StreamServer:
+    """
+    Servidor HTTP local de vídeo MJPEG e telemetria JSON.
+    Cada frame é codificado no máximo uma vez por nível de qualidade (e por HUD ligado/desligado),
+    independente da quantidade de clientes. Clientes lentos recebem sempre o frame mais recente
+    quando ficam prontos: frames intermediários são descartados, nunca acumulados.
+    Rotas: / (página), /video.mjpg?quality=80&hud=1, /frame.jpg, /telemetry.json
+    Args:
+        tello (object, optional): Objeto TelloZune, fonte da telemetria e dos valores do HUD.
+        host (str): Endereço de escuta. Use '0.0.0.0' para servir na rede local.
+        port (int): Porta TCP. 0 escolhe uma porta livre.
+        quality (int): Qualidade JPEG padrão (10~100).
+        hud (Hud, optional): HUD aplicado quando o cliente pede hud=1. Padrão: Hud().
+    """
+    def __init__(
+        self,
+        tello: object | None = None,
+        host: str = '127.0.0.1',
+        port: int = 8080,
+        quality: int = 80,
+        hud: Hud | None = None
+    ) -> None:
+        self.tello = tello
+        self.quality = quality
+        self.hud = hud or Hud()
+
+        # Frame mais recente
+        self.cond = threading.Condition()
+        self.frame: np.ndarray | None = None
+        self.timestamp = 0.0
+        self.seq = 0
+
+        # Cache de codificação: (qualidade, hud) -> (seq, jpeg)
+        self.cache: dict[tuple[int, bool], tuple[int, bytes]] = {}
+        self.cache_locks: dict[tuple[int, bool], threading.Lock] = {}
+        self.cache_lock = threading.Lock()
+        self.hud_lock = threading.Lock()
+        self.encode_count = 0
+
+        # Métricas do próprio servidor
+        self.clients = 0
+        self.fps = 0
+        self.fps_count = 0
+        self.fps_start = time.monotonic()
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Endereço (host, porta) em que o servidor está escutando."""
+        return self.httpd.server_address[:2] # type: ignore[return-value]
+
+    def start(self) -> None:
+        """Inicia o servidor numa thread própria."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self.thread.start()
+            logger.info("Servidor de vídeo em http://%s:%s/", *self.address)
+
+    def stop(self) -> None:
+        """Para o servidor e libera os clientes em espera."""
+        if self.thread is not None:
+            self.httpd.shutdown()
+            self.thread = None
+        self.httpd.server_close()
+        with self.cond:
+            self.seq = -1 # Sinaliza encerramento aos clientes
+            self.cond.notify_all()
+
+    def push_frame(self, frame: np.ndarray, timestamp: float | None = None) -> None:
+        """
+        Publica um novo frame. Não codifica nada: a codificação só acontece se algum cliente pedir.
+        O servidor guarda uma cópia: o mesmo array é entregue ao código do usuário (get_frame), e um
+        overlay desenhado nele vazaria para os fluxos sem HUD ou rasgaria o frame durante a codificação.
+        Args:
+            frame (np.ndarray): Frame BGR (não é alterado).
+            timestamp (float, optional): Instante de captura.
+        """
+        if self.seq < 0:
+            return
+        frame = frame.copy()
+        with self.cond:
+            if self.seq < 0:
+                return
+            self.frame = frame
+            self.timestamp = time.monotonic() if timestamp is None else timestamp
+            self.seq += 1
+            self.cond.notify_all()
+        self.fps_count += 1
+        elapsed = time.monotonic() - self.fps_start
+        if elapsed >= 1:
+            self.fps = int(self.fps_count / elapsed)
+            self.fps_count = 0
+            self.fps_start = time.monotonic()
+
+    def wait_frame(self, last_seq: int, timeout: float = 1.0) -> int:
+        """
+        Espera um frame mais novo que last_seq.
+        Returns:
+            int: Seq do frame mais recente (igual a last_seq se o tempo acabar; -1 se o servidor parou).
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq != last_seq, timeout)
+            return self.seq
+
+    def get_jpeg(self, quality: int | None = None, hud: bool = False) -> tuple[int, bytes] | None:
+        """
+        Retorna o frame mais recente codificado em JPEG, codificando no máximo uma vez por frame.
+        Args:
+            quality (int, optional): Qualidade JPEG. Padrão: a do servidor.
+            hud (bool): Se True, aplica o HUD numa cópia do frame antes de codificar.
+        Returns:
+            tuple | None: (seq, jpeg), ou None se ainda não há frames.
+        """
+        quality = max(10, min(100, int(quality or self.quality)))
+        key = (quality, hud)
+        with self.cache_lock:
+            lock = self.cache_locks.setdefault(key, threading.Lock())
+        with lock:
+            with self.cond:
+                frame, seq = self.frame, self.seq
+            if frame is None:
+                return None
+            cached = self.cache.get(key)
+            if cached is not None and cached[0] == seq:
+                return cached
+            if hud:
+                frame = self._apply_hud(frame.copy())
+            ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+            if not ok:
+                return None
+            self.cache[key] = (seq, buf.tobytes())
+            self.encode_count += 1
+            return self.cache[key]
+
+    def telemetry(self) -> dict:
+        """
+        Retorna a telemetria servida em /telemetry.json.
+        Returns:
+            dict: {'state': campos do drone, 'frame_seq', 'frame_age', 'stream_fps', 'clients'}
+        """
+        state = self.tello.get_state() if self.tello is not None else {} # type: ignore[attr-defined]
+        return {
+            'state': state,
+            'frame_seq': self.seq,
+            'frame_age': time.monotonic() - self.timestamp if self.seq > 0 else None,
+            'stream_fps': self.fps,
+            'clients': self.clients,
+        }
+
+    def _apply_hud(self, frame: np.ndarray) -> np.ndarray:
+        """Atualiza o HUD com a telemetria e o aplica no frame."""
+        values = {'fps': self.fps}
+        if self.tello is not None:
+            keys = ('bat', 'tof', 'temph', 'baro', 'time')
+            values.update(zip(keys, self.tello.get_info())) # type: ignore[attr-defined]
+        with self.hud_lock:
+            self.hud.update(values)
+            return self.hud.apply(frame)
+
+    def _make_handler(self) -> type:
+        """Cria a classe de handler HTTP ligada a este servidor."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                try:
+                    quality = int(query.get('quality', [server.quality])[0])
+                except ValueError:
+                    quality = server.quality
+                hud = query.get('hud', ['0'])[0] in ('1', 'true')
+                try:
+                    if url.path == '/':
+                        self._send(200, 'text/html; charset=utf-8', INDEX_PAGE)
+                    elif url.path == '/video.mjpg':
+                        self._stream(quality, hud)
+                    elif url.path == '/frame.jpg':
+                        item = server.get_jpeg(quality, hud)
+                        if item is None:
+                            self._send(503, 'text/plain', b'sem frames')
+                        else:
+                            self._send(200, 'image/jpeg', item[1])
+                    elif url.path == '/telemetry.json':
+                        self._send(200, 'application/json', json.dumps(server.telemetry()).encode('utf-8'))
+                    else:
+                        self._send(404, 'text/plain', b'nao encontrado')
+                except (BrokenPipeError, ConnectionResetError):
+                    pass # Cliente desconectou
+
+            def _send(self, code: int, content_type: str, body: bytes) -> None:
+                self.send_response(code)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _stream(self, quality: int, hud: bool) -> None:
+                self.send_response(200)
+                self.send_header('Content-Type', f'multipart/x-mixed-replace; boundary={BOUNDARY}')
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                with server.cache_lock:
+                    server.clients += 1
+                try:
+                    last_seq = 0
+                    while True:
+                        seq = server.wait_frame(last_seq)
+                        if seq < 0:
+                            return
+                        if seq == last_seq:
+                            continue
+                        item = server.get_jpeg(quality, hud)
+                        if item is None:
+                            continue
+                        last_seq, jpeg = item
+                        # Escrita bloqueante: enquanto o cliente está lento, frames novos só substituem o anterior
+                        self.wfile.write(
+                            f'--{BOUNDARY}\r\nContent-Type: image/jpeg\r\nContent-Length: {len(jpeg)}\r\n\r\n'.encode('ascii')
+                        )
+                        self.wfile.write(jpeg)
+                        self.wfile.write(b'\r\n')
+                finally:
+                    with server.cache_lock:
+                        server.clients -= 1
+
+            def log_message(self, format: str, *args) -> None:
+                pass # Não polui o terminal com cada requisição
+
+        return Handler
@@ -0,0 +1,121 @@
+import numpy as np
+
+# Campos do pacote de estado guardados por padrão (ângulos em graus, velocidades em dm/s, distâncias em cm)
+DEFAULT_FIELDS = ('pitch', 'roll', 'yaw', 'vgx', 'vgy', 'vgz', 'tof', 'h', 'agx', 'agy', 'agz')
+ANGLE_FIELDS = ('yaw',) # Interpolados pelo menor arco (-180~180)
+
+class TelemetryBuffer:
+    """
+    Histórico do estado indexado pelo tempo, para alinhar cada frame com a telemetria do seu instante.
+    A thread de estado converte cada pacote uma única vez (push); as consultas usam busca binária
+    (np.searchsorted) e interpolação vetorizada sobre todos os campos de uma vez.
+    Há um único escritor: cada amostra é gravada em duas posições de um anel duplicado, então a janela
+    das últimas amostras é sempre contígua (a contagem só é publicada depois da amostra escrita).
+    O anel tem uma posição a mais que a capacidade e a janela a deixa de fora: é nela que o próximo push
+    escreve, então um leitor sem lock nunca vê uma amostra pela metade. Uma leitura que atravesse dois
+    ou mais pushes (~0.2 s a 10 Hz) pode ver amostras sobrescritas; interpolate detecta isso pela
+    contagem e refaz a leitura.
+    Args:
+        fields (tuple): Campos do estado guardados.
+        capacity (int): Quantidade de amostras mantidas (256 a ~10 Hz = ~25 s).
+    """
+    def __init__(self, fields: tuple[str, ...] = DEFAULT_FIELDS, capacity: int = 256) -> None:
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self.slots = capacity + 1 # Posição extra: a do próximo push, fora da janela dos leitores
+        self.times = np.zeros(2 * self.slots, dtype=np.float64)
+        self.values = np.zeros((2 * self.slots, len(self.fields)), dtype=np.float64)
+        self.angle_mask = np.array([f in ANGLE_FIELDS for f in self.fields])
+        self.count = 0
+
+    def push(self, timestamp: float, state: dict) -> None:
+        """
+        Registra um pacote de estado (chamado pela thread de estado).
+        Args:
+            timestamp (float): Instante de recebimento (time.monotonic).
+            state (dict): Campos do pacote ({'pitch': '1', ...}); campos ausentes repetem o valor anterior.
+        """
+        i = self.count % self.slots
+        row = np.empty(len(self.fields))
+        previous = self.values[(self.count - 1) % self.slots] if self.count else None
+        for j, name in enumerate(self.fields):
+            try:
+                row[j] = float(state[name])
+            except (KeyError, ValueError):
+                row[j] = previous[j] if previous is not None else 0.0
+        self.times[i] = self.times[i + self.slots] = timestamp
+        self.values[i] = self.values[i + self.slots] = row
+        self.count += 1 # Publica a amostra
+
+    def _window(self, n: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna as últimas amostras em ordem crescente de tempo (vistas, sem cópia).
+        A janela termina antes das posições do próximo push ((n % slots) e (n % slots) + slots).
+        Args:
+            n (int, optional): Contagem lida pelo leitor. Padrão: a atual.
+        """
+        n = self.count if n is None else n
+        if n <= self.capacity:
+            return self.times[:n], self.values[:n]
+        start = (n - self.capacity) % self.slots
+        return self.times[start:start + self.capacity], self.values[start:start + self.capacity]
+
+    def interpolate(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Interpola todos os campos em vários instantes de uma vez.
+        Fora do intervalo guardado, usa a amostra mais próxima (não extrapola).
+        Args:
+            timestamps (np.ndarray): Instantes (time.monotonic).
+        Returns:
+            np.ndarray: Matriz (len(timestamps), len(fields)).
+        """
+        ts = np.atleast_1d(np.asarray(timestamps, dtype=np.float64))
+        while True:
+            n = self.count
+            out = self._interpolate(self._window(n), ts)
+            if self.count - n <= 1: # Um único push não toca a janela lida
+                return out
+
+    def _interpolate(self, window: tuple[np.ndarray, np.ndarray], ts: np.ndarray) -> np.ndarray:
+        """Interpola os instantes ts numa janela (times, values); o resultado não compartilha memória com ela."""
+        times, values = window
+        if len(times) == 0:
+            return np.full((len(ts), len(self.fields)), np.nan)
+        if len(times) == 1:
+            return np.repeat(values[:1], len(ts), axis=0)
+        idx = np.clip(np.searchsorted(times, ts), 1, len(times) - 1)
+        t0, t1 = times[idx - 1], times[idx]
+        v0, v1 = values[idx - 1], values[idx]
+        span = t1 - t0
+        w = np.clip(np.divide(ts - t0, span, out=np.zeros_like(ts), where=span > 0), 0.0, 1.0)[:, None]
+        delta = v1 - v0
+        if self.angle_mask.any(): # Menor arco entre dois ângulos (ex: 179 -> -179 passa por 180)
+            delta[:, self.angle_mask] = (delta[:, self.angle_mask] + 180.0) % 360.0 - 180.0
+        out = v0 + delta * w
+        if self.angle_mask.any():
+            out[:, self.angle_mask] = (out[:, self.angle_mask] + 180.0) % 360.0 - 180.0
+        return out
+
+    def at(self, timestamp: float) -> dict[str, float]:
+        """
+        Estado interpolado num instante.
+        Args:
+            timestamp (float): Instante (time.monotonic), ex: o instante de captura de um frame.
+        Returns:
+            dict: {campo: valor} e 'timestamp'; vazio se ainda não há amostras.
+        """
+        if self.count == 0:
+            return {}
+        row = self.interpolate(np.array([timestamp]))[0]
+        state = dict(zip(self.fields, row.tolist()))
+        state['timestamp'] = timestamp
+        return state
+
+    def latest(self) -> dict[str, float]:
+        """Última amostra registrada (sem interpolação)."""
+        if self.count == 0:
+            return {}
+        i = (self.count - 1) % self.slots
+        state = dict(zip(self.fields, self.values[i].tolist()))
+        state['timestamp'] = float(self.times[i])
+        return state
@@ -1,33 +1,240 @@
 import time
+import logging
 import threading
-import numpy as np
 import socket
-import cv2
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from queue import Queue, Empty
+from typing import TYPE_CHECKING
+
+from .log import ensure_logging
+from .metrics import MetricsRegistry, MetricsServer # O http.server só é importado ao iniciar o servidor
+from .route import RouteError, RoutePlan, compile_route
+from .safety import ACTIONS, SafetyMonitor, SafetyRule
+from .timeouts import TimeoutModel
+from .link import KEEPALIVE_CMD, LinkMonitor
+from .clock import Clock
+from .timebase import Stamp, StreamSequence
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .mission import Mission
+    from .relay import StateRelay
+
+logger = logging.getLogger(__name__)
+
+# OpenCV e NumPy só são carregados quando o vídeo é usado (ver _load_video_stack),
+# então o modo somente telemetria (video=False) roda apenas com a biblioteca padrão.
+# Missões e relay também são importados só quando usados (load_mission, start_relay).
+cv2 = None
+np = None
+VideoFrame = None
+open_decoder = None
+
+def _load_video_stack() -> None:
+    """Importa OpenCV e NumPy (e os decodificadores) na primeira vez que o vídeo é usado."""
+    global cv2, np, VideoFrame, open_decoder
+    if cv2 is None:
+        import cv2 as _cv2
+        import numpy as _np
+        from . import video as _video
+        cv2, np = _cv2, _np
+        VideoFrame, open_decoder = _video.VideoFrame, _video.open_decoder
 
 class SafeThread(threading.Thread):
     """
     Thread cíclica segura, com evento de parada.
     Target deve ser uma callable sem argumentos.
+    Com instrument=True mede cada iteração: tempo ocupado (CPU da thread) e bloqueado (espera).
+    Exceções são sempre contadas, inclusive as tratadas pelo próprio target via record_exception.
+    Args:
+        target (callable): Função executada a cada iteração.
+        name (str, optional): Nome da thread.
+        instrument (bool): Se True, coleta tempos por iteração.
     """
-    def __init__(self, target):
-        threading.Thread.__init__(self)
+    EXCEPTION_RATE_WINDOW = 60.0 # Janela (s) da taxa de exceções
+
+    def __init__(self, target, name: str | None = None, instrument: bool = False):
+        threading.Thread.__init__(self, name=name)
         self.daemon = True
         self.target = target
         self.stop_ev = threading.Event()
+        self.instrument = instrument
+
+        # Estatísticas
+        self.iterations = 0 # Todas as iterações, com ou sem instrumentação
+        self.timed_iterations = 0 # Iterações medidas (base das médias de tempo)
+        self.busy_time = 0.0
+        self.wall_time = 0.0
+        self.max_iteration = 0.0
+        self.exceptions = 0 # Total, sem limite
+        # Exceções por segundo da janela da taxa: [segundo, contagem]; o número de buckets é limitado, a contagem não
+        self.exception_buckets: deque[list[int]] = deque(maxlen=int(self.EXCEPTION_RATE_WINDOW) + 1)
+        self.last_exception = ''
+
+        # Gancho de amostragem
+        self.hook = None
+        self.hook_every = 0
+        self.profiler = None
+        self.profile_every = 0
 
     def stop(self):
         self.stop_ev.set()
 
     def run(self):
         while not self.stop_ev.is_set():
+            if not (self.instrument or self.hook or self.profiler):
+                self._call()
+                continue
+            self._instrumented_call()
+
+    def _call(self) -> None:
+        try:
             self.target()
+        except Exception as e:
+            self.record_exception(e)
+            raise
+        finally:
+            self.iterations += 1
+
+    def _instrumented_call(self) -> None:
+        """Executa uma iteração medindo tempos e acionando os ganchos de amostragem."""
+        n = self.iterations + 1 # Número desta iteração (_call incrementa iterations)
+        profiler = self.profiler if self.profile_every and n % self.profile_every == 0 else None
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:
+                profiler = None # Outro perfilador ativo no processo; pula esta amostra
+        wall0 = time.perf_counter()
+        cpu0 = time.thread_time()
+        try:
+            self._call()
+        finally:
+            cpu = time.thread_time() - cpu0
+            wall = time.perf_counter() - wall0
+            if profiler is not None:
+                profiler.disable()
+            self.timed_iterations += 1
+            self.busy_time += cpu
+            self.wall_time += wall
+            if wall > self.max_iteration:
+                self.max_iteration = wall
+        if self.hook is not None and self.hook_every and n % self.hook_every == 0:
+            try:
+                self.hook(self, self.stats())
+            except Exception as e:
+                logger.warning("Erro no gancho da thread %s: %s", self.name, e)
+
+    def record_exception(self, e: Exception) -> None:
+        """
+        Conta uma exceção ocorrida no laço (chamado também pelos handlers dos targets).
+        Args:
+            e (Exception): Exceção capturada.
+        """
+        self.exceptions += 1
+        second = int(time.monotonic())
+        buckets = self.exception_buckets
+        if buckets and buckets[-1][0] == second:
+            buckets[-1][1] += 1
+        else:
+            buckets.append([second, 1])
+        self.last_exception = repr(e)
+
+    def set_hook(self, hook, every: int = 100) -> None:
+        """
+        Define um gancho chamado a cada N iterações com as estatísticas da thread.
+        Args:
+            hook (callable): Função hook(thread, stats). None remove o gancho.
+            every (int): Intervalo em iterações.
+        """
+        self.hook_every = max(1, int(every))
+        self.hook = hook
+
+    def enable_profiling(self, every: int = 100) -> None:
+        """
+        Perfila com cProfile uma iteração a cada N; os resultados acumulam em profile_stats().
+        Args:
+            every (int): Intervalo em iterações.
+        """
+        import cProfile
+        self.profile_every = max(1, int(every))
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+
+    def disable_profiling(self) -> None:
+        """Para de perfilar (as amostras já coletadas são mantidas)."""
+        self.profile_every = 0
+
+    def profile_stats(self):
+        """
+        Retorna as amostras do cProfile.
+        Returns:
+            pstats.Stats | None: Estatísticas, ou None se o perfilador nunca foi ativado.
+        """
+        if self.profiler is None:
+            return None
+        import pstats
+        return pstats.Stats(self.profiler)
+
+    def stats(self) -> dict:
+        """
+        Retorna as estatísticas do laço.
+        Returns:
+            dict: iterations, busy_s, blocked_s, busy_ratio, avg_iteration_ms, max_iteration_ms,
+                exceptions, exception_rate (por segundo, na última janela), last_exception, alive.
+        """
+        now = time.monotonic()
+        recent = sum(c for second, c in list(self.exception_buckets) if now - second <= self.EXCEPTION_RATE_WINDOW)
+        timed = self.timed_iterations
+        return {
+            'iterations': self.iterations,
+            'busy_s': self.busy_time,
+            'blocked_s': max(self.wall_time - self.busy_time, 0.0),
+            'busy_ratio': self.busy_time / self.wall_time if self.wall_time > 0 else 0.0,
+            'avg_iteration_ms': self.wall_time / timed * 1000 if timed else 0.0,
+            'max_iteration_ms': self.max_iteration * 1000,
+            'exceptions': self.exceptions,
+            'exception_rate': recent / self.EXCEPTION_RATE_WINDOW,
+            'last_exception': self.last_exception,
+            'alive': self.is_alive(),
+        }
+
+@dataclass
+class ReadinessReport:
+    """
+    Resultado de start_tello: conexão e tempo de cada fase da inicialização.
+    Avalia como True se o drone conectou, como o antigo retorno booleano.
+    Attributes:
+        connected (bool): True se o drone respondeu ao comando 'command'.
+        phases (dict): Segundos desde o início até cada fase ('connect', 'video_open',
+            'first_state', 'first_frame'); None se a fase não concluiu dentro do tempo.
+        total (float): Duração total de start_tello em segundos.
+    """
+    connected: bool = False
+    phases: dict[str, float | None] = field(default_factory=dict)
+    total: float = 0.0
+
+    def __bool__(self) -> bool:
+        return self.connected
+
+    @property
+    def complete(self) -> bool:
+        """True se todas as fases concluíram."""
+        return self.connected and all(t is not None for t in self.phases.values())
 
 class TelloZune:
     """
     Classe para controlar e se comunicar com o drone DJI Tello.
     Args:
         text_input (bool, optional): Se True, aceita comandos de texto via terminal. Padrão: False.
+        video (bool, optional): Se False, start_tello não inicia o vídeo e OpenCV/NumPy nunca são
+            importados (modo somente telemetria e comandos). Padrão: True.
+        video_backend (str, optional): Decodificador do vídeo: 'pyav' (frames YUV, luminância sem conversão),
+            'opencv' (cv2.VideoCapture) ou 'auto' (PyAV se estiver instalado). Padrão: 'auto'.
+        clock (Clock, optional): Relógio de toda a temporização (instantes, esperas, pausas e 'delay').
+            Use clock.VirtualClock para rodar agendas longas em segundos nos testes. Padrão: tempo real.
     """
     def __init__(
         self,
@@ -35,13 +242,20 @@ class TelloZune:
         UDPPORT: int = 8889,
         VIDEO_SOURCE: str = "udp://@0.0.0.0:11111",
         UDPSTATEPORT: int = 8890,
-        text_input: bool = False
+        text_input: bool = False,
+        video: bool = True,
+        clock: Clock | None = None,
+        video_backend: str = 'auto'
     ) -> None:
+        self.clock = clock or Clock()
+
         # Endereços UDP
+        ensure_logging() # Só um NullHandler: a saída é da aplicação (logging do Python ou log.configure_logging)
         self.localaddr = ('', UDPPORT)
         self.telloaddr = (TELLOIP, UDPPORT)
         self.stateaddr = ('', UDPSTATEPORT)
         self.video_source = VIDEO_SOURCE
+        self.video_backend = video_backend
 
         # Estado interno
         self.fps = 0
@@ -49,7 +263,7 @@ class TelloZune:
         self.is_route_active = False
         self.state_value: list[str] = []
         self.image_size: tuple[int, int] = (960, 720)
-        self.start_time = time.time()
+        self.start_time = self.clock.monotonic()
         self.num_frames = 0
         self.elapsed_time = 0
         self.last_rc_control_timestamp = 0
@@ -59,21 +273,76 @@ class TelloZune:
 
         # Fila de frames
         self.q = Queue(maxsize=1)
-        self.frame = None
+        self.video_frame = None # VideoFrame mais recente (a conversão para BGR só ocorre se alguém pedir)
+        self.frame_timestamp = 0.0 # Instante de captura (clock.monotonic) do último frame entregue
+        self.frame_stamp: Stamp | None = None # Sequência e instante (ns) do último frame entregue
+        self.VIDEO_RETRY_INTERVAL = 0.5 # Espera entre tentativas de abrir o vídeo
+        self.frame_bus = None # FramePublisher, para consumidores em outros processos
+        self.stream_server = None # StreamServer, vídeo MJPEG e telemetria via HTTP
+        self.mission = None # Mission carregada por load_mission
+        self.safety: SafetyMonitor | None = None # Intertravamento de segurança (enable_safety)
+        self.timeouts = TimeoutModel() # Timeouts por comando, aprendidos do RTT e da duração dos movimentos
+        self.link = LinkMonitor(self.timeouts.rtt, clock=self.clock.monotonic) # Saúde do link e keep alive fora da fila de comandos
+        self.telemetry = None # TelemetryBuffer, histórico do estado para alinhar com os frames (enable_telemetry_buffer)
+        self.relay: 'StateRelay | None' = None # Republica estado e respostas para outros processos (start_relay)
+        self.relay_responses = False
 
         # Fila de comandos
         self.command_queue: Queue[str] = Queue()
         self.command_events: dict[str, threading.Event] = {}
         self.current_command = None
         self.cmd_lock = threading.Lock()
+        self.cmd_aborts = 0 # Ações de segurança enviadas; invalidam a resposta do comando em andamento
+
+        # Base de tempo única (clock.monotonic_ns, carimbada no recebimento) e sequência de cada fluxo
+        self.streams = {
+            'cmd': StreamSequence('cmd'), # Comandos enviados
+            'response': StreamSequence('response'), # Respostas recebidas na porta de comando
+            'state': StreamSequence('state', interval=0.1), # Estado a 10 Hz
+            'video': StreamSequence('video', interval=1 / 30), # Frames a 30 FPS
+        }
+        self.cmd_stamp: Stamp | None = None # Último comando enviado
+        self.response_stamp: Stamp | None = None # Última resposta recebida
+        self.state_stamp: Stamp | None = None # Último pacote de estado recebido
+        self.rc_frame_seq = 0 # Frame que originou o último rc medido (latência frame -> rc)
+        self.last_control_latency: float | None = None
+
+        # Métricas (ver metrics()); as séries usadas nos caminhos quentes ficam em atributos
+        self.metrics_registry = MetricsRegistry()
+        self.metrics_server = None
+        reg = self.metrics_registry
+        self._m_cmd_timeouts = reg.counter('tello_command_timeouts_total', 'Comandos sem resposta dentro do timeout')
+        self._m_cmd_aborted = reg.counter('tello_command_aborted_total', 'Comandos interrompidos por uma ação de segurança')
+        self._m_state_packets = reg.counter('tello_state_packets_total', 'Pacotes de estado recebidos')
+        self._m_frames = reg.counter('tello_frames_total', 'Frames decodificados')
+        self._m_frames_dropped = reg.counter('tello_frames_dropped_total', 'Frames descartados com a fila de frames cheia')
+        self._m_video_reopens = reg.counter('tello_video_reopens_total', 'Decodificadores de vídeo reabertos após falha de leitura')
+        self._m_frame_to_rc = reg.histogram(
+            'tello_frame_to_rc_seconds', 'Latência entre a captura do frame e o primeiro rc enviado a partir dele',
+            buckets=(0.01, 0.02, 0.033, 0.05, 0.075, 0.1, 0.15, 0.25, 0.5, 1.0)
+        )
+        for name, stream in self.streams.items():
+            reg.gauge('tello_stream_seq', 'Última sequência de cada fluxo', {'stream': name},
+                      fn=lambda stream=stream: stream.last.seq if stream.last is not None else 0)
+            reg.gauge('tello_stream_missed', 'Itens perdidos estimados pelas lacunas de cada fluxo', {'stream': name},
+                      fn=lambda stream=stream: stream.missed)
+        reg.gauge('tello_command_queue_depth', 'Comandos aguardando na fila', fn=self.command_queue.qsize)
+        reg.gauge('tello_video_fps', 'FPS medido por calc_fps', fn=lambda: self.fps)
+        reg.gauge('tello_link_quality', 'Qualidade do link (0~1)', fn=lambda: self.link.quality())
+        reg.gauge('tello_link_rtt_seconds', 'RTT suavizado dos comandos', fn=lambda: self.link.rtt.srtt or 0.0)
+        reg.gauge('tello_link_command_loss_ratio', 'Fração estimada de comandos sem resposta', fn=lambda: self.link.cmd_loss)
+        reg.gauge('tello_link_state_loss_ratio', 'Fração estimada de pacotes de estado perdidos', fn=lambda: self.link.state_loss)
 
         # Eventos e contadores
         self.cmd_recv_ev = threading.Event()
         self.timer_ev = threading.Event()
+        self.state_ev = threading.Event() # Primeiro pacote de estado recebido
+        self.video_open_ev = threading.Event() # Captura de vídeo aberta
+        self.frame_ev = threading.Event() # Primeiro frame decodificado
+        self.phase_times: dict[str, float] = {} # Instante (clock.monotonic) de cada fase da inicialização
         self.cmd_count = 1
         self.state_count = 1
-        self.event_list: list[dict] = []
-        self.event_list.append({'commands': ['command'], 'period': 100, 'interval': 0, 'info': 'keep alive'})
+        self.event_list: list[dict] = [] # Eventos periódicos (o keep alive é feito pelo LinkMonitor)
         self.state_list = [
             {'state': 'bat',    'period': 200, 'info': 'Porcentagem de bateria', 'val': '80'},
             {'state': 'tof',    'period': 25,  'info': 'Altura em cm',           'val': '10'},
@@ -89,15 +358,16 @@ class TelloZune:
         self.sock_state.bind(self.stateaddr)
 
         # Threads cíclicas seguras
-        self.receiverThread = SafeThread(target=self._response_cmd_receive) # Thread de resposta de comando
-        self.periodicCmdThread = SafeThread(target=self._periodic_cmd) # Thread de comandos periódicos
-        self.videoThread = SafeThread(target=self._video) # Thread de vídeo
-        self.stateThread = SafeThread(target=self._state_receive) # Thread de estado
-        self.movesThread = SafeThread(target=self._read_queue) # Thread de movimentos
-        self.textInputThread = SafeThread(target=self._text_input) # Thread de entrada de texto pelo terminal
+        self.receiverThread = SafeThread(target=self._response_cmd_receive, name='cmd_receive') # Thread de resposta de comando
+        self.periodicCmdThread = SafeThread(target=self._periodic_cmd, name='periodic') # Thread de comandos periódicos
+        self.videoThread = SafeThread(target=self._video, name='video') # Thread de vídeo
+        self.stateThread = SafeThread(target=self._state_receive, name='state') # Thread de estado
+        self.movesThread = SafeThread(target=self._read_queue, name='moves') # Thread de movimentos
+        self.textInputThread = SafeThread(target=self._text_input, name='text_input') # Thread de entrada de texto pelo terminal
 
         # Inicialização
         self.enable_text_input = text_input
+        self.enable_video = video
 
     def _execute_route(self, commands: list, interval: int=0) -> None:
         """
@@ -109,54 +379,91 @@ class TelloZune:
         self.is_route_active = True
         try:
             for i, cmd in enumerate(commands):
-                print(f"Executando passo {i + 1}/{len(commands)} da rota: '{cmd}'")
+                logger.info("Executando passo %d/%d da rota: '%s'", i + 1, len(commands), cmd)
                 self.add_command(cmd)
 
                 # Se não for o último comando e houver intervalo, manda o comando "delay"
                 if i < len(commands) - 1 and interval > 0:
                     self.add_command(f"delay {interval}")
         except Exception as e:
-            print(f"Erro ao executar a rota: {e}")
+            logger.error("Erro ao executar a rota: %s", e)
         finally:
             # Garante que a flag seja liberada, mesmo que ocorra um erro
-            print("Rota finalizada.")
+            logger.info("Rota finalizada.")
             self.is_route_active = False
 
     def _video(self) -> None:
-        """Thread de vídeo."""
+        """Thread de vídeo. Abre a captura na primeira execução, sem bloquear quem chamou start_video."""
         try:
-            if self.video is not None:
-                ret, frame = self.video.read()
-                if ret:
-                    frame = cv2.resize(frame, self.image_size)
-                    self.frame = frame
-                    if not self.q.full():
-                        self.q.put(frame)
+            _load_video_stack()
+            if self.video is None:
+                self._open_video()
+                return
+            ret, frame = self.video.read()
+            if ret:
+                stamp = self.streams['video'].stamp(self.clock.monotonic_ns()) # Instante de captura do frame
+                timestamp = stamp.seconds
+                if not isinstance(frame, VideoFrame): # cv2.VideoCapture entrega BGR
+                    frame = VideoFrame(bgr=frame)
+                frame = frame.resized(self.image_size) # Sem cópia se o tamanho já confere
+                self.video_frame = frame
+                self._m_frames.inc()
+                if not self.q.full():
+                    self.q.put((frame, stamp))
+                else:
+                    self._m_frames_dropped.inc()
+                # Consumidores de cor forçam a conversão (uma única vez por frame)
+                if self.frame_bus is not None:
+                    self.frame_bus.publish(frame.bgr, timestamp)
+                if self.stream_server is not None:
+                    self.stream_server.push_frame(frame.bgr, timestamp)
+                if not self.frame_ev.is_set():
+                    self._mark_phase('first_frame', self.frame_ev)
             else:
-                print("Erro: self.video é None, não é possível ler o frame.")
+                # Decodificador encerrado (fim ou falha do stream): reabre na próxima iteração
+                logger.warning("Erro: leitura do vídeo falhou, reabrindo o decodificador...")
+                self._m_video_reopens.inc()
+                video, self.video = self.video, None
+                video.release()
         except Exception as e:
-            print(f"Erro na thread de vídeo: {e}")
+            self._thread_error('video', "Erro na thread de vídeo", e)
 
-    def _periodic_cmd(self) -> None:
+    def _open_video(self) -> None:
+        """Abre a captura do vídeo (bloqueia até o FFmpeg receber o início do stream)."""
+        video = open_decoder(self.video_source, self.video_backend)
+        if video.isOpened():
+            self.video = video
+            self._mark_phase('video_open', self.video_open_ev)
+        else:
+            logger.warning("Erro: não foi possível abrir o vídeo, tentando novamente...")
+            self.videoThread.stop_ev.wait(self.VIDEO_RETRY_INTERVAL)
+
+    def _thread_error(self, thread: str, message: str, e: Exception) -> None:
         """
-        Thread que verifica e dispara eventos periódicos.
-        Ignora o 'keep alive' se outra atividade estiver próxima.
+        Registra uma exceção capturada no laço de uma thread.
+        Args:
+            thread (str): Nome curto da thread (rótulo da métrica).
+            message (str): Mensagem exibida.
+            e (Exception): Exceção capturada.
         """
-        try:
-            cycles_to_next_activity = float('inf') # Ciclos até a próxima atividade programada
-            KEEPALIVE_CMD = 'command'
-            KEEPALIVE_THRESHOLD_CYCLES = 150 # Limite de 15 segundos = 150 ciclos de 0.1s
+        self.metrics_registry.counter('tello_thread_errors_total', 'Exceções capturadas nos laços das threads', {'thread': thread}).inc()
+        current = threading.current_thread()
+        if isinstance(current, SafeThread):
+            current.record_exception(e)
+        logger.error(f"{message}: %s", e, extra={'fields': {'thread': thread, 'error': type(e).__name__}})
 
-            for ev in self.event_list: # Calcula o tempo até a próxima atividade programada
-                if 'commands' in ev and ev['commands'] == [KEEPALIVE_CMD]: # Ignora o próprio evento 'keep alive' nesta verificação
-                    continue
+    def _mark_phase(self, name: str, event: threading.Event) -> None:
+        """Registra o instante de uma fase da inicialização e sinaliza seu evento."""
+        self.phase_times.setdefault(name, self.clock.monotonic())
+        event.set()
 
-                if 'period' in ev:
-                    period = int(ev['period'])
-                    # Calcula quantos ciclos faltam para a próxima execução deste evento
-                    cycles_left = period - (self.cmd_count % period)
-                    if cycles_left < cycles_to_next_activity:
-                        cycles_to_next_activity = cycles_left
+    def _periodic_cmd(self) -> None:
+        """
+        Thread que verifica e dispara eventos periódicos e cuida do link:
+        envia o keep alive só quando nada foi enviado ao drone recentemente.
+        """
+        try:
+            self._link_tick()
 
             for ev in self.event_list: # Verifica cada evento na lista
                 if 'period' not in ev or 'commands' not in ev:
@@ -164,15 +471,14 @@ class TelloZune:
                 period = int(ev['period'])
 
                 if self.cmd_count % period == 0: # Verifica se é a hora de executar este evento
-                    is_keep_alive_event = (ev['commands'] == [KEEPALIVE_CMD])
-                    # Lógica para ignorar o 'keep alive' se outra atividade estiver próxima
-                    if is_keep_alive_event and cycles_to_next_activity <= KEEPALIVE_THRESHOLD_CYCLES:
-                        continue # Pula a execução deste evento
+                    if self.safety is not None and self.safety.level >= ACTIONS['land'][0]:
+                        continue # Pouso ou emergência de segurança em andamento: não dispara rotas
 
                     # Execução normal
                     # Trata como rota se tiver mais de um comando, nenhuma rota estiver ativa e o intervalo for maior que 0
                     if len(ev['commands']) > 1 and not self.is_route_active and ev['interval'] > 0:
-                        print(f"Disparando rota periódica: {ev.get('info', 'N/A')}")
+                        logger.info("Disparando rota periódica: %s", ev.get('info', 'N/A'))
+                        self.is_route_active = True # Marca antes de iniciar a thread, como em run_route
                         threading.Thread(
                             target=self._execute_route,
                             args=(ev['commands'], ev.get('interval')),
@@ -184,35 +490,164 @@ class TelloZune:
                         cmd = ev['commands'][0]
                         self.add_command(cmd)
 
-            self.timer_ev.wait(0.1)
+            self.clock.wait(self.timer_ev, 0.1)
             self.cmd_count += 1
 
         except Exception as e:
-            print(f"Erro na thread de comandos periódicos: {e}")
-            time.sleep(1)
+            self._thread_error('periodic', "Erro na thread de comandos periódicos", e)
+            self.clock.sleep(1)
+
+    def _link_tick(self) -> None:
+        """Envia o keep alive se o link estiver ocioso e registra mudanças na qualidade do link."""
+        now = self.clock.monotonic()
+        if self.link.keepalive_due(now) and not self.cmd_lock.locked():
+            threading.Thread(target=self._keepalive, daemon=True).start()
+        change = self.link.update_status(now)
+        if change is not None:
+            snap = self.link.snapshot(now)
+            log = logger.info if change[1] == 'good' else logger.warning
+            log("Link: %s -> %s (qualidade %.2f)", change[0], change[1], snap['quality'], extra={'fields': {
+                'srtt_ms': None if snap['srtt'] is None else round(snap['srtt'] * 1000, 1),
+                'cmd_loss': round(snap['cmd_loss'], 3),
+                'state_loss': round(snap['state_loss'], 3),
+            }})
+
+    def _keepalive(self) -> None:
+        """Envia o keep alive direto pelo socket de comando (fora da command_queue); a resposta alimenta o RTT."""
+        if not self.link.probe_lock.acquire(blocking=False):
+            return
+        try:
+            self.link.keepalives += 1
+            self.send_cmd_return(KEEPALIVE_CMD, timeout=self.timeouts.rtt.rto)
+        finally:
+            self.link.probe_lock.release()
+
+    def link_quality(self) -> float:
+        """
+        Retorna a qualidade do link, de 0 (perdido) a 1, a partir do RTT, das perdas e da chegada do estado.
+        Detalhes em self.link.snapshot().
+        Returns:
+            float: Qualidade do link.
+        """
+        return self.link.quality()
 
     def _response_cmd_receive(self) -> None:
         """Recebe strings de resposta de comando via socket UDP."""
         try:
             data, _ = self.sock_cmd.recvfrom(2048)
+            stamp = self.response_stamp = self.streams['response'].stamp(self.clock.monotonic_ns())
+            self.link.record_receive(stamp.seconds)
             self.udp_cmd_ret = data.decode("utf-8")
             self.cmd_recv_ev.set()
+            relay = self.relay
+            if relay is not None and self.relay_responses:
+                relay.publish_response(stamp.seconds, self.udp_cmd_ret)
         except Exception as e:
-            print(f"Erro na thread de recebimento de comando: {e}")
+            self._thread_error('cmd_receive', "Erro na thread de recebimento de comando", e)
 
     def _state_receive(self) -> None:
         """Recebe strings de estado via socket UDP e atualiza state_value e state_list."""
         try:
             data, _ = self.sock_state.recvfrom(512)
+            stamp = self.state_stamp = self.streams['state'].stamp(self.clock.monotonic_ns())
+            received_at = stamp.seconds
             val = data.decode("utf-8").rstrip()
             self.state_value = val.replace(';', ':').split(':')
+            self._m_state_packets.inc()
+            self.link.record_state(received_at)
+            safety = self.safety
+            telemetry = self.telemetry
+            relay = self.relay
+            if safety is not None or telemetry is not None or relay is not None:
+                state = self.get_state()
+                if safety is not None: # Avaliado antes de qualquer outra coisa: reação em um pacote
+                    trips = safety.evaluate(state, received_at)
+                    if trips:
+                        self._safety_react(trips, received_at)
+                if telemetry is not None:
+                    telemetry.push(received_at, state)
+                if relay is not None:
+                    relay.publish_state(received_at, state)
+            if not self.state_ev.is_set():
+                self._mark_phase('first_state', self.state_ev)
             for state in self.state_list:
                 if self.state_count % state['period'] == 0:
                     raw = self.get_state_field(state['state']) or ''
                     state['val'] = raw.rstrip()
             self.state_count += 1
+        except socket.timeout: # Só ocorre com lost_link_timeout configurado em enable_safety
+            safety = self.safety
+            if safety is not None:
+                trips = safety.check_link()
+                if trips:
+                    self._safety_react(trips, self.clock.monotonic())
         except Exception as e:
-            print(f"Erro na thread de estado: {e}")
+            self._thread_error('state', "Erro na thread de estado", e)
+
+    def _safety_react(self, trips: list[dict], received_at: float) -> None:
+        """
+        Executa a ação de segurança mais severa disparada: limpa a fila e envia os comandos direto pelo socket.
+        Não espera o cmd_lock (um movimento em andamento o segura por segundos): o comando em andamento
+        é marcado como interrompido e send_cmd_return descarta a resposta, que pode ser a da ação.
+        Args:
+            trips (list): Eventos disparados pelo SafetyMonitor.
+            received_at (float): Instante (time.monotonic) do pacote que disparou.
+        """
+        trip = max(trips, key=lambda t: t['severity'])
+        with self.command_queue.mutex: # Nada enfileirado deve ser executado depois da ação
+            self.command_queue.queue.clear()
+        self.cmd_aborts += 1 # Só a thread de estado escreve
+        for cmd in trip['commands']:
+            self.send_cmd(cmd)
+        trip['latency'] = self.clock.monotonic() - received_at
+        self.metrics_registry.histogram(
+            'tello_safety_reaction_seconds', 'Tempo entre o pacote de estado e o envio da ação de segurança',
+            buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+        ).observe(trip['latency'])
+        self.metrics_registry.counter('tello_safety_trips_total', 'Ações de segurança disparadas', {'rule': trip['rule']}).inc()
+        logger.warning(
+            "Segurança: regra '%s' disparou '%s' (valor %s, limite %s)",
+            trip['rule'], trip['action'], trip.get('value'), trip.get('limit'),
+            extra={'fields': {'latency_ms': round(trip['latency'] * 1000, 3)}}
+        )
+
+    def enable_safety(
+        self,
+        rules: list[SafetyRule] | None = None,
+        lost_link_timeout: float | None = None,
+        lost_link_action: str = 'land',
+        repeat_interval: float = 1.0,
+        stop_supported: bool = False
+    ) -> SafetyMonitor:
+        """
+        Ativa o intertravamento de segurança, avaliado na thread de estado a cada pacote.
+        As ações (hover, land, emergency) são enviadas direto ao drone, sem passar pela command_queue,
+        e a fila é limpa. Veja as regras prontas em tello_zune.safety (min_battery, max_temperature,
+        altitude_ceiling, altitude_floor, attitude_limit).
+        Args:
+            rules (list, optional): Regras. Padrão: bateria mínima (15%) e temperatura máxima (85 °C).
+            lost_link_timeout (float, optional): Segundos sem pacotes de estado, em voo, até a ação de perda de link.
+            lost_link_action (str): Ação na perda de link.
+            repeat_interval (float): Intervalo mínimo entre repetições da ação enquanto a violação continua.
+            stop_supported (bool): O drone tem SDK 2.0 e o hover também envia 'stop', interrompendo um movimento
+                em andamento. Sem ele o hover envia só 'rc 0 0 0 0' e o movimento atual termina antes.
+        Returns:
+            SafetyMonitor: Monitor ativo (eventos em .events).
+        """
+        monitor = SafetyMonitor(
+            rules, lost_link_timeout, lost_link_action, repeat_interval,
+            clock=self.clock.monotonic, stop_supported=stop_supported
+        )
+        if lost_link_timeout is not None:
+            # A leitura do estado passa a expirar para que o silêncio do drone seja percebido
+            self.sock_state.settimeout(min(0.1, lost_link_timeout / 2))
+        self.safety = monitor
+        return monitor
+
+    def disable_safety(self) -> None:
+        """Desativa o intertravamento de segurança."""
+        self.safety = None
+        self.sock_state.settimeout(None)
 
     def _read_queue(self):
         """Lê comandos da fila, envia ao drone e exibe resposta."""
@@ -222,14 +657,15 @@ class TelloZune:
             
             if cmd.startswith("delay"): # Novo comando: "delay x" para pausar x segundos
                 seconds = float(cmd.split()[1])
-                time.sleep(seconds)
+                self.clock.sleep(seconds)
                 return
 
-            timeout = 8.0 if cmd.split()[0] in ['forward','back','left','right','up','down','cw','ccw'] else 2.0
-            resp = self.send_cmd_return(cmd, timeout=timeout)
+            if self.safety is not None:
+                self.safety.notify_command(cmd)
+            resp = self.send_cmd_return(cmd) # Timeout previsto pelo modelo (ver timeouts.TimeoutModel)
 
-            print(f"{cmd}\t{resp}")
-            time.sleep(0.01)
+            logger.info("%s\t%s", cmd, resp)
+            self.clock.sleep(0.01)
         except Empty:
             return
 
@@ -238,15 +674,15 @@ class TelloZune:
         try:
             cmd = input("Comando > ")
             if cmd.lower() == 'exit':
-                print("Sinal de parada recebido. Encerrando entrada de texto...")
+                logger.info("Sinal de parada recebido. Encerrando entrada de texto...")
                 self.textInputThread.stop() # Sinaliza para a thread parar
                 return
             self._process_text_command(cmd) # Para qualquer outro comando, chama o processador
         except (KeyboardInterrupt, EOFError):
-            print("\nEncerrando entrada de texto...")
+            logger.info("Encerrando entrada de texto...")
             self.textInputThread.stop()
         except Exception as e:
-            print(f"Erro inesperado na entrada de texto: {e}")
+            self._thread_error('text_input', "Erro inesperado na entrada de texto", e)
 
     def _process_text_command(self, cmd: str) -> None:
         """
@@ -270,9 +706,9 @@ class TelloZune:
             if len(parts) == 2:
                 self.add_command(cmd)
             else:
-                print(f"Erro: O comando '{base_cmd}' requer um valor (ex: '{base_cmd} 50').")
+                logger.warning("Erro: O comando '%s' requer um valor (ex: '%s 50').", base_cmd, base_cmd)
         else: # Nenhum dos anteriores, trata como comando desconhecido
-            print(f"Comando desconhecido: '{base_cmd}'")
+            logger.warning("Comando desconhecido: '%s'", base_cmd)
 
     def add_command(self, command: str) -> None:
         """
@@ -283,35 +719,103 @@ class TelloZune:
         try:
             self.command_queue.put(command)
         except Exception as e:
-            print(f"Erro ao adicionar comando: {e}")
+            logger.error("Erro ao adicionar comando: %s", e)
 
-    def add_periodic_event(self, cmd: str, period: int, info: str = "", interval: int = 10) -> None:
+    def add_periodic_event(self, cmd: str | RoutePlan, period: int, info: str = "", interval: int = 10, optimize: bool = True) -> RoutePlan:
         """
-        Adiciona evento periódico.
+        Adiciona evento periódico. A rota é validada e compilada uma única vez e o plano é reutilizado a cada período.
         Args:
-            cmd (str): Comando a ser enviado
+            cmd (str | RoutePlan): Comando ou rota (ex: "forward 100 e cw 90"), ou um plano já compilado
             period (int): Período em frames
             info (str): Informação adicional
+            interval (int): Intervalo em segundos entre os comandos da rota
+            optimize (bool): Se True, junta e cancela movimentos da rota (ver compile_route)
+        Returns:
+            RoutePlan: Plano usado pelo evento
+        Raises:
+            RouteError: Se a rota tiver comandos inválidos ou fora dos limites do SDK, ou o plano ficar vazio
         """
-        # Divide a rota em comandos individuais. Ex: "forward 100 e cw 90" -> ['forward 100', 'cw 90']
-        command_list = [c.strip() for c in cmd.split(' e ')]
+        plan = cmd if isinstance(cmd, RoutePlan) else compile_route(cmd, optimize=optimize)
+        if not plan.steps: # Um evento sem comandos nunca faria nada
+            raise RouteError(f"O plano da rota '{plan.source}' está vazio.")
 
         # Adiciona a rota como um único evento
         self.event_list.append({
-            'commands': command_list,
+            'commands': plan.commands,
             'period': int(period),
             'interval': int(interval), # Intervalo em segundos
-            'info': str(info)
+            'info': str(info),
+            'route': plan.source,
+            'plan': plan,
         })
-        print(f"Evento periódico adicionado: {info}, período: {period} frames, comandos: {command_list}")
+        logger.info(
+            "Evento periódico adicionado: %s, período: %s frames, comandos: %s, tempo estimado: %.1f s",
+            info, period, plan.commands, plan.total_time
+        )
+        return plan
+
+    def run_route(self, route: str | RoutePlan, interval: int = 0) -> bool:
+        """
+        Executa uma rota uma única vez, em sua própria thread.
+        Args:
+            route (str | RoutePlan): Rota (ex: "forward 100 e cw 90") ou plano já compilado
+            interval (int): Intervalo em segundos entre os comandos
+        Returns:
+            bool: True se a rota foi iniciada, False se outra rota já está ativa
+        Raises:
+            RouteError: Se a rota for inválida
+        """
+        plan = route if isinstance(route, RoutePlan) else compile_route(route)
+        if self.is_route_active:
+            return False
+        self.is_route_active = True # Marca antes de iniciar a thread, evitando duas rotas simultâneas
+        threading.Thread(target=self._execute_route, args=(plan.commands, interval), daemon=True).start()
+        return True
+
+    def load_mission(self, path: str, cache_dir: str | None = '') -> 'Mission':
+        """
+        Carrega uma missão (JSON ou YAML), validada e compilada antes do voo, e registra seus gatilhos periódicos.
+        Os desvios por QR code são executados com run_branch.
+        Args:
+            path (str): Caminho do arquivo da missão
+            cache_dir (str | None): Pasta do cache de planos compilados. Padrão (''): mission.DEFAULT_CACHE_DIR.
+                None desativa o cache em disco
+        Returns:
+            Mission: Missão compilada
+        Raises:
+            MissionError: Se a missão for inválida (nenhum gatilho é registrado)
+        """
+        from .mission import DEFAULT_CACHE_DIR, load_mission
+        mission = load_mission(path, DEFAULT_CACHE_DIR if cache_dir == '' else cache_dir)
+        for trigger in mission.triggers:
+            route = mission.routes[trigger['route']]
+            self.add_periodic_event(route.plan, trigger['period'], trigger['info'], route.interval)
+        self.mission = mission
+        logger.info("Missão '%s' carregada: %d rotas, %d gatilhos", mission.name, len(mission.routes), len(mission.triggers))
+        return mission
+
+    def run_branch(self, text: str) -> bool:
+        """
+        Executa a rota associada a um texto de QR code na missão carregada.
+        Args:
+            text (str): Texto lido do QR code
+        Returns:
+            bool: True se uma rota foi iniciada
+        """
+        if self.mission is None:
+            return False
+        route = self.mission.branch(text)
+        if route is None:
+            return False
+        return self.run_route(route.plan, route.interval)
 
     def remove_periodic_event(self, cmd: str) -> None:
         """
         Remove evento periódico.
         Args:
-            cmd (str): Comando a ser removido
+            cmd (str): Comando ou rota original a ser removida
         """
-        self.event_list = [ev for ev in self.event_list if ev['commands'] != cmd]
+        self.event_list = [ev for ev in self.event_list if ev['commands'] != cmd and ev.get('route') != cmd]
 
     def remove_last_event(self, qtd: int=1) -> list[dict] | None:
         """
@@ -323,12 +827,12 @@ class TelloZune:
         """
         removed_events = []
         for _ in range(qtd):
-            if len(self.event_list) == 1: # Mantém o evento de keep alive
+            if not self.event_list:
                 if not removed_events:
-                    print("Nenhum evento para remover.")
+                    logger.info("Nenhum evento para remover.")
                 break
             removed_events.append(self.event_list.pop())
-        print(f"Eventos removidos: {removed_events}")
+        logger.info("Eventos removidos: %s", removed_events)
         return removed_events if removed_events else None
 
     def set_image_size(self, image_size: tuple[int, int] = (960, 720)) -> None:
@@ -339,17 +843,236 @@ class TelloZune:
         """
         self.image_size = image_size
 
-    def get_frame(self, timeout: float = 1.0) -> np.ndarray:
+    def get_video_frame(self, timeout: float = 1.0) -> 'VideoFrame':
         """
-        Retorna próximo frame da fila.
+        Retorna o próximo frame da fila no formato do decodificador, sem conversões.
+        Use .gray para a luminância (view do plano Y com o PyAV) e .bgr para cor (convertido só se pedido).
+        O instante de captura fica em frame_timestamp.
+        Args:
+            timeout (float): Espera máxima pelo frame; depois disso retorna um frame preto.
         Returns:
-            np.ndarray: Frame do vídeo (920x720)
+            VideoFrame: Frame do vídeo.
         """
         try:
-            return self.q.get(timeout=timeout)
+            frame, stamp = self.q.get(timeout=timeout)
+            self.frame_stamp = stamp
+            self.frame_timestamp = stamp.seconds
+            return frame
         except Empty:
             # Retorna um frame preto
-            return np.zeros((self.image_size[1], self.image_size[0], 3), dtype=np.uint8)
+            _load_video_stack()
+            return VideoFrame(bgr=np.zeros((self.image_size[1], self.image_size[0], 3), dtype=np.uint8))
+
+    def get_frame(self, timeout: float = 1.0) -> 'np.ndarray':
+        """
+        Retorna próximo frame da fila em BGR. O instante de captura fica em frame_timestamp.
+        Returns:
+            np.ndarray: Frame do vídeo (960x720)
+        """
+        return self.get_video_frame(timeout).bgr
+
+    def get_gray_frame(self, timeout: float = 1.0) -> 'np.ndarray':
+        """
+        Retorna próximo frame da fila em escala de cinza, para detectores que não usam cor.
+        Com o backend PyAV é o plano Y do decodificador, sem nenhuma conversão nem cópia.
+        Returns:
+            np.ndarray: Luminância (altura, largura) uint8.
+        """
+        return self.get_video_frame(timeout).gray
+
+    @property
+    def frame(self) -> 'np.ndarray | None':
+        """Último frame decodificado, em BGR (convertido só quando lido)."""
+        video_frame = self.video_frame
+        return None if video_frame is None else video_frame.bgr
+
+    def enable_telemetry_buffer(self, capacity: int = 256) -> None:
+        """
+        Passa a guardar o histórico do estado indexado pelo tempo (chamado por start_video).
+        Cada pacote é convertido uma vez na thread de estado; get_frame_state interpola o estado
+        no instante de captura de cada frame.
+        Args:
+            capacity (int): Quantidade de pacotes guardados (~10 por segundo).
+        """
+        _load_video_stack()
+        from .telemetry import TelemetryBuffer
+        if self.telemetry is None or self.telemetry.capacity != capacity:
+            self.telemetry = TelemetryBuffer(capacity=capacity)
+
+    def get_state_at(self, timestamp: float) -> dict[str, float]:
+        """
+        Retorna o estado interpolado num instante (time.monotonic).
+        Fora do histórico usa o pacote mais próximo; a guinada é interpolada pelo menor arco.
+        Args:
+            timestamp (float): Instante desejado.
+        Returns:
+            dict: {'pitch', 'roll', 'yaw', 'vgx', 'vgy', 'vgz', 'tof', 'h', 'agx', 'agy', 'agz', 'timestamp'}
+                como float, ou vazio se o histórico não está ativo ou ainda não há pacotes.
+        """
+        telemetry = self.telemetry
+        return telemetry.at(timestamp) if telemetry is not None else {}
+
+    def get_frame_state(self, latency: float = 0.0) -> dict[str, float]:
+        """
+        Retorna o estado interpolado no instante de captura do último frame entregue por get_frame.
+        Args:
+            latency (float): Atraso estimado (s) entre a captura real e frame_timestamp.
+        Returns:
+            dict: Estado como em get_state_at.
+        """
+        return self.get_state_at(self.frame_timestamp - latency)
+
+    def get_frame_with_state(self, timeout: float = 1.0, latency: float = 0.0) -> tuple['np.ndarray', dict[str, float]]:
+        """
+        Retorna o próximo frame junto com o estado interpolado no seu instante de captura.
+        Args:
+            timeout (float): Espera máxima pelo frame.
+            latency (float): Atraso estimado (s) entre a captura real e frame_timestamp.
+        Returns:
+            tuple: (frame, estado)
+        """
+        frame = self.get_frame(timeout)
+        return frame, self.get_frame_state(latency)
+
+    def start_frame_bus(self, slots: int = 4) -> str:
+        """
+        Passa a publicar cada frame num anel em memória compartilhada, para que processos
+        de visão separados leiam o frame mais recente sem cópia (ver frame_bus.FrameSubscriber).
+        Args:
+            slots (int): Quantidade de slots do anel.
+        Returns:
+            str: Nome do bloco compartilhado, a ser passado aos processos leitores.
+        """
+        if self.frame_bus is None:
+            from .frame_bus import FramePublisher
+            width, height = self.image_size
+            self.frame_bus = FramePublisher((height, width, 3), slots=slots)
+        return self.frame_bus.name
+
+    def stop_frame_bus(self) -> None:
+        """Para de publicar frames e remove o bloco compartilhado."""
+        bus, self.frame_bus = self.frame_bus, None
+        if bus is not None:
+            bus.close()
+
+    def start_stream_server(self, host: str = '127.0.0.1', port: int = 8080, quality: int = 80) -> tuple[str, int]:
+        """
+        Inicia o servidor HTTP de vídeo MJPEG (com ou sem HUD) e telemetria JSON.
+        Args:
+            host (str): Endereço de escuta. Use '0.0.0.0' para servir na rede local.
+            port (int): Porta TCP.
+            quality (int): Qualidade JPEG padrão.
+        Returns:
+            tuple: Endereço (host, porta) do servidor.
+        """
+        if self.stream_server is None:
+            from .stream_server import StreamServer
+            self.stream_server = StreamServer(self, host=host, port=port, quality=quality)
+            self.stream_server.start()
+        return self.stream_server.address
+
+    def stop_stream_server(self) -> None:
+        """Para o servidor HTTP de vídeo."""
+        server, self.stream_server = self.stream_server, None
+        if server is not None:
+            server.stop()
+
+    def start_relay(self, transport: str = 'auto', responses: bool = True, **kwargs) -> 'StateRelay':
+        """
+        Passa a republicar cada pacote de estado (e as respostas de comandos) para outros processos,
+        já que só um processo consegue abrir a porta de estado. Os outros usam relay.RelayClient.
+        Args:
+            transport (str): 'auto', 'multicast' (loopback) ou 'unix' (sockets de datagrama Unix).
+            responses (bool): Se True, republica também as respostas de comandos.
+            **kwargs: group, port ou path do StateRelay.
+        Returns:
+            StateRelay: Publicador ativo (contadores em .stats()).
+        """
+        if self.relay is None:
+            from .relay import StateRelay
+            self.relay = StateRelay(transport, **kwargs)
+            logger.info("Relay de telemetria iniciado (%s)", self.relay.transport)
+        self.relay_responses = responses
+        return self.relay
+
+    def stop_relay(self) -> None:
+        """Para de republicar o estado."""
+        relay, self.relay = self.relay, None
+        if relay is not None:
+            relay.close()
+
+    def _threads(self) -> list[SafeThread]:
+        """Retorna as threads cíclicas da instância."""
+        return [
+            self.receiverThread, self.periodicCmdThread, self.videoThread,
+            self.stateThread, self.movesThread, self.textInputThread,
+        ]
+
+    def enable_thread_stats(self, enabled: bool = True) -> None:
+        """
+        Liga ou desliga a medição de tempo por iteração em todas as threads (ver thread_stats()).
+        Args:
+            enabled (bool): True para medir.
+        """
+        for thread in self._threads():
+            thread.instrument = enabled
+
+    def thread_stats(self) -> dict[str, dict]:
+        """
+        Retorna as estatísticas de cada thread: iterações, tempo ocupado e bloqueado,
+        exceções e sua taxa. Os tempos só são coletados após enable_thread_stats().
+        Returns:
+            dict: {nome da thread: estatísticas}
+        """
+        return {thread.name: thread.stats() for thread in self._threads()}
+
+    def stream_stats(self) -> dict[str, dict]:
+        """
+        Retorna a sequência e as perdas de cada fluxo (cmd, response, state, video).
+        As perdas de estado e vídeo são estimadas pelas lacunas no intervalo nominal (10 Hz e 30 FPS).
+        Returns:
+            dict: {fluxo: {'seq', 'count', 'missed', 'gaps', 'loss_ratio', 'last_ns', 'max_interval_ms'}}
+        """
+        return {name: stream.stats() for name, stream in self.streams.items()}
+
+    def control_latency(self) -> dict:
+        """
+        Retorna o histograma da latência de controle: captura do frame -> primeiro rc enviado depois de lê-lo.
+        Mede o laço percepção -> comando do usuário (get_frame ... send_rc_control), chamado de uma única thread.
+        Returns:
+            dict: {'last', 'count', 'mean', 'buckets': {limite (s): acumulado}}
+        """
+        snapshot = self._m_frame_to_rc.snapshot()
+        count = snapshot['count']
+        return {
+            'last': self.last_control_latency,
+            'count': count,
+            'mean': snapshot['sum'] / count if count else None,
+            'buckets': snapshot['buckets'],
+        }
+
+    def metrics(self) -> dict:
+        """
+        Retorna os valores atuais das métricas (RTT e timeouts de comandos, profundidade da fila,
+        pacotes de estado, frames e descartes, erros por thread).
+        Returns:
+            dict: {nome: {rótulos: valor}}; histogramas como {'count', 'sum', 'buckets'}.
+        """
+        return self.metrics_registry.snapshot()
+
+    def start_metrics_server(self, host: str = '127.0.0.1', port: int = 9100) -> tuple[str, int]:
+        """
+        Inicia o endpoint HTTP /metrics no formato do Prometheus.
+        Args:
+            host (str): Endereço de escuta. Padrão: apenas localhost.
+            port (int): Porta TCP.
+        Returns:
+            tuple: Endereço (host, porta) do servidor.
+        """
+        if self.metrics_server is None:
+            self.metrics_server = MetricsServer(self.metrics_registry, host=host, port=port)
+            self.metrics_server.start()
+        return self.metrics_server.address
 
     def stop_communication(self) -> None:
         """Para threads e fecha sockets."""
@@ -359,9 +1082,13 @@ class TelloZune:
         self.movesThread.stop()
         self.sock_cmd.close()
         self.sock_state.close()
+        self.stop_relay()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
         if self.textInputThread.is_alive():
             self.textInputThread.stop()
-        print("Comunicação finalizada")
+        logger.info("Comunicação finalizada")
 
     def start_communication(self) -> None:
         """Inicia threads de comunicação e leitura de comandos."""
@@ -369,29 +1096,33 @@ class TelloZune:
         if self.periodicCmdThread.is_alive() is not True: self.periodicCmdThread.start() # Thread de comandos periódicos
         if self.stateThread.is_alive() is not True: self.stateThread.start() # Thread de estado
         if self.movesThread.is_alive() is not True: self.movesThread.start() # Thread de movimentos
-        print("Iniciando comunicação")
+        logger.info("Iniciando comunicação")
 
     def start_video(self) -> None:
-        """Inicia a transmissão de vídeo do Tello."""
+        """
+        Inicia a transmissão de vídeo do Tello. Não bloqueia: a captura é aberta pela thread de vídeo
+        assim que o stream chega (acompanhe por video_open_ev e frame_ev).
+        """
+        _load_video_stack()
+        self.enable_telemetry_buffer()
         self.send_cmd('streamon')
 
-        time.sleep(1)
-
-        self.video = cv2.VideoCapture(self.video_source, cv2.CAP_FFMPEG)
-
         if not self.videoThread.is_alive():
             self.videoThread.start()
-        print("Vídeo iniciado")
+        logger.info("Vídeo iniciado")
 
     def stop_video(self) -> None:
         """Stop video stream"""
         self.send_cmd('streamoff')
         self.videoThread.stop()
+        self.stop_frame_bus()
+        self.stop_stream_server()
 
     def wait_till_connected(self, timeout: int = 10) -> bool:
         """
         Bloqueia a execução até que o drone Tello esteja conectado.
         Use este método no início do seu código para garantir que o drone esteja pronto para receber comandos.
+        As tentativas começam com poucos milissegundos de espera e dobram até 0.5 s.
         Args:
             timeout (int): Tempo máximo de espera em segundos. Padrão é 10 segundos.
         Returns:
@@ -401,54 +1132,102 @@ class TelloZune:
         if not self.receiverThread.is_alive():
             self.receiverThread.start()
 
-        start_time = time.time()
+        start_time = self.clock.monotonic()
+        deadline = start_time + timeout
+        retry_delay = 0.005 # Espera entre tentativas
+        # Espera pela resposta de cada tentativa: o RTO já aprendido (reconexão) ou 50 ms na primeira conexão
+        reply_timeout = self.timeouts.rtt.rto if self.timeouts.rtt.samples else 0.05
 
-        while time.time() - start_time < timeout: # Se o loop durar mais que timeout, falha
+        while self.clock.monotonic() < deadline: # Se o loop durar mais que timeout, falha
             try:
-                response = self.send_cmd_return('command')
+                remaining = deadline - self.clock.monotonic()
+                response = self.send_cmd_return('command', timeout=min(reply_timeout, max(remaining, 0.0)))
                 if response == 'ok':
-                    elapsed = time.time() - start_time
-                    print(f"Drone conectado em {elapsed:.2f} segundos.")
+                    elapsed = self.clock.monotonic() - start_time
+                    logger.info("Drone conectado em %.2f segundos.", elapsed)
                     self.ready = True
+                    self.phase_times.setdefault('connect', self.clock.monotonic())
                     return True
             except Exception as e:
-                print(f"Erro durante a tentativa de conexão: {e}")
-            
-            time.sleep(0.5)
+                logger.warning("Erro durante a tentativa de conexão: %s", e)
+
+            self.clock.sleep(min(retry_delay, max(deadline - self.clock.monotonic(), 0.0)))
+            retry_delay = min(retry_delay * 2, 0.5)
+            reply_timeout = min(reply_timeout * 2, 1.0)
 
-        print(f"Falha na conexão: Tempo limite de {timeout}s excedido. Verifique se o drone está ligado")
+        logger.error("Falha na conexão: Tempo limite de %ss excedido. Verifique se o drone está ligado", timeout)
         return False
 
-    def send_cmd_return(self, cmd: str, timeout: float = 1.0) -> str:
+    def send_cmd_return(self, cmd: str, timeout: float | None = None) -> str:
         """
         Envia um comando para o drone Tello via UDP e espera pela resposta.
         O comando é enviado via UDP e a resposta é recebida na mesma conexão.
         Args:
             cmd (str): Comando a ser enviado para o drone.
-            timeout (float): Tempo máximo de espera em segundos. Padrão é 1.0 segundo.
+            timeout (float, optional): Tempo máximo de espera em segundos. Padrão: previsto por self.timeouts
+                a partir dos argumentos do comando e do histórico de RTT e duração.
         Returns:
             str: Resposta do drone. Verifique a documentação do SDK do Tello para os comandos válidos.
+                Vazia sem resposta dentro do timeout ou se uma ação de segurança interrompeu o comando.
         """
         with self.cmd_lock:
             self.cmd_recv_ev.clear()
             self.udp_cmd_ret = ""
+            aborts = self.cmd_aborts
             
+            if timeout is None:
+                timeout = self.timeouts.timeout_for(cmd)
             cmd_bytes = cmd.encode("utf-8")
+            sent = self._stamp_cmd()
             self.sock_cmd.sendto(cmd_bytes, self.telloaddr)
+            self.link.record_send(sent.seconds)
             
             # Espera a resposta (a thread recebedora vai dar .set() no evento)
-            self.cmd_recv_ev.wait(timeout)
+            received = self.clock.wait(self.cmd_recv_ev, timeout)
+            if self.cmd_aborts != aborts:
+                # Uma ação de segurança foi enviada durante a espera: a resposta pode ser dela,
+                # então não vale como RTT, duração ou perda deste comando
+                self._m_cmd_aborted.inc()
+                return ""
+            if received:
+                # RTT até o carimbo do recebimento, sem o atraso para esta thread acordar
+                response = self.response_stamp
+                if response is not None and response.t_ns >= sent.t_ns:
+                    elapsed = (response.t_ns - sent.t_ns) / 1e9
+                else:
+                    elapsed = self.clock.monotonic() - sent.seconds
+                base = cmd.split()[0] if cmd else ''
+                self.metrics_registry.histogram(
+                    'tello_command_rtt_seconds', 'Tempo até a resposta de cada comando', {'command': base}
+                ).observe(elapsed)
+                self.timeouts.observe(cmd, elapsed, self.udp_cmd_ret)
+                self.link.record_reply()
+            else:
+                self._m_cmd_timeouts.inc()
+                self.timeouts.on_timeout(cmd)
+                if self.ready: # As tentativas rápidas de wait_till_connected não contam como perda
+                    self.link.record_timeout()
             
             return self.udp_cmd_ret
 
-    def send_cmd(self, cmd: str) -> None:
+    def send_cmd(self, cmd: str) -> Stamp:
         """
         Envia um comando para o drone Tello via UDP. Não espera pela resposta.
         Args:
             cmd (str): Consulte a documentação do SDK do Tello para os comandos válidos.
+        Returns:
+            Stamp: Sequência e instante de envio deste comando.
         """
         cmd_bytes = cmd.encode("utf-8")
+        sent = self._stamp_cmd()
         _ = self.sock_cmd.sendto(cmd_bytes, self.telloaddr)
+        self.link.record_send(sent.seconds)
+        return sent
+
+    def _stamp_cmd(self) -> Stamp:
+        """Numera um comando enviado no fluxo 'cmd'."""
+        stamp = self.cmd_stamp = self.streams['cmd'].stamp(self.clock.monotonic_ns())
+        return stamp
 
     def send_rc_control(self, left_right_velocity: int, forward_backward_velocity: int, up_down_velocity: int, yaw_velocity: int) -> None:
         """
@@ -460,53 +1239,111 @@ class TelloZune:
             up_down_velocity: -100~100 (up/down)
             yaw_velocity: -100~100 (yaw)
         """
-        if time.time() - self.last_rc_control_timestamp > self.TIME_BTW_RC_CONTROL_COMMANDS:
-            self.last_rc_control_timestamp = time.time()
+        now = self.clock.monotonic()
+        if now - self.last_rc_control_timestamp > self.TIME_BTW_RC_CONTROL_COMMANDS:
+            self.last_rc_control_timestamp = now
             cmd = f'rc {left_right_velocity} {forward_backward_velocity} {up_down_velocity} {yaw_velocity}'
-            self.send_cmd(cmd)
+            sent = self.send_cmd(cmd) # Carimbo deste envio (cmd_stamp pode já ser de outra thread)
+            frame = self.frame_stamp
+            if frame is not None and frame.seq != self.rc_frame_seq: # Só o primeiro rc de cada frame conta
+                self.rc_frame_seq = frame.seq
+                self.last_control_latency = (sent.t_ns - frame.t_ns) / 1e9
+                self._m_frame_to_rc.observe(self.last_control_latency)
 
     def takeoff(self) -> None:
         """Decola o drone."""
-        print("Decolando")
+        logger.info("Decolando")
         self.add_command("takeoff")
         # time.sleep(4)
     
     def land(self) -> None:
         """Pousa o drone."""
-        print("Pousando")
-        answer = self.send_cmd_return("land", timeout=5.0) # Bom dar um timeout maior no pouso
+        logger.info("Pousando")
+        if self.safety is not None:
+            self.safety.notify_command("land")
+        answer = self.send_cmd_return("land") # Timeout previsto para o pouso, aprendido com os anteriores
         trys = 0
         max_trys = 3
         
         while answer != 'ok' and trys < max_trys:
-            print(f"Resposta inesperada para 'land': '{answer}'. Tentando novamente...")
-            time.sleep(1)
-            answer = self.send_cmd_return("land", timeout=5.0)
+            logger.warning("Resposta inesperada para 'land': '%s'. Tentando novamente...", answer)
+            self.clock.sleep(self.timeouts.retry_delay())
+            answer = self.send_cmd_return("land")
             trys += 1
             
         if answer != 'ok':
-            print("Aviso: Falha ao confirmar pouso após várias tentativas.")
+            logger.warning("Aviso: Falha ao confirmar pouso após várias tentativas.")
 
-    def start_tello(self) -> bool:
+    def start_tello(self, timeout: float = 10.0, wait_video: bool = True) -> ReadinessReport:
         """
         Inicializa o vídeo e a comunicação com o drone.
-        Deve ser chamado após criar instância.
+        Deve ser chamado após criar instância. Depois de conectar, a abertura do vídeo, o primeiro
+        pacote de estado e o primeiro frame decodificado são aguardados em paralelo.
+        Args:
+            timeout (float): Tempo máximo total em segundos.
+            wait_video (bool): Se True, espera também a abertura do vídeo e o primeiro frame.
         Returns:
-            bool: True se inicialização bem-sucedida, False caso contrário.
+            ReadinessReport: Relatório com o tempo de cada fase. Avalia como True se conectou.
         """
+        start = self.clock.monotonic()
+        deadline = start + timeout
+        report = ReadinessReport()
         if not self.receiverThread.is_alive():
-            is_connected = self.wait_till_connected() # A chamada retorna True ou False
+            # Ouve o estado desde já, para o primeiro pacote não esperar o resto da inicialização
+            if not self.stateThread.is_alive():
+                self.stateThread.start()
+            is_connected = self.wait_till_connected(timeout) # A chamada retorna True ou False
             if not is_connected: # Se a conexão falhou, interrompe a inicialização
-                return False
+                report.phases['connect'] = None
+                report.total = self.clock.monotonic() - start
+                return report
             self.start_communication()
-            self.start_video()
+            if self.enable_video:
+                self.start_video()
+        report.connected = True
+
+        phases = [('connect', None), ('first_state', self.state_ev)]
+        if wait_video and self.enable_video:
+            phases += [('video_open', self.video_open_ev), ('first_frame', self.frame_ev)]
+        for name, event in phases: # As fases já correm em paralelo; aqui apenas se espera cada uma
+            if event is not None:
+                self.clock.wait(event, max(deadline - self.clock.monotonic(), 0.0))
+            t = self.phase_times.get(name)
+            report.phases[name] = None if t is None else max(t - start, 0.0)
+
         if self.enable_text_input:
             if not self.textInputThread.is_alive():
                 self.textInputThread.start()
-            print("Entrada de texto habilitada.")
-        
-        return True
-    
+            logger.info("Entrada de texto habilitada.")
+
+        report.total = self.clock.monotonic() - start
+        logger.info("Inicialização: %s", ", ".join(
+            f"{name} {'-' if t is None else f'{t:.2f}s'}" for name, t in report.phases.items()
+        ), extra={'fields': {'connected': report.connected, 'total': round(report.total, 3)}})
+        return report
+
+    def start_tello_async(self, timeout: float = 10.0, wait_video: bool = True) -> Future:
+        """
+        Versão não bloqueante de start_tello.
+        Args:
+            timeout (float): Tempo máximo total em segundos.
+            wait_video (bool): Se True, espera também a abertura do vídeo e o primeiro frame.
+        Returns:
+            Future: Concluído com o ReadinessReport (use .result() ou .add_done_callback()).
+        """
+        future: Future = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.start_tello(timeout, wait_video))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
     def is_vertical_moving(self, height_threshold: float = 5.0, sample_interval: float = 0.1) -> bool:
         """
         Detecta movimento vertical comparando a altura em dois instantes.
@@ -517,13 +1354,14 @@ class TelloZune:
             bool: True se o drone estiver se movendo verticalmente, False caso contrário.
         """
         h1 = float(self.get_state_field('tof'))
-        time.sleep(sample_interval)
+        self.clock.sleep(sample_interval)
         h2 = float(self.get_state_field('tof'))
         return abs(h2 - h1) > height_threshold
 
     def end_tello(self) -> None:
         """Finaliza o drone Tello. Pousa se possivel, encerra o video e a comunicacao."""
-        self.stop_video()
+        if self.enable_video or self.videoThread.is_alive():
+            self.stop_video()
         self.stop_communication()
 
     def get_state_field(self, key: str) -> str:
@@ -540,6 +1378,15 @@ class TelloZune:
             return state[index]
         return ""
 
+    def get_state(self) -> dict[str, str]:
+        """
+        Retorna todos os campos do último pacote de estado.
+        Returns:
+            dict: {campo: valor}, ex: {'bat': '80', 'tof': '10', ...}
+        """
+        state = self.state_value
+        return dict(zip(state[0:-1:2], state[1::2]))
+
     def get_battery(self) -> int:
         """
         Retorna o nível da bateria do drone.
@@ -555,11 +1402,11 @@ class TelloZune:
             int: FPS
         """
         self.num_frames += 1
-        self.elapsed_time = time.time() - self.start_time
+        self.elapsed_time = self.clock.monotonic() - self.start_time
         if self.elapsed_time >= 1:
             self.fps = int(self.num_frames / self.elapsed_time)
             self.num_frames = 0
-            self.start_time = time.time() 
+            self.start_time = self.clock.monotonic() 
         return self.fps
 
     def get_info(self) -> tuple:
@@ -595,12 +1442,14 @@ class TelloZune:
         """Limpa a fila de comandos"""
         with self.command_queue.mutex:
             self.command_queue.queue.clear()
-        print("Fila de comandos limpa.")
+        logger.info("Fila de comandos limpa.")
 
     def emergency_stop(self):
         """
         Envia comando de emergência para o drone, parando-o imediatamente. Limpa a fila de comandos antes de enviar o comando de emergência.
         """
         self.clear_command_queue()
+        if self.safety is not None:
+            self.safety.notify_command("emergency")
         self.send_cmd("emergency")
 
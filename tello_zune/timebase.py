@@ -0,0 +1,84 @@
+import threading
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class Stamp:
+    """
+    Carimbo de um datagrama ou frame, feito no instante do recebimento.
+    Attributes:
+        seq (int): Número de sequência no fluxo (começa em 1).
+        t_ns (int): Instante de recebimento em nanossegundos (clock.monotonic_ns, a base de tempo única do TelloZune).
+        missed (int): Itens estimados como perdidos entre este e o anterior do mesmo fluxo.
+    """
+    seq: int
+    t_ns: int
+    missed: int = 0
+
+    @property
+    def seconds(self) -> float:
+        """Instante em segundos, na mesma base de clock.monotonic()."""
+        return self.t_ns / 1e9
+
+class StreamSequence:
+    """
+    Contador de sequência de um fluxo (comandos, respostas, estado ou vídeo).
+    O Tello não numera os pacotes, então as lacunas são inferidas pelo intervalo nominal do fluxo:
+    um intervalo entre chegadas de n períodos conta n - 1 itens perdidos.
+    stamp é protegido por um lock: o fluxo 'cmd' tem vários escritores (fila de comandos, rc, keep alive),
+    e sequência, último carimbo e contadores precisam avançar juntos.
+    Args:
+        name (str): Nome do fluxo.
+        interval (float, optional): Período nominal (s) entre itens; None desativa a detecção de lacunas
+            (fluxos sob demanda, como comandos e respostas).
+    """
+    def __init__(self, name: str, interval: float | None = None) -> None:
+        self.name = name
+        self.interval_ns = int(interval * 1e9) if interval else 0
+        self.lock = threading.Lock()
+        self.last: Stamp | None = None
+        self.count = 0
+        self.missed = 0
+        self.gaps = 0 # Lacunas (sequências de itens perdidos)
+        self.max_interval_ns = 0
+
+    def stamp(self, t_ns: int) -> Stamp:
+        """
+        Numera um item recebido (ou enviado) no instante t_ns.
+        Com escritores concorrentes a sequência segue a ordem de entrada no lock, então last nunca volta;
+        o instante de cada item é mantido como lido (pode vir microssegundos antes do anterior).
+        Returns:
+            Stamp: Sequência, instante e perdas estimadas desde o item anterior.
+        """
+        with self.lock:
+            missed = 0
+            last = self.last
+            if last is not None:
+                dt = t_ns - last.t_ns
+                if dt > self.max_interval_ns:
+                    self.max_interval_ns = dt
+                if self.interval_ns:
+                    missed = max(0, round(dt / self.interval_ns) - 1)
+                    if missed:
+                        self.missed += missed
+                        self.gaps += 1
+            self.count += 1
+            stamp = self.last = Stamp(self.count, t_ns, missed)
+            return stamp
+
+    def stats(self) -> dict:
+        """
+        Retorna os contadores do fluxo.
+        Returns:
+            dict: {'seq', 'count', 'missed', 'gaps', 'loss_ratio', 'last_ns', 'max_interval_ms'}
+        """
+        last = self.last
+        expected = self.count + self.missed
+        return {
+            'seq': last.seq if last is not None else 0,
+            'count': self.count,
+            'missed': self.missed,
+            'gaps': self.gaps,
+            'loss_ratio': self.missed / expected if expected else 0.0,
+            'last_ns': last.t_ns if last is not None else None,
+            'max_interval_ms': self.max_interval_ns / 1e6,
+        }
@@ -0,0 +1,173 @@
+import threading
+
+from .route import MOVE_AXES, ROUND_TRIP, DEFAULT_SPEED, estimate_command_time
+
+class RttEstimator:
+    """
+    Estimador de RTT e timeout de retransmissão no estilo da RFC 6298.
+    Antes da primeira amostra o timeout é initial_rto; cada timeout sem resposta dobra o valor (até max_rto).
+    Args:
+        alpha (float): Ganho da média (SRTT).
+        beta (float): Ganho da variação (RTTVAR).
+        k (float): Multiplicador da variação no timeout.
+        initial_rto (float): Timeout antes da primeira amostra, em segundos.
+        min_rto (float): Timeout mínimo.
+        max_rto (float): Timeout máximo.
+    """
+    def __init__(
+        self,
+        alpha: float = 1 / 8,
+        beta: float = 1 / 4,
+        k: float = 4.0,
+        initial_rto: float = 1.0,
+        min_rto: float = 0.2,
+        max_rto: float = 5.0
+    ) -> None:
+        self.alpha = alpha
+        self.beta = beta
+        self.k = k
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.rto = initial_rto
+        self.samples = 0
+
+    def observe(self, sample: float) -> None:
+        """
+        Registra uma amostra de RTT (apenas de comandos respondidos na primeira tentativa, algoritmo de Karn).
+        Args:
+            sample (float): RTT medido em segundos.
+        """
+        if self.srtt is None:
+            self.srtt = sample
+            self.rttvar = sample / 2
+        else:
+            self.rttvar = (1 - self.beta) * self.rttvar + self.beta * abs(self.srtt - sample)
+            self.srtt = (1 - self.alpha) * self.srtt + self.alpha * sample
+        self.rto = min(self.max_rto, max(self.min_rto, self.srtt + self.k * self.rttvar))
+        self.samples += 1
+
+    def backoff(self) -> None:
+        """Dobra o timeout após uma resposta perdida."""
+        self.rto = min(self.max_rto, self.rto * 2)
+
+class TimeoutModel:
+    """
+    Prevê o tempo de conclusão de cada comando e deriva dele o timeout de espera pela resposta.
+    O Tello só responde aos movimentos ao terminá-los, então:
+        timeout = duração prevista pelos argumentos (distância/velocidade, graus) x fator aprendido + RTO
+    A duração prevista vem de route.estimate_command_time. O fator é aprendido por tipo de comando
+    (média e variação da razão medido/previsto, como o RTT) e o RTO vem das respostas dos comandos sem movimento.
+    Args:
+        rtt (RttEstimator, optional): Estimador de RTT.
+        k (float): Multiplicador da variação do fator.
+        min_timeout (float): Timeout mínimo de qualquer comando.
+        max_timeout (float): Timeout máximo de qualquer comando.
+    """
+    def __init__(
+        self,
+        rtt: RttEstimator | None = None,
+        k: float = 4.0,
+        min_timeout: float = 0.2,
+        max_timeout: float = 60.0
+    ) -> None:
+        self.rtt = rtt or RttEstimator()
+        self.k = k
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.speed = float(DEFAULT_SPEED) # Atualizada quando um 'speed x' é confirmado
+        self.factors: dict[str, list[float]] = {} # comando -> [média, variação] da razão medido/previsto
+        self.lock = threading.Lock()
+
+    def expected_duration(self, cmd: str) -> float:
+        """
+        Duração prevista do comando no drone, sem o RTT (0 para comandos sem movimento).
+        Args:
+            cmd (str): Comando.
+        Returns:
+            float: Duração em segundos.
+        """
+        estimate = estimate_command_time(cmd, self.speed)
+        return 0.0 if estimate <= ROUND_TRIP else estimate
+
+    def timeout_for(self, cmd: str) -> float:
+        """
+        Timeout de espera pela resposta de um comando.
+        Args:
+            cmd (str): Comando.
+        Returns:
+            float: Timeout em segundos.
+        """
+        expected = self.expected_duration(cmd)
+        timeout = self.rtt.rto
+        if expected > 0:
+            mean, dev = self.factors.get(_base(cmd), (1.0, 0.25))
+            timeout += expected * (mean + self.k * dev)
+        return min(self.max_timeout, max(self.min_timeout, timeout))
+
+    def observe(self, cmd: str, elapsed: float, response: str) -> None:
+        """
+        Registra o tempo até a resposta de um comando.
+        Args:
+            cmd (str): Comando enviado.
+            elapsed (float): Segundos entre o envio e a resposta.
+            response (str): Resposta recebida.
+        """
+        expected = self.expected_duration(cmd)
+        with self.lock:
+            if expected <= 0:
+                self.rtt.observe(elapsed)
+            elif response == 'ok': # Respostas de erro chegam antes do movimento e não dizem nada da duração
+                ratio = max(elapsed - (self.rtt.srtt or 0.0), 0.0) / expected
+                factor = self.factors.get(_base(cmd))
+                if factor is None:
+                    self.factors[_base(cmd)] = [ratio, max(ratio / 4, 0.05)]
+                else:
+                    factor[1] = (1 - self.rtt.beta) * factor[1] + self.rtt.beta * abs(factor[0] - ratio)
+                    factor[0] = (1 - self.rtt.alpha) * factor[0] + self.rtt.alpha * ratio
+            parts = cmd.split()
+            if response == 'ok' and len(parts) == 2 and parts[0] == 'speed':
+                try:
+                    self.speed = float(parts[1])
+                except ValueError:
+                    pass
+
+    def on_timeout(self, cmd: str) -> None:
+        """
+        Registra um comando sem resposta: dobra o RTO ou, para movimentos, alarga a margem do fator.
+        Args:
+            cmd (str): Comando enviado.
+        """
+        with self.lock:
+            if self.expected_duration(cmd) <= 0:
+                self.rtt.backoff()
+            else:
+                factor = self.factors.setdefault(_base(cmd), [1.0, 0.25])
+                factor[1] = min(factor[1] * 2, 2.0)
+
+    def retry_delay(self) -> float:
+        """Espera antes de reenviar um comando sem resposta (o RTO atual)."""
+        return self.rtt.rto
+
+    def snapshot(self) -> dict:
+        """
+        Retorna o estado do modelo.
+        Returns:
+            dict: {'srtt', 'rttvar', 'rto', 'speed', 'factors': {comando: (média, variação)}}
+        """
+        with self.lock:
+            return {
+                'srtt': self.rtt.srtt,
+                'rttvar': self.rtt.rttvar,
+                'rto': self.rtt.rto,
+                'speed': self.speed,
+                'factors': {k: tuple(v) for k, v in self.factors.items()},
+            }
+
+def _base(cmd: str) -> str:
+    parts = cmd.split()
+    if not parts:
+        return ''
+    # Movimentos em eixos diferentes têm a mesma dinâmica: aprendem um fator comum
+    return 'move' if parts[0] in MOVE_AXES else parts[0]
@@ -0,0 +1,183 @@
+import logging
+from collections import deque
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('auto', 'opencv', 'pyav')
+
+class VideoFrame:
+    """
+    Frame decodificado que guarda o formato nativo do decodificador e converte só sob demanda.
+    Com o PyAV o frame chega em YUV420 (I420): .gray é uma view do plano Y (sem cópia nem conversão)
+    e .bgr converte na primeira vez que alguém pede cor (e guarda o resultado). Com o OpenCV o frame
+    já chega em BGR e .gray converte sob demanda.
+    Args:
+        yuv (np.ndarray, optional): Frame I420, shape (altura * 3 / 2, largura).
+        bgr (np.ndarray, optional): Frame BGR, shape (altura, largura, 3).
+    """
+    __slots__ = ('_yuv', '_bgr', '_gray', 'width', 'height')
+
+    def __init__(self, yuv: np.ndarray | None = None, bgr: np.ndarray | None = None) -> None:
+        if (yuv is None) == (bgr is None):
+            raise ValueError("Informe exatamente um de yuv ou bgr.")
+        self._yuv = yuv
+        self._bgr = bgr
+        self._gray: np.ndarray | None = None
+        if yuv is not None:
+            self.height, self.width = yuv.shape[0] * 2 // 3, yuv.shape[1]
+        else:
+            self.height, self.width = bgr.shape[:2] # type: ignore[union-attr]
+
+    @classmethod
+    def from_bgr(cls, bgr: np.ndarray) -> 'VideoFrame':
+        return cls(bgr=bgr)
+
+    @classmethod
+    def from_yuv(cls, yuv: np.ndarray) -> 'VideoFrame':
+        return cls(yuv=yuv)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Tamanho (largura, altura)."""
+        return self.width, self.height
+
+    @property
+    def is_yuv(self) -> bool:
+        """True se o frame está no formato nativo do decodificador (I420)."""
+        return self._yuv is not None
+
+    @property
+    def yuv(self) -> np.ndarray | None:
+        """Buffer I420 original (None se o frame veio em BGR)."""
+        return self._yuv
+
+    @property
+    def gray(self) -> np.ndarray:
+        """Luminância (altura, largura) uint8. Em I420 é uma view do plano Y: não copie se não for alterar."""
+        if self._gray is None:
+            if self._yuv is not None:
+                self._gray = self._yuv[:self.height]
+            else:
+                self._gray = cv2.cvtColor(self._bgr, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
+    @property
+    def bgr(self) -> np.ndarray:
+        """Frame BGR, convertido na primeira chamada."""
+        if self._bgr is None:
+            self._bgr = cv2.cvtColor(self._yuv, cv2.COLOR_YUV2BGR_I420)
+        return self._bgr
+
+    def resized(self, size: tuple[int, int]) -> 'VideoFrame':
+        """
+        Retorna o frame no tamanho pedido, no mesmo formato (o próprio frame se o tamanho já confere).
+        Em I420 cada plano é redimensionado separadamente, sem passar por BGR.
+        Args:
+            size (tuple): Tamanho (largura, altura); ambos pares em I420.
+        """
+        if tuple(size) == self.size:
+            return self
+        w, h = size
+        if self._yuv is None:
+            return VideoFrame(bgr=cv2.resize(self._bgr, (w, h))) # type: ignore[arg-type]
+        src_h, src_w = self.height, self.width
+        planes = self._yuv.reshape(-1)
+        y = planes[:src_h * src_w].reshape(src_h, src_w)
+        chroma = (src_h // 2) * (src_w // 2)
+        u = planes[src_h * src_w:src_h * src_w + chroma].reshape(src_h // 2, src_w // 2)
+        v = planes[src_h * src_w + chroma:].reshape(src_h // 2, src_w // 2)
+        out = np.empty((h * 3 // 2, w), dtype=np.uint8)
+        flat = out.reshape(-1)
+        out[:h] = cv2.resize(y, (w, h))
+        flat[w * h:w * h + (w // 2) * (h // 2)] = cv2.resize(u, (w // 2, h // 2)).reshape(-1)
+        flat[w * h + (w // 2) * (h // 2):] = cv2.resize(v, (w // 2, h // 2)).reshape(-1)
+        return VideoFrame(yuv=out)
+
+class PyAVDecoder:
+    """
+    Decodificador do stream via PyAV (pip install tello-zune[av]), entregando frames I420 sem conversão para BGR.
+    Mesma interface usada do cv2.VideoCapture: isOpened, read e release.
+    Os pacotes são demultiplexados e decodificados um a um: o stream UDP do Tello traz pacotes H.264
+    corrompidos ou incompletos com frequência, e um pacote ruim é só pulado (e contado em errors),
+    sem encerrar o decodificador. Falhas da leitura do stream em si fecham o decodificador (read retorna False).
+    Args:
+        source (str): Endereço do stream, ex: 'udp://@0.0.0.0:11111'.
+        timeout (float): Espera máxima (s) pelo início do stream ao abrir.
+    """
+    def __init__(self, source: str, timeout: float = 10.0) -> None:
+        import av
+        self.container = None
+        self.packets = None
+        self.pending: deque = deque() # Frames já decodificados do pacote atual
+        self.errors = 0 # Pacotes descartados por erro de decodificação
+        try:
+            self.container = av.open(source, options={'fflags': 'nobuffer', 'flags': 'low_delay'}, timeout=timeout)
+            stream = self.container.streams.video[0]
+            stream.thread_type = 'AUTO'
+            self.packets = self.container.demux(stream)
+        except Exception as e:
+            logger.warning("PyAV não abriu o vídeo: %s", e)
+            self.release()
+
+    def isOpened(self) -> bool:
+        return self.packets is not None
+
+    def read(self) -> tuple[bool, VideoFrame | None]:
+        """
+        Decodifica o próximo frame, pulando pacotes que não decodificam.
+        Returns:
+            tuple: (sucesso, VideoFrame em I420). (False, None) se o stream terminou ou falhou.
+        """
+        while not self.pending:
+            if self.packets is None:
+                return False, None
+            try:
+                packet = next(self.packets)
+            except StopIteration:
+                self.release()
+                return False, None
+            except Exception as e: # Erro de leitura do stream: o demux não continua depois de uma exceção
+                logger.warning("Erro ao ler o stream de vídeo: %s", e)
+                self.release()
+                return False, None
+            try:
+                self.pending.extend(packet.decode())
+            except Exception as e: # Pacote corrompido: descarta e segue para o próximo
+                self.errors += 1
+                logger.debug("Pacote de vídeo descartado: %s", e, extra={'fields': {'errors': self.errors}})
+        frame = self.pending.popleft()
+        if frame.format.name != 'yuv420p':
+            frame = frame.reformat(format='yuv420p')
+        return True, VideoFrame(yuv=frame.to_ndarray())
+
+    def release(self) -> None:
+        if self.container is not None:
+            try:
+                self.container.close()
+            except Exception:
+                pass
+        self.container = None
+        self.packets = None
+        self.pending.clear()
+
+def open_decoder(source: str, backend: str = 'auto'):
+    """
+    Abre o decodificador do stream de vídeo.
+    Args:
+        source (str): Endereço do stream.
+        backend (str): 'pyav' (frames I420, luminância sem conversão), 'opencv' (cv2.VideoCapture, frames BGR)
+            ou 'auto' (PyAV se estiver instalado).
+    Returns:
+        object: Decodificador com isOpened, read e release.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de vídeo inválido '{backend}'. Use um de {BACKENDS}.")
+    if backend in ('auto', 'pyav'):
+        try:
+            return PyAVDecoder(source)
+        except ImportError:
+            if backend == 'pyav':
+                raise
+    return cv2.VideoCapture(source, cv2.CAP_FFMPEG)
@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+
+from tello_zune.adaptive import AdaptiveResolution
+
+class TestAdaptiveResolution(unittest.TestCase):
+
+    def setUp(self):
+        self.ctrl = AdaptiveResolution(target_latency=0.1, scales=(1.0, 0.5), max_skip=2, window=5, cooldown=3)
+
+    def test_degrades_and_recovers(self):
+        """Latência alta desce os degraus; latência baixa volta a subir. Cada ajuste é registrado no log."""
+        with self.assertLogs('tello_zune.adaptive', 'INFO') as logs:
+            self._degrade_and_recover()
+        self.assertEqual(len(logs.records), 4)
+
+    def _degrade_and_recover(self):
+        for _ in range(3):
+            self.ctrl.observe(0.3, 0.05)
+        self.assertEqual((self.ctrl.scale, self.ctrl.skip), (0.5, 0))
+        for _ in range(3):
+            self.ctrl.observe(0.3, 0.05)
+        self.assertEqual((self.ctrl.scale, self.ctrl.skip), (0.5, 1))
+        for _ in range(20):
+            self.ctrl.observe(0.3, 0.05)
+        self.assertEqual(self.ctrl.level, len(self.ctrl.levels) - 1) # Não passa do limite
+
+        for _ in range(3):
+            self.ctrl.observe(0.01, 0.01)
+        self.assertEqual(self.ctrl.skip, 1)
+        self.assertEqual(len(self.ctrl.adjustments), 4)
+
+    def test_hysteresis(self):
+        """Perto do alvo nada muda."""
+        for _ in range(10):
+            self.ctrl.observe(0.09, 0.015)
+        self.assertEqual(self.ctrl.level, 0)
+        self.assertEqual(self.ctrl.adjustments, [])
+
+    def test_run_skips_and_scales(self):
+        """run pula frames conforme o degrau e entrega o frame reduzido."""
+        self.ctrl.level = len(self.ctrl.levels) - 1 # escala 0.5, pula 2
+        frame = np.zeros((40, 60, 3), dtype=np.uint8)
+        shapes = []
+        results = [self.ctrl.run(frame, 0.0, lambda f: shapes.append(f.shape)) for _ in range(6)]
+        self.assertEqual([r is not None for r in results], [True, False, False, True, False, False])
+        self.assertEqual(shapes[0], (20, 30, 3))
+        self.assertEqual(results[0][1], 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+
+from tello_zune.change_detector import ChangeDetector, ChangeGate
+
+class TestChangeGate(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.scene = rng.integers(0, 200, (240, 320, 3), dtype=np.uint8)
+        self.calls = 0
+
+    def stage(self, frame):
+        self.calls += 1
+        return self.calls
+
+    def noisy(self, frame):
+        """Mesmo frame com ruído de sensor (±2 níveis)."""
+        noise = np.random.default_rng(self.calls).integers(-2, 3, frame.shape)
+        return np.clip(frame.astype(int) + noise, 0, 255).astype(np.uint8)
+
+    def test_skips_unchanged_frames(self):
+        """Frames quase iguais reaproveitam o resultado; uma mudança roda o estágio de novo."""
+        gate = ChangeGate(threshold=3.0)
+        for i in range(5):
+            self.assertEqual(gate.run(self.noisy(self.scene), self.stage, i), 1)
+        changed = self.scene.copy()
+        changed[60:180, 80:240] = 255 # Objeto novo
+        self.assertEqual(gate.run(changed, self.stage, 5), 2)
+        stats = gate.stats()
+        self.assertEqual((stats['frames'], stats['processed'], stats['skipped']), (6, 2, 4))
+        self.assertAlmostEqual(stats['skip_ratio'], 4 / 6)
+
+    def test_slow_drift_accumulates(self):
+        """A comparação é contra o frame da última execução: mudanças lentas acabam passando do limiar."""
+        gate = ChangeGate(threshold=3.0)
+        frame = self.scene.astype(np.int16)
+        gate.run(self.scene, self.stage)
+        for _ in range(5):
+            frame = frame + 1 # 1 nível por frame, abaixo do limiar entre frames vizinhos
+            gate.run(frame.astype(np.uint8), self.stage)
+        self.assertEqual(self.calls, 2)
+
+    def test_max_skips_and_shape_change(self):
+        """O estágio roda de novo após max_skips frames ou quando o tamanho do frame muda."""
+        gate = ChangeGate(threshold=3.0, max_skips=2)
+        for _ in range(4):
+            gate.run(self.scene, self.stage)
+        self.assertEqual(self.calls, 2) # 1ª execução, 2 pulos, execução forçada
+        gate.run(self.scene[::2, ::2], self.stage)
+        self.assertEqual(self.calls, 3)
+
+    def test_thumbnail_cached_per_frame_id(self):
+        """Estágios que compartilham o detector calculam a miniatura uma vez por frame."""
+        detector = ChangeDetector()
+        qr, faces = ChangeGate(detector), ChangeGate(detector)
+        for frame_id in range(3):
+            qr.run(self.scene, self.stage, frame_id)
+            faces.run(self.scene, self.stage, frame_id)
+        self.assertEqual(detector.computed, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import time
+import threading
+import unittest
+from unittest.mock import patch
+
+from tello_zune.clock import VirtualClock
+from tello_zune.tello_zune import TelloZune
+
+class TestVirtualClock(unittest.TestCase):
+
+    def test_sleep_and_wait(self):
+        """Pausas e esperas avançam o tempo virtual na hora; evento sinalizado não avança."""
+        clock = VirtualClock(start=10.0, epoch=1000.0)
+        clock.sleep(2.5)
+        self.assertEqual((clock.monotonic(), clock.time()), (12.5, 1002.5))
+        event = threading.Event()
+        self.assertFalse(clock.wait(event, 1.0))
+        self.assertEqual(clock.monotonic(), 13.5)
+        event.set()
+        self.assertTrue(clock.wait(event, 5.0))
+        self.assertEqual(clock.monotonic(), 13.5)
+        self.assertEqual(clock.advance(0.5), 14.0)
+
+class TestVirtualTimeSchedule(unittest.TestCase):
+
+    @patch('tello_zune.tello_zune.socket.socket')
+    def setUp(self, mock_socket):
+        self.clock = VirtualClock()
+        self.tello = TelloZune(clock=self.clock)
+        self.tello.ready = True
+        self.sent: list[tuple[float, str]] = []
+
+        def drone(data, addr): # Drone simulado: responde 'ok' na hora
+            self.sent.append((self.clock.monotonic(), data.decode()))
+            self.tello.udp_cmd_ret = 'ok'
+            self.tello.cmd_recv_ev.set()
+        self.tello.sock_cmd.sendto.side_effect = drone
+
+    def tearDown(self):
+        self.tello.stop_communication()
+
+    def run_for(self, seconds: float) -> None:
+        """Executa as threads de eventos e de comandos em sequência até o instante virtual pedido."""
+        while self.clock.monotonic() < seconds:
+            self.tello._periodic_cmd()
+            while self.tello.is_route_active: # A rota só enfileira os comandos
+                time.sleep(0.001)
+            while not self.tello.command_queue.empty():
+                self.tello._read_queue()
+
+    def test_patrol_schedule(self):
+        """Uma patrulha de 30 minutos com rota a cada minuto roda em tempo virtual, sem esperar."""
+        self.tello.add_periodic_event("forward 50 e cw 90", period=600, info="patrulha", interval=5)
+        start = time.monotonic()
+        self.run_for(30 * 60)
+        self.assertLess(time.monotonic() - start, 10)
+
+        forwards = [t for t, cmd in self.sent if cmd == 'forward 50']
+        turns = [t for t, cmd in self.sent if cmd == 'cw 90']
+        self.assertGreaterEqual(len(forwards), 27) # Os 'delay 5' da rota também correm no relógio virtual
+        self.assertEqual(len(turns), len(forwards))
+        self.assertTrue(all(abs(b - a - 5.01) < 1e-6 for a, b in zip(forwards, turns)))
+        # Sem outros envios por 10 s, o keep alive sai fora da fila de comandos
+        self.assertIn('command', [cmd for _, cmd in self.sent])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import MagicMock
+
+from tello_zune.controller import PIDController, VisualServo
+
+class TestPIDController(unittest.TestCase):
+
+    def test_derivative_is_per_second(self):
+        """O mesmo perfil de erro gera a mesma saída em taxas de amostragem diferentes."""
+        outputs = []
+        for dt in (1 / 30, 1 / 10):
+            pid = PIDController(kp=0.0, kd=1.0, derivative_tau=0.0)
+            t = 0.0
+            pid.update(0.0, t)
+            out = 0.0
+            while t < 1.0 - 1e-9:
+                t += dt
+                out = pid.update(100.0 * t, t) # Erro cresce 100 unidades/s
+            outputs.append(out)
+        self.assertAlmostEqual(outputs[0], 100.0, places=6)
+        self.assertAlmostEqual(outputs[1], 100.0, places=6)
+
+    def test_anti_windup(self):
+        """O termo integral não cresce além do limite com a saída saturada."""
+        pid = PIDController(kp=1.0, ki=1.0, output_limit=100, integral_limit=20)
+        for i in range(100):
+            pid.update(500.0, i * 0.1)
+        self.assertLessEqual(abs(pid.ki * pid.integral), 20.0)
+        out = pid.update(-10.0, 10.1)
+        self.assertLess(out, 20.0)
+
+    def test_slew_rate(self):
+        """A saída varia no máximo slew_rate por segundo."""
+        pid = PIDController(kp=1.0, slew_rate=100)
+        pid.update(0.0, 0.0)
+        self.assertAlmostEqual(pid.update(90.0, 0.1), 10.0)
+        self.assertAlmostEqual(pid.update(90.0, 0.2), 20.0)
+
+    def test_slew_rate_first_sample(self):
+        """A primeira amostra depois de reset também respeita o limite, pelo período nominal."""
+        pid = PIDController(kp=1.0, slew_rate=100, nominal_dt=0.05)
+        self.assertAlmostEqual(pid.update(90.0, 0.0), 5.0)
+        self.assertAlmostEqual(pid.update(90.0, 0.0), 5.0) # Mesmo instante: sem variação
+        self.assertAlmostEqual(pid.update(90.0, 0.1), 15.0)
+        pid.reset()
+        self.assertAlmostEqual(pid.update(-90.0, 1.0), -5.0)
+
+class TestVisualServo(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 10.0
+        self.tello = MagicMock()
+        self.servo = VisualServo(
+            self.tello,
+            frame_size=(960, 720),
+            yaw_pid=PIDController(kp=1.0),
+            ud_pid=PIDController(kp=1.0),
+            clock=lambda: self.now
+        )
+
+    def test_latency_compensation(self):
+        """O alvo é projetado para frente pela idade do frame."""
+        self.servo.update_target(480, 360, 9.8)
+        self.servo.update_target(490, 360, 9.9) # Erro x cresce 100 px/s
+        err_x, err_y = self.servo.predicted_error(self.now) # Frame tem 0.1 s de idade
+        self.assertAlmostEqual(err_x, 10.0 + 50.0 * 0.1) # Velocidade filtrada (0.5 * 100)
+        self.assertAlmostEqual(err_y, 0.0)
+
+    def test_yaw_compensation(self):
+        """A rotação do próprio drone não entra na velocidade do alvo e é descontada na previsão."""
+        yaw = [20.0]
+        self.servo.yaw_source = lambda: yaw[0]
+        ppd = self.servo.px_per_degree
+        self.servo.update_target(480, 360, 9.8, yaw=0.0)
+        self.servo.update_target(480 - 10 * ppd, 360, 9.9, yaw=10.0) # Alvo parado, drone girou 10 graus
+        self.assertAlmostEqual(self.servo.velocity[0], 0.0)
+        err_x, _ = self.servo.predicted_error(self.now) # Drone já está em 20 graus
+        self.assertAlmostEqual(err_x, -20 * ppd)
+
+    def test_tick_sends_rc_and_stops_on_loss(self):
+        """O tick envia rc com o alvo ativo e para o drone uma vez ao perdê-lo."""
+        self.servo.update_target(500, 340, self.now, speed_fb=25)
+        self.assertEqual(self.servo.tick(), (0, 25, 20, 20))
+        self.tello.send_rc_control.assert_called_with(0, 25, 20, 20)
+
+        self.now += 1.0 # Sem observações além do lost_timeout
+        self.assertEqual(self.servo.tick(), (0, 0, 0, 0))
+        self.assertIsNone(self.servo.tick())
+        self.assertEqual(self.tello.send_rc_control.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
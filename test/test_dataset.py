@@ -0,0 +1,91 @@
+import os
+import json
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+import numpy as np
+
+from tello_zune.dataset import DatasetWriter, DatasetReader
+
+class TestDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'voo')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def frame(self, i: int) -> np.ndarray:
+        return np.full((48, 64, 3), i, dtype=np.uint8)
+
+    def record(self, n: int, **kwargs) -> dict:
+        with DatasetWriter(self.path, chunk_size=4, fields=('yaw', 'tof'), **kwargs) as writer:
+            for i in range(n):
+                writer.write(self.frame(i), 10.0 + i, {'yaw': i * 2, 'tof': '100'}, label=i % 2)
+        return writer.close()
+
+    def test_chunks_and_index(self):
+        """Os frames são divididos em blocos de tamanho fixo listados no índice."""
+        index = self.record(10)
+        self.assertEqual(index['frames'], 10)
+        self.assertEqual([c['count'] for c in index['chunks']], [4, 4, 2])
+        self.assertEqual(index['chunks'][1]['start_time'], 14.0)
+        with open(os.path.join(self.path, 'index.json'), encoding='utf-8') as f:
+            self.assertEqual(json.load(f), index)
+
+    def test_frame_changed_after_write(self):
+        """Desenhar no frame depois de write() não altera o que foi gravado."""
+        changed = threading.Event()
+        store = DatasetWriter._store
+        def delayed_store(writer, *item): # A thread de gravação só copia depois da alteração
+            changed.wait(5.0)
+            store(writer, *item)
+        with patch.object(DatasetWriter, '_store', delayed_store):
+            with DatasetWriter(self.path, chunk_size=4) as writer:
+                frame = self.frame(5)
+                state = {'yaw': 1}
+                writer.write(frame, 1.0, state)
+                frame[:] = 255 # Ex: caixas e HUD desenhados para exibição
+                state['yaw'] = 99
+                changed.set()
+        stored, meta = DatasetReader(self.path)[0]
+        self.assertTrue((stored == 5).all())
+        self.assertEqual(meta['yaw'], 1.0)
+
+    def test_random_access(self):
+        """O leitor acessa qualquer frame com seus metadados, inclusive em lotes fora de ordem."""
+        self.record(10)
+        reader = DatasetReader(self.path)
+        self.assertEqual(len(reader), 10)
+        frame, meta = reader[6]
+        self.assertEqual(frame[0, 0, 0], 6)
+        self.assertEqual((meta['timestamp'], meta['label'], meta['yaw'], meta['tof']), (16.0, 0, 12.0, 100.0))
+        self.assertEqual(reader[-1][0][0, 0, 0], 9)
+
+        frames, metas = reader.batch([9, 0, 5, 4])
+        self.assertEqual(frames[:, 0, 0, 0].tolist(), [9, 0, 5, 4])
+        self.assertEqual(metas['timestamp'].tolist(), [19.0, 10.0, 15.0, 14.0])
+
+        seen = np.concatenate([m['timestamp'] for _, m in reader.batches(3, seed=1)])
+        self.assertEqual(sorted(seen.tolist()), [10.0 + i for i in range(10)])
+
+    def test_resize_and_missing_state(self):
+        """Frames são reduzidos ao tamanho pedido e campos ausentes ficam NaN."""
+        with DatasetWriter(self.path, size=(32, 24), chunk_size=4, fields=('yaw', 'h')) as writer:
+            writer.write(self.frame(1), 1.0, {'yaw': 5})
+        reader = DatasetReader(self.path)
+        frame, meta = reader[0]
+        self.assertEqual(frame.shape, (24, 32, 3))
+        self.assertEqual(meta['label'], -1)
+        self.assertTrue(np.isnan(meta['h']))
+
+    def test_refuses_existing_dataset(self):
+        """Não sobrescreve um dataset existente."""
+        self.record(1)
+        with self.assertRaises(FileExistsError):
+            DatasetWriter(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import numpy as np
+
+from tello_zune.face_detector import FaceDetector
+
+class FakeClassifier:
+    """Classificador falso que 'encontra' a textura na posição informada."""
+    def __init__(self):
+        self.box = None
+        self.calls = []
+
+    def detectMultiScale(self, gray, **kwargs):
+        self.calls.append(gray.shape)
+        if self.box is None:
+            return []
+        return [self.box]
+
+class TestFaceDetector(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.patch = rng.integers(0, 255, (60, 60), dtype=np.uint8)
+        self.classifier = FakeClassifier()
+        self.detector = FaceDetector(
+            classifier=self.classifier, detect_every=5, full_scan_every=20, min_size=(10, 10)
+        )
+
+    def make_frame(self, x, y):
+        frame = np.full((240, 320), 128, dtype=np.uint8)
+        frame[y:y + 60, x:x + 60] = self.patch
+        return frame
+
+    def test_tracks_between_detections(self):
+        """Entre detecções o detector segue a face sem chamar o Haar."""
+        self.classifier.box = (100, 80, 60, 60)
+        self.assertEqual(self.detector.detect(self.make_frame(100, 80)), [(100, 80, 60, 60)])
+        self.assertEqual(self.detector.last_mode, 'full')
+
+        self.classifier.box = None # Qualquer nova chamada ao Haar perderia a face
+        boxes = self.detector.detect(self.make_frame(106, 84))
+        self.assertEqual(boxes, [(106, 84, 60, 60)])
+        self.assertEqual(self.detector.last_mode, 'track')
+        self.assertEqual(len(self.classifier.calls), 1)
+
+    def test_rescan_restricted_to_window(self):
+        """A redetecção periódica roda apenas na janela em torno da face."""
+        self.classifier.box = (100, 80, 60, 60)
+        self.detector.detect(self.make_frame(100, 80))
+        for _ in range(4):
+            self.detector.detect(self.make_frame(100, 80))
+        self.classifier.box = (30, 30, 60, 60) # Coordenadas relativas à janela
+        boxes = self.detector.detect(self.make_frame(100, 80))
+        self.assertEqual(self.detector.last_mode, 'roi')
+        self.assertEqual(self.classifier.calls[-1], (120, 120))
+        self.assertEqual(boxes, [(100, 80, 60, 60)])
+
+    def test_track_loss_triggers_full_scan(self):
+        """Perder o template força a varredura completa no mesmo frame."""
+        self.classifier.box = (100, 80, 60, 60)
+        self.detector.detect(self.make_frame(100, 80))
+        self.classifier.box = None
+        boxes = self.detector.detect(np.full((240, 320), 128, dtype=np.uint8))
+        self.assertEqual(boxes, [])
+        self.assertEqual(self.detector.last_mode, 'full')
+        self.assertEqual(self.classifier.calls[-1], (240, 320))
+
+    def test_empty_scan_throttled(self):
+        """Sem faces, a varredura completa roda a cada empty_scan_every frames e os demais não custam nada."""
+        detector = FaceDetector(classifier=self.classifier, empty_scan_every=3, min_size=(10, 10))
+        frame = np.full((240, 320), 128, dtype=np.uint8)
+        modes = []
+        for _ in range(7):
+            self.assertEqual(detector.detect(frame), [])
+            modes.append(detector.last_mode)
+        self.assertEqual(modes, ['full', 'idle', 'idle', 'full', 'idle', 'idle', 'full'])
+        self.assertEqual(len(self.classifier.calls), 3)
+        detector.reset()
+        detector.detect(frame)
+        self.assertEqual(detector.last_mode, 'full')
+
+    def test_stats(self):
+        """As estatísticas contabilizam o custo por modo."""
+        self.classifier.box = (100, 80, 60, 60)
+        self.detector.detect(self.make_frame(100, 80))
+        self.detector.detect(self.make_frame(100, 80))
+        stats = self.detector.stats()
+        self.assertEqual(stats['frames'], 2)
+        self.assertEqual(stats['modes']['full']['count'], 1)
+        self.assertEqual(stats['modes']['track']['count'], 1)
+        self.assertGreaterEqual(stats['last_cost_ms'], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
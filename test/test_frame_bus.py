@@ -0,0 +1,96 @@
+import sys
+import unittest
+import subprocess
+import multiprocessing
+from unittest.mock import patch
+import numpy as np
+
+from tello_zune.frame_bus import FramePublisher, FrameSubscriber, ResultChannel, _tracker_id
+
+def _worker(name, results):
+    """Processo de visão: lê o frame mais recente e devolve (seq, média)."""
+    sub = FrameSubscriber(name)
+    item = sub.wait_next(timeout=5.0)
+    if item is not None:
+        seq, frame, _ = item
+        results.put((seq, float(frame.mean())))
+    sub.close()
+
+class TestFrameBus(unittest.TestCase):
+
+    def setUp(self):
+        self.pub = FramePublisher((4, 6, 3), slots=3)
+        self.sub = FrameSubscriber(self.pub.name)
+
+    def tearDown(self):
+        self.sub.close()
+        self.pub.close()
+
+    def test_read_latest_zero_copy(self):
+        """O leitor vê o frame mais recente como visão da memória compartilhada."""
+        self.assertIsNone(self.sub.read_latest())
+        self.pub.publish(np.full((4, 6, 3), 1, dtype=np.uint8), 1.0)
+        seq = self.pub.publish(np.full((4, 6, 3), 2, dtype=np.uint8), 2.0)
+        got_seq, frame, timestamp = self.sub.read_latest()
+        self.assertEqual((got_seq, timestamp), (seq, 2.0))
+        self.assertTrue((frame == 2).all())
+        self.assertFalse(frame.flags.owndata)
+
+    def test_overwrite_detection(self):
+        """Depois de o anel dar a volta, o frame antigo deixa de ser válido."""
+        seq = self.pub.publish(np.zeros((4, 6, 3), dtype=np.uint8))
+        self.sub.read_latest()
+        self.assertTrue(self.sub.is_valid(seq))
+        for _ in range(3):
+            self.pub.publish(np.zeros((4, 6, 3), dtype=np.uint8))
+        self.assertFalse(self.sub.is_valid(seq))
+
+    def test_wrong_shape(self):
+        """Frames com formato diferente do anel são rejeitados."""
+        with self.assertRaises(ValueError):
+            self.pub.publish(np.zeros((2, 2, 3), dtype=np.uint8))
+
+    def test_wait_next_timeout(self):
+        """wait_next retorna None se nenhum frame novo chegar."""
+        self.assertIsNone(self.sub.wait_next(timeout=0.01))
+
+    def test_worker_process(self):
+        """Um processo separado lê o frame e devolve o resultado pelo canal."""
+        results = ResultChannel()
+        proc = multiprocessing.Process(target=_worker, args=(self.pub.name, results))
+        proc.start()
+        seq = self.pub.publish(np.full((4, 6, 3), 7, dtype=np.uint8))
+        self.assertEqual(results.get(timeout=5.0), (seq, 7.0))
+        proc.join(5.0)
+
+    def test_tracker_registration(self):
+        """Leitores com o tracker do publicador mantêm o registro; processos independentes o desfazem."""
+        with patch('multiprocessing.resource_tracker.unregister') as unregister:
+            FrameSubscriber(self.pub.name).close()
+        unregister.assert_not_called()
+        # Um interpretador independente tem tracker próprio: sem desfazer o registro, ele apagaria o bloco ao sair
+        code = f"from tello_zune.frame_bus import FrameSubscriber; FrameSubscriber({self.pub.name!r}).close()"
+        proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=30)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertNotIn('leaked', proc.stderr)
+        FrameSubscriber(self.pub.name).close() # O bloco continua existindo
+
+    @unittest.skipIf(sys.version_info >= (3, 13), "track=False dispensa o resource_tracker")
+    def test_tracker_id_fallback(self):
+        """Sem o atributo privado do resource_tracker, o id é 0 e o leitor desfaz o registro."""
+        with patch('multiprocessing.resource_tracker._resource_tracker', None):
+            self.assertEqual(_tracker_id(), 0)
+            with patch('multiprocessing.resource_tracker.unregister') as unregister:
+                FrameSubscriber(self.pub.name).close()
+        unregister.assert_called_once()
+
+    def test_result_channel_drops_when_full(self):
+        """O canal descarta resultados em vez de bloquear quem publica."""
+        channel = ResultChannel(maxsize=1)
+        self.assertTrue(channel.put('a'))
+        self.assertFalse(channel.put('b'))
+        self.assertEqual(channel.dropped.value, 1)
+        self.assertEqual(channel.get(timeout=1.0), 'a')
+
+if __name__ == '__main__':
+    unittest.main()
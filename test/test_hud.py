@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import MagicMock
+import numpy as np
+
+from tello_zune.hud import Hud
+
+class TestHud(unittest.TestCase):
+
+    def setUp(self):
+        self.hud = Hud(lines=[('bat', 'Bat: {}%'), ('tof', 'Height: {}cm')], font_scale=0.5, line_height=20)
+
+    def test_renders_only_on_change(self):
+        """O overlay só é refeito quando um valor inscrito muda."""
+        self.assertTrue(self.hud.update(bat='80', tof='10'))
+        self.assertFalse(self.hud.update(bat='80', tof='10'))
+        self.assertFalse(self.hud.update(fps=30)) # Chave não inscrita
+        self.assertTrue(self.hud.update({'bat': '79'}))
+        self.assertEqual(self.hud.render_count, 2)
+
+    def test_apply_only_touches_text_pixels(self):
+        """A composição altera apenas os pixels do texto, dentro da região do overlay."""
+        self.hud.update(bat='80', tof='10')
+        frame = np.full((120, 160, 3), 7, dtype=np.uint8)
+        self.hud.apply(frame)
+        x, y = self.hud.position
+        h, w = self.hud.overlay.shape[:2]
+        region = frame[y:y + h, x:x + w]
+        mask = self.hud.mask[:, :, 0]
+        self.assertTrue((region[mask] == self.hud.color).all())
+        self.assertTrue((region[~mask] == 7).all())
+        outside = frame.copy()
+        outside[y:y + h, x:x + w] = 7
+        self.assertTrue((outside == 7).all())
+
+    def test_apply_clips_to_small_frame(self):
+        """O overlay é recortado quando o frame é menor que ele."""
+        self.hud.update(bat='80', tof='10')
+        frame = np.zeros((15, 30, 3), dtype=np.uint8)
+        self.hud.apply(frame)
+        self.assertEqual(frame.shape, (15, 30, 3))
+
+    def test_update_from_tello(self):
+        """Os valores são lidos de get_info() e calc_fps()."""
+        tello = MagicMock()
+        tello.get_info.return_value = ('80', '10', '60', '65', '10')
+        tello.calc_fps.return_value = 30
+        hud = Hud()
+        self.assertTrue(hud.update_from_tello(tello))
+        self.assertEqual(hud.values['fps'], 30)
+        self.assertEqual(hud.values['bat'], '80')
+        self.assertFalse(hud.update_from_tello(tello))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from tello_zune.link import LinkMonitor
+from tello_zune.tello_zune import TelloZune
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestLinkMonitor(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.link = LinkMonitor(keepalive_after=10.0, clock=self.clock)
+
+    def test_keepalive_only_when_idle(self):
+        """Qualquer envio (inclusive rc) adia o keep alive."""
+        self.clock.now = 9.0
+        self.assertFalse(self.link.keepalive_due())
+        self.link.record_send()
+        self.clock.now = 18.0
+        self.assertFalse(self.link.keepalive_due())
+        self.clock.now = 19.0
+        self.assertTrue(self.link.keepalive_due())
+        with self.link.probe_lock: # Keep alive em andamento
+            self.assertFalse(self.link.keepalive_due())
+
+    def test_state_gaps_count_as_loss(self):
+        """Lacunas na chegada do estado aumentam a perda; pacotes em dia a reduzem."""
+        for i in range(20):
+            self.link.record_state(i * 0.1)
+        self.assertEqual(self.link.state_missing, 0)
+        self.link.record_state(2.4) # 4 pacotes perdidos
+        self.assertEqual(self.link.state_missing, 4)
+        lossy = self.link.state_loss
+        self.assertGreater(lossy, 0.1)
+        for i in range(25, 60):
+            self.link.record_state(i * 0.1)
+        self.assertLess(self.link.state_loss, lossy)
+
+    def test_quality_and_status(self):
+        """A qualidade cai com perdas, RTT alto e estado atrasado."""
+        self.link.record_state(0.0)
+        self.link.rtt.observe(0.02)
+        self.assertEqual(self.link.update_status(), ('unknown', 'good'))
+        for _ in range(10):
+            self.link.record_timeout()
+        self.assertLess(self.link.quality(), 0.5)
+        self.assertEqual(self.link.update_status(), ('good', 'poor'))
+        self.clock.now = 3.0 # Sem estado há 3 s
+        self.assertEqual(self.link.quality(), 0.0)
+        self.assertEqual(self.link.update_status()[1], 'lost')
+
+class TestTelloLink(unittest.TestCase):
+
+    @patch('tello_zune.tello_zune.socket.socket')
+    def setUp(self, mock_socket):
+        self.tello = TelloZune()
+        self.tello.sock_cmd = MagicMock()
+
+    def test_no_keepalive_in_event_list(self):
+        """O keep alive não ocupa mais a lista de eventos nem a fila de comandos."""
+        self.assertEqual(self.tello.event_list, [])
+        self.tello.link.last_cmd_send -= 60
+        with patch.object(self.tello, 'send_cmd_return') as mock_send:
+            self.tello._keepalive()
+        mock_send.assert_called_once()
+        self.assertEqual(mock_send.call_args[0][0], 'command')
+        self.assertTrue(self.tello.command_queue.empty())
+
+    def test_rc_counts_as_traffic(self):
+        """Pacotes rc enviados por send_cmd adiam o keep alive."""
+        self.tello.link.last_cmd_send -= 60
+        self.assertTrue(self.tello.link.keepalive_due())
+        self.tello.send_cmd('rc 0 0 0 0')
+        self.assertFalse(self.tello.link.keepalive_due())
+        self.assertIn('tello_link_quality', self.tello.metrics())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import json
+import logging
+import time
+import unittest
+
+from tello_zune import log
+from tello_zune.log import RateLimitFilter, StructuredFormatter, configure_logging, get_logger, shutdown_logging
+
+class SlowStream(io.StringIO):
+    """Terminal lento: cada escrita demora."""
+    def write(self, s):
+        time.sleep(0.01)
+        return super().write(s)
+
+def make_record(msg, *args, level=logging.INFO, name='tello_zune.teste', **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+class TestLogging(unittest.TestCase):
+
+    def tearDown(self):
+        shutdown_logging()
+
+    def test_async_handler_does_not_block(self):
+        """Com um terminal lento, logar custa só o put na fila; tudo é escrito depois."""
+        stream = SlowStream()
+        logger = configure_logging(stream=stream, rate=0)
+        child = get_logger('teste')
+        start = time.perf_counter()
+        for i in range(20):
+            child.info("Comando %d", i)
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 0.1) # 20 escritas síncronas levariam 0.2 s
+        self.assertFalse(logger.propagate)
+        shutdown_logging()
+        self.assertEqual(stream.getvalue().count('Comando'), 20)
+
+    def test_no_unthrottled_copies_to_root(self):
+        """Com o handler assíncrono, o logger raiz não recebe cópias sem o limite de frequência."""
+        root_stream = io.StringIO()
+        root = logging.getLogger()
+        handler = logging.StreamHandler(root_stream)
+        root.addHandler(handler)
+        try:
+            stream = io.StringIO()
+            configure_logging(stream=stream, rate=1.0, burst=2)
+            child = get_logger('teste')
+            for i in range(10):
+                child.info("Comando %d", i)
+            shutdown_logging()
+        finally:
+            root.removeHandler(handler)
+        self.assertEqual(stream.getvalue().count('Comando'), 2)
+        self.assertEqual(root_stream.getvalue(), '')
+
+    def test_rate_limit_per_message(self):
+        """Cada mensagem-modelo tem sua própria cota; a suprimida é contada na próxima aceita."""
+        f = RateLimitFilter(rate=1000, burst=3)
+        results = [f.filter(make_record("Passo %d", i)) for i in range(5)]
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertTrue(f.filter(make_record("Outra mensagem")))
+        time.sleep(0.01) # Recarrega a cota
+        record = make_record("Passo %d", 6)
+        self.assertTrue(f.filter(record))
+        self.assertEqual(record.suppressed, 2)
+
+    def test_dedup_repeated_errors(self):
+        """Erros idênticos dentro da janela são agrupados."""
+        f = RateLimitFilter(rate=1000, burst=100, dedup_window=0.05)
+        self.assertTrue(f.filter(make_record("Erro: %s", 'timeout', level=logging.ERROR)))
+        self.assertFalse(f.filter(make_record("Erro: %s", 'timeout', level=logging.ERROR)))
+        self.assertTrue(f.filter(make_record("Erro: %s", 'socket', level=logging.ERROR))) # Texto diferente
+        time.sleep(0.06)
+        record = make_record("Erro: %s", 'timeout', level=logging.ERROR)
+        self.assertTrue(f.filter(record))
+        self.assertEqual(record.suppressed, 1)
+
+    def test_structured_formatter(self):
+        """Os campos estruturados aparecem como chave=valor ou em JSON."""
+        record = make_record("Comando %s", 'takeoff', fields={'rtt': 0.05}, suppressed=2)
+        text = StructuredFormatter().format(record)
+        self.assertEqual(text, "Comando takeoff rtt=0.05 (+2 mensagens semelhantes suprimidas)")
+        data = json.loads(StructuredFormatter(as_json=True).format(record))
+        self.assertEqual((data['message'], data['rtt'], data['level']), ('Comando takeoff', 0.05, 'INFO'))
+
+    def test_ensure_logging_respects_app_config(self):
+        """Sem configure_logging a biblioteca só instala um NullHandler, e a configuração da aplicação,
+        mesmo feita depois do import, recebe os registros."""
+        shutdown_logging()
+        log.ensure_logging()
+        log.ensure_logging()
+        self.assertIsNone(log._handler)
+        handlers = get_logger().handlers
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], logging.NullHandler)
+        self.assertTrue(get_logger().propagate)
+
+        stream = io.StringIO()
+        root = logging.getLogger()
+        handler = logging.StreamHandler(stream)
+        root.addHandler(handler)
+        old_level = root.level
+        root.setLevel(logging.INFO)
+        try:
+            get_logger('teste').info("Comando %s", 'takeoff')
+        finally:
+            root.removeHandler(handler)
+            root.setLevel(old_level)
+        self.assertIn("Comando takeoff", stream.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
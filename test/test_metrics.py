@@ -0,0 +1,59 @@
+import unittest
+import urllib.request
+
+from tello_zune.metrics import MetricsRegistry, MetricsServer
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.reg = MetricsRegistry()
+
+    def test_get_or_create(self):
+        """A mesma série é devolvida para o mesmo nome e rótulos."""
+        a = self.reg.counter('x_total', labels={'t': 'a'})
+        self.assertIs(a, self.reg.counter('x_total', labels={'t': 'a'}))
+        self.assertIsNot(a, self.reg.counter('x_total', labels={'t': 'b'}))
+        with self.assertRaises(ValueError):
+            self.reg.gauge('x_total')
+
+    def test_histogram_snapshot(self):
+        """O histograma acumula por bucket, como no Prometheus."""
+        h = self.reg.histogram('rtt_seconds', buckets=(0.1, 1.0))
+        for v in (0.05, 0.5, 0.5, 5.0):
+            h.observe(v)
+        snap = self.reg.snapshot()['rtt_seconds'][()]
+        self.assertEqual(snap['count'], 4)
+        self.assertAlmostEqual(snap['sum'], 6.05)
+        self.assertEqual(list(snap['buckets'].values()), [1, 3, 4])
+
+    def test_gauge_callback(self):
+        """Gauges com fn são lidos apenas na coleta."""
+        depth = [3]
+        self.reg.gauge('queue_depth', fn=lambda: depth[0])
+        depth[0] = 5
+        self.assertEqual(self.reg.snapshot()['queue_depth'][()], 5.0)
+
+    def test_prometheus_text(self):
+        """A exportação segue o formato texto do Prometheus."""
+        self.reg.counter('frames_total', 'Frames').inc(2)
+        self.reg.histogram('rtt_seconds', labels={'command': 'cw'}, buckets=(0.1,)).observe(0.05)
+        text = self.reg.render_prometheus()
+        self.assertIn('# HELP frames_total Frames\n# TYPE frames_total counter\nframes_total 2.0\n', text)
+        self.assertIn('rtt_seconds_bucket{command="cw",le="0.1"} 1\n', text)
+        self.assertIn('rtt_seconds_bucket{command="cw",le="+Inf"} 1\n', text)
+        self.assertIn('rtt_seconds_count{command="cw"} 1\n', text)
+
+    def test_server(self):
+        """O endpoint /metrics serve o texto do registro."""
+        self.reg.counter('frames_total').inc()
+        server = MetricsServer(self.reg, port=0)
+        server.start()
+        try:
+            host, port = server.address
+            with urllib.request.urlopen(f'http://{host}:{port}/metrics', timeout=5) as resp:
+                self.assertIn(b'frames_total 1.0', resp.read())
+        finally:
+            server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tello_zune import mission as mission_module
+from tello_zune.mission import MissionError, load_mission
+from tello_zune.tello_zune import TelloZune
+
+MISSION = {
+    'name': 'vigilancia',
+    'speed': 40,
+    'routes': {
+        'patrulha': {'steps': 'forward 50 e forward 50 e cw 90', 'interval': 2},
+        'quadrado': {'waypoints': [[100, 0, 0], {'at': [100, 100, 0], 'dwell': 3}, [0, 0, 0]], 'interval': 1},
+        'pousar': 'land',
+    },
+    'triggers': [{'route': 'patrulha', 'period': 100, 'info': 'Vigilância'}],
+    'branches': {'pouse': 'pousar'},
+}
+
+class TestMission(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, 'cache')
+        mission_module._memory_cache.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        mission_module._memory_cache.clear()
+
+    def write(self, data, name='missao.json'):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(data if isinstance(data, str) else json.dumps(data))
+        return path
+
+    def test_compiles_routes_and_waypoints(self):
+        """Rotas e waypoints são compilados em planos com todos os waypoints visitados."""
+        mission = load_mission(self.write(MISSION), self.cache_dir)
+        self.assertEqual(mission.routes['patrulha'].plan.commands, ['forward 100', 'cw 90'])
+        self.assertEqual(mission.routes['quadrado'].plan.commands, ['forward 100', 'left 100', 'delay 3', 'go -100 -100 0 40'])
+        self.assertEqual(mission.branch('pouse').plan.commands, ['land'])
+        self.assertIsNone(mission.branch('outro'))
+
+    def test_reports_all_errors_up_front(self):
+        """Todos os erros (passos, campos, referências) são reportados antes do voo."""
+        bad = {
+            'routes': {'a': 'forward', 'b': {'steps': 'cw 90', 'intervall': 2}, 'c': {'steps': 'forward 50 e cw 90', 'interval': 0}},
+            'triggers': [{'route': 'x', 'period': 10}, {'route': 'c', 'period': 10}],
+            'branches': {'qr': 'y'},
+        }
+        with self.assertRaises(MissionError) as ctx:
+            load_mission(self.write(bad), self.cache_dir)
+        errors = '\n'.join(ctx.exception.errors)
+        self.assertEqual(len(ctx.exception.errors), 5)
+        for expected in ("routes.a", "intervall", "triggers[0].route", "triggers[1]", "branches.qr"):
+            self.assertIn(expected, errors)
+
+    def test_unhashable_references(self):
+        """Listas e objetos no lugar do nome da rota viram erros de validação, não TypeError."""
+        bad = {
+            'routes': {'a': 'forward 50'},
+            'triggers': [{'route': ['a'], 'period': 10}],
+            'branches': {'qr': {'rota': 'a'}},
+        }
+        with self.assertRaises(MissionError) as ctx:
+            load_mission(self.write(bad), self.cache_dir)
+        self.assertEqual(len(ctx.exception.errors), 2)
+        errors = '\n'.join(ctx.exception.errors)
+        self.assertIn("triggers[0].route", errors)
+        self.assertIn("branches.qr", errors)
+        with self.assertRaises(MissionError):
+            load_mission(self.write({'routes': {'a': 'forward 50'}, 'triggers': {'route': 'a'}}), self.cache_dir)
+
+    def test_cache_by_hash(self):
+        """Missões já compiladas vêm do cache em memória ou em disco, pelo hash do arquivo."""
+        path = self.write(MISSION)
+        first = load_mission(path, self.cache_dir)
+        self.assertIs(load_mission(path, self.cache_dir), first)
+        self.assertEqual(os.listdir(self.cache_dir), [f"{first.digest}.json"])
+
+        mission_module._memory_cache.clear()
+        with patch.object(mission_module, 'compile_mission') as mock_compile:
+            cached = load_mission(path, self.cache_dir)
+        mock_compile.assert_not_called()
+        self.assertEqual(cached, first)
+
+        changed = dict(MISSION, speed=60)
+        self.assertNotEqual(load_mission(self.write(changed), self.cache_dir).digest, first.digest)
+
+    def test_cache_invalidated_by_compiler(self):
+        """Uma mudança no compilador muda a chave do cache, sem precisar incrementar MISSION_FORMAT."""
+        path = self.write(MISSION)
+        first = load_mission(path, self.cache_dir)
+        mission_module._memory_cache.clear()
+        with patch.object(mission_module, '_compiler_hash', 'outro compilador'):
+            recompiled = load_mission(path, self.cache_dir)
+        self.assertNotEqual(recompiled.digest, first.digest)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_rejects_empty_plans(self):
+        """Rotas cujo plano compilado fica vazio são rejeitadas na validação, com os gatilhos que as usam."""
+        bad = {
+            'routes': {'vai_e_volta': 'forward 100 e back 100', 'parado': {'waypoints': [[0, 0, 0]], 'interval': 1}},
+            'triggers': [{'route': 'vai_e_volta', 'period': 10}],
+        }
+        with self.assertRaises(MissionError) as ctx:
+            load_mission(self.write(bad), None)
+        errors = '\n'.join(ctx.exception.errors)
+        self.assertIn('routes.vai_e_volta', errors)
+        self.assertIn('routes.parado', errors)
+
+    def test_yaml(self):
+        """Missões em YAML têm o mesmo formato."""
+        try:
+            import yaml
+        except ImportError:
+            self.skipTest("PyYAML não instalado")
+        mission = load_mission(self.write(yaml.safe_dump(MISSION), 'missao.yaml'), None)
+        self.assertEqual(mission.routes['patrulha'].plan.commands, ['forward 100', 'cw 90'])
+
+    @patch('builtins.print')
+    @patch('tello_zune.tello_zune.socket.socket')
+    def test_tello_load_mission(self, mock_socket, mock_print):
+        """load_mission registra os gatilhos e run_branch executa os desvios."""
+        tello = TelloZune()
+        tello.load_mission(self.write(MISSION), self.cache_dir)
+        self.assertEqual(tello.event_list[-1]['commands'], ['forward 100', 'cw 90'])
+        self.assertEqual(tello.event_list[-1]['interval'], 2)
+
+        with patch.object(tello, '_execute_route') as mock_route:
+            self.assertTrue(tello.run_branch('pouse'))
+            self.assertFalse(tello.run_branch('pouse')) # Rota anterior ainda ativa
+        mock_route.assert_called_once_with(['land'], 10)
+        self.assertFalse(tello.run_branch('desconhecido'))
+
+if __name__ == '__main__':
+    unittest.main()
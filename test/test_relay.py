@@ -0,0 +1,105 @@
+import math
+import socket
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tello_zune import relay
+from tello_zune.relay import StateRelay, RelayClient, KIND_STATE, KIND_RESPONSE
+from tello_zune.tello_zune import TelloZune
+
+PACKET = {'pitch': '1', 'roll': '-2', 'yaw': '90', 'tof': '120', 'bat': '77'}
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+class TestEncoding(unittest.TestCase):
+
+    def test_round_trip(self):
+        """Estado e respostas sobrevivem à codificação binária; campos ausentes viram NaN."""
+        data = relay.encode_state(7, 12.5, PACKET)
+        self.assertEqual(len(data), relay.HEADER.size + relay.STATE.size)
+        msg = relay.decode(data)
+        self.assertEqual((msg.kind, msg.seq, msg.timestamp), (KIND_STATE, 7, 12.5))
+        self.assertEqual((msg.get('yaw'), msg.get('bat')), (90.0, 77.0))
+        self.assertTrue(math.isnan(msg.state['h']))
+        msg = relay.decode(relay.encode_response(8, 13.0, 'ok'))
+        self.assertEqual((msg.kind, msg.text), (KIND_RESPONSE, 'ok'))
+        self.assertIsNone(relay.decode(b'pitch:0;roll:0;'))
+
+class TestTransports(unittest.TestCase):
+
+    def check_fan_out(self, pub: StateRelay, clients: list[RelayClient]) -> None:
+        pub.publish_state(1.0, PACKET)
+        pub.publish_response(1.1, 'ok')
+        pub._next_seq() # Simula uma mensagem perdida
+        pub.publish_state(1.2, {**PACKET, 'bat': '76'})
+        for client in clients:
+            self.assertEqual(client.recv(timeout=1).get('bat'), 77.0)
+            self.assertEqual(client.recv(timeout=1).text, 'ok')
+            self.assertEqual(client.recv(timeout=1).get('bat'), 76.0)
+            self.assertEqual((client.received, client.missed), (3, 1))
+            self.assertEqual(client.state['yaw'], 90.0)
+
+    def test_multicast(self):
+        """Um único envio chega a todos os assinantes do grupo no loopback."""
+        port = free_port()
+        try:
+            clients = [RelayClient('multicast', port=port) for _ in range(3)]
+        except OSError as e:
+            self.skipTest(f"Multicast indisponível: {e}")
+        pub = StateRelay('multicast', port=port)
+        try:
+            self.check_fan_out(pub, clients)
+            self.assertEqual(pub.sent, 3) # Independe da quantidade de assinantes
+        finally:
+            pub.close()
+            for client in clients:
+                client.close()
+
+    def test_unix(self):
+        """No transporte unix cada assinante tem um socket no diretório; sockets abandonados são removidos."""
+        with tempfile.TemporaryDirectory() as path:
+            clients = [RelayClient('unix', path=path) for _ in range(2)]
+            stale = RelayClient('unix', path=path)
+            stale.sock.close() # Processo que morreu sem remover o arquivo
+            pub = StateRelay('unix', path=path)
+            try:
+                self.check_fan_out(pub, clients)
+                self.assertEqual(pub.stats()['subscribers'], 2)
+            finally:
+                pub.close()
+                for client in clients:
+                    client.close()
+
+class TestTelloZuneRelay(unittest.TestCase):
+
+    @patch('tello_zune.tello_zune.socket.socket')
+    def setUp(self, mock_socket):
+        self.tello = TelloZune()
+
+    def tearDown(self):
+        self.tello.stop_communication()
+
+    def test_republishes_state_and_responses(self):
+        """O dono da porta de estado republica cada pacote e cada resposta."""
+        with tempfile.TemporaryDirectory() as path:
+            client = RelayClient('unix', path=path)
+            self.tello.start_relay('unix', path=path)
+            self.tello.sock_state.recvfrom.return_value = (b'pitch:0;roll:0;yaw:-45;tof:80;bat:60;\r\n', ('x', 1))
+            self.tello._state_receive()
+            self.tello.sock_cmd.recvfrom.return_value = (b'ok', ('x', 1))
+            self.tello._response_cmd_receive()
+            try:
+                state = client.recv(timeout=1)
+                self.assertEqual((state.get('yaw'), state.get('bat')), (-45.0, 60.0))
+                self.assertEqual(client.recv(timeout=1).text, 'ok')
+            finally:
+                client.close()
+                self.tello.stop_relay()
+            self.assertIsNone(self.tello.relay)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+
+from tello_zune.route import RouteError, RoutePlan, compile_route, estimate_command_time
+from tello_zune.tello_zune import TelloZune
+
+class TestCompileRoute(unittest.TestCase):
+
+    def test_merges_and_cancels_same_axis(self):
+        """Movimentos no mesmo eixo são somados e opostos se cancelam."""
+        plan = compile_route("forward 100 e forward 50 e back 30 e cw 90")
+        self.assertEqual(plan.commands, ['forward 120', 'cw 90'])
+        plan = compile_route("up 50 e down 50 e cw 90")
+        self.assertEqual(plan.commands, ['cw 90'])
+
+    def test_rotations_use_shortest_angle(self):
+        """Rotações consecutivas viram uma só, pelo menor ângulo."""
+        self.assertEqual(compile_route("cw 90 e cw 180").commands, ['ccw 90'])
+        self.assertEqual(compile_route("cw 90 e ccw 90 e forward 50").commands, ['forward 50'])
+        self.assertEqual(compile_route("cw 180 e cw 180").commands, ['cw 360']) # Volta completa não some
+
+    def test_single_rotation_is_kept(self):
+        """Uma rotação isolada não é normalizada: varreduras completas e o sentido são preservados."""
+        self.assertEqual(compile_route("cw 360").commands, ['cw 360'])
+        self.assertEqual(compile_route("cw 270").commands, ['cw 270'])
+        self.assertEqual(compile_route("ccw 200 e forward 50").commands, ['ccw 200', 'forward 50'])
+
+    def test_route_that_cancels_out(self):
+        """Uma rota que se cancela por completo é rejeitada, em vez de virar um evento que não faz nada."""
+        for route in ("forward 100 e back 100", "cw 90 e ccw 90"):
+            with self.assertRaises(RouteError):
+                compile_route(route)
+        self.assertEqual(compile_route("forward 100 e back 100", optimize=False).commands, ['forward 100', 'back 100'])
+
+    def test_translations_become_go(self):
+        """Translações em eixos diferentes viram um único 'go'."""
+        plan = compile_route("speed 40 e forward 100 e left 50 e up 30 e cw 90")
+        self.assertEqual(plan.commands, ['speed 40', 'go 100 50 30 40', 'cw 90'])
+        self.assertEqual(plan.steps[1].source, ['forward 100', 'left 50', 'up 30'])
+        plan = compile_route("forward 100 e left 50", use_go=False)
+        self.assertEqual(plan.commands, ['forward 100', 'left 50'])
+
+    def test_curve_through_corner(self):
+        """Com use_curve, duas translações viram um arco que passa pelo canto."""
+        plan = compile_route("forward 100 e left 100", use_curve=True)
+        self.assertEqual(plan.commands, ['curve 100 0 0 100 100 0 50'])
+        # Arco com raio abaixo do mínimo do SDK volta para 'go'
+        plan = compile_route("forward 40 e left 40", use_curve=True)
+        self.assertEqual(plan.commands, ['go 40 40 0 50'])
+
+    def test_respects_sdk_limits(self):
+        """Distâncias líquidas fora de 20~500 cm são divididas em comandos válidos."""
+        self.assertEqual(compile_route("forward 400 e forward 300").commands, ['forward 500', 'forward 200'])
+        self.assertEqual(compile_route("forward 30 e back 20").commands, ['forward 30', 'back 20'])
+        plan = compile_route("forward 500 e left 20 e forward 100")
+        self.assertEqual(plan.commands, ['forward 500', 'left 20', 'forward 100'])
+
+    def test_validation(self):
+        """Comandos inválidos geram RouteError com o passo."""
+        with self.assertRaises(RouteError) as ctx:
+            compile_route("forward 100 e forward 600")
+        self.assertEqual(ctx.exception.step, 2)
+        for route in ("cw 0", "speed 200", "jump 10", "forward", "go 10 10 10 50", "flip x"):
+            with self.assertRaises(ValueError):
+                compile_route(route)
+
+    def test_estimates(self):
+        """O tempo estimado soma os passos e respeita a velocidade configurada."""
+        plan = compile_route("forward 100 e delay 3 e cw 90", optimize=False)
+        self.assertEqual(plan.commands, ['forward 100', 'delay 3', 'cw 90'])
+        self.assertAlmostEqual(plan.total_time, sum(s.duration for s in plan))
+        self.assertLess(estimate_command_time('forward 100', 100), estimate_command_time('forward 100', 20))
+        self.assertEqual(estimate_command_time('delay 3'), 3.0)
+
+class TestPeriodicRoute(unittest.TestCase):
+
+    @patch('builtins.print')
+    @patch('tello_zune.tello_zune.socket.socket')
+    def test_add_periodic_event_uses_plan(self, mock_socket, mock_print):
+        """add_periodic_event compila a rota uma vez e aceita planos prontos."""
+        tello = TelloZune()
+        plan = tello.add_periodic_event("forward 50 e forward 50 e cw 90", 100, "Vigilância")
+        self.assertEqual(tello.event_list[-1]['commands'], ['forward 100', 'cw 90'])
+        self.assertIs(tello.event_list[-1]['plan'], plan)
+
+        tello.add_periodic_event(plan, 50)
+        self.assertIs(tello.event_list[-1]['plan'], plan)
+        with self.assertRaises(RouteError):
+            tello.add_periodic_event("forward 5", 100)
+        with self.assertRaises(RouteError):
+            tello.add_periodic_event("up 50 e down 50", 100)
+        with self.assertRaises(RouteError):
+            tello.add_periodic_event(RoutePlan([]), 100)
+
+        tello.remove_periodic_event("forward 50 e forward 50 e cw 90")
+        self.assertEqual(tello.event_list, [])
+
+if __name__ == '__main__':
+    unittest.main()
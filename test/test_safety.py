@@ -0,0 +1,119 @@
+import time
+import socket
+import unittest
+import threading
+from unittest.mock import patch, MagicMock
+
+from tello_zune.safety import SafetyMonitor, SafetyRule, min_battery, altitude_floor, attitude_limit, altitude_ceiling
+from tello_zune.tello_zune import TelloZune
+
+FLYING = {'h': '80', 'tof': '90', 'bat': '50', 'temph': '60', 'pitch': '2', 'roll': '-1'}
+
+def packet(**fields):
+    state = dict(FLYING, **fields)
+    return (''.join(f"{k}:{v};" for k, v in state.items()) + '\r\n').encode('utf-8'), ('192.168.10.1', 8889)
+
+class TestSafetyMonitor(unittest.TestCase):
+
+    def test_trips_once_and_repeats(self):
+        """A regra dispara no primeiro pacote violado e só repete após repeat_interval."""
+        monitor = SafetyMonitor([min_battery(20)], repeat_interval=1.0)
+        self.assertEqual(monitor.evaluate(FLYING, 0.0), [])
+        trips = monitor.evaluate(dict(FLYING, bat='19'), 0.1)
+        self.assertEqual([(t['rule'], t['commands']) for t in trips], [('min_battery', ('land',))])
+        self.assertEqual(monitor.evaluate(dict(FLYING, bat='19'), 0.5), [])
+        self.assertTrue(monitor.evaluate(dict(FLYING, bat='18'), 1.2)[0]['repeat'])
+
+    def test_airborne_and_landing(self):
+        """Regras de voo não valem no chão; a altura mínima é ignorada durante o pouso."""
+        monitor = SafetyMonitor([min_battery(20), altitude_floor(40)])
+        self.assertEqual(monitor.evaluate({'h': '0', 'tof': '10', 'bat': '5'}, 0.0), [])
+        monitor.notify_command('land')
+        self.assertEqual(monitor.evaluate(dict(FLYING, tof='35'), 0.1), [])
+        monitor.notify_command('takeoff')
+        self.assertEqual(monitor.evaluate(dict(FLYING, tof='35'), 0.2)[0]['action'], 'hover')
+
+    def test_severity(self):
+        """Depois de uma ação mais severa, as menos severas são ignoradas."""
+        monitor = SafetyMonitor([attitude_limit(45), altitude_ceiling(200)])
+        trips = monitor.evaluate(dict(FLYING, roll='-70', h='250'), 0.0)
+        self.assertEqual([t['action'] for t in trips], ['emergency']) # O hover do teto é ignorado
+        self.assertEqual(monitor.level, 3)
+        self.assertEqual(trips[0]['value'], 70)
+        self.assertEqual(monitor.evaluate(dict(FLYING, h='300'), 5.0), [])
+
+    def test_lost_link(self):
+        """Sem pacotes em voo por mais que o limite, dispara a ação de perda de link."""
+        monitor = SafetyMonitor([], lost_link_timeout=0.5)
+        self.assertEqual(monitor.check_link(1.0), []) # Nenhum pacote ainda
+        monitor.evaluate(FLYING, 1.0)
+        self.assertEqual(monitor.check_link(1.4), [])
+        self.assertEqual(monitor.check_link(1.6)[0]['rule'], 'lost_link')
+
+    def test_hover_stop_only_when_supported(self):
+        """O hover só envia 'stop' com SDK 2.0 declarado; sem ele fica no 'rc 0 0 0 0'."""
+        trips = SafetyMonitor([altitude_ceiling(200)]).evaluate(dict(FLYING, h='250'), 0.0)
+        self.assertEqual(trips[0]['commands'], ('rc 0 0 0 0',))
+        trips = SafetyMonitor([altitude_ceiling(200)], stop_supported=True).evaluate(dict(FLYING, h='250'), 0.0)
+        self.assertEqual(trips[0]['commands'], ('rc 0 0 0 0', 'stop'))
+
+    def test_invalid_rule(self):
+        """Ações e regras inválidas são rejeitadas na criação."""
+        with self.assertRaises(ValueError):
+            SafetyRule('x', ('bat',), min=10, action='explode')
+        with self.assertRaises(ValueError):
+            SafetyRule('x', ('bat',))
+
+class TestTelloSafety(unittest.TestCase):
+
+    @patch('tello_zune.tello_zune.socket.socket')
+    def setUp(self, mock_socket):
+        self.tello = TelloZune()
+        self.tello.sock_cmd = MagicMock()
+        self.tello.sock_state = MagicMock()
+
+    def test_state_packet_triggers_direct_command(self):
+        """Um único pacote violado envia a ação direto pelo socket e limpa a fila."""
+        self.tello.enable_safety([min_battery(20)])
+        self.tello.add_command('forward 100')
+        self.tello.sock_state.recvfrom.return_value = packet(bat='10')
+        self.tello._state_receive()
+
+        self.tello.sock_cmd.sendto.assert_called_once_with(b'land', self.tello.telloaddr)
+        self.assertTrue(self.tello.command_queue.empty())
+        event = self.tello.safety.events[-1]
+        self.assertGreaterEqual(event['latency'], 0)
+        self.assertIn('tello_safety_reaction_seconds', self.tello.metrics())
+
+    def test_lost_link_on_timeout(self):
+        """A leitura do estado expira e o silêncio em voo dispara a perda de link."""
+        self.tello.enable_safety([], lost_link_timeout=0.0)
+        self.tello.sock_state.settimeout.assert_called_with(0.0)
+        self.tello.sock_state.recvfrom.return_value = packet()
+        self.tello._state_receive()
+        self.tello.sock_state.recvfrom.side_effect = socket.timeout
+        self.tello._state_receive()
+        self.tello.sock_cmd.sendto.assert_called_once_with(b'land', self.tello.telloaddr)
+
+    def test_reaction_aborts_command_in_flight(self):
+        """A resposta que chega depois de uma ação de segurança não vale para o comando em andamento."""
+        self.tello.enable_safety([min_battery(20)])
+        result = []
+        with patch.object(self.tello.timeouts, 'observe') as observe:
+            waiter = threading.Thread(target=lambda: result.append(self.tello.send_cmd_return('forward 100', timeout=5.0)))
+            waiter.start()
+            deadline = time.monotonic() + 5.0
+            while not self.tello.sock_cmd.sendto.called and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.tello.sock_state.recvfrom.return_value = packet(bat='10')
+            self.tello._state_receive() # Envia 'land' sem esperar o cmd_lock
+            self.tello.sock_cmd.recvfrom.return_value = (b'ok', self.tello.telloaddr)
+            self.tello._response_cmd_receive() # Resposta do 'land'
+            waiter.join(5.0)
+        self.assertEqual(result, [''])
+        observe.assert_not_called()
+        self.assertEqual(self.tello.sock_cmd.sendto.call_args[0][0], b'land')
+        self.assertEqual(self.tello.metrics()['tello_command_aborted_total'][()], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import unittest
+import urllib.request
+from unittest.mock import MagicMock
+import cv2
+import numpy as np
+
+from tello_zune.stream_server import StreamServer, BOUNDARY
+
+class TestStreamServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tello = MagicMock()
+        self.tello.get_state.return_value = {'bat': '80', 'tof': '10'}
+        self.tello.get_info.return_value = ('80', '10', '60', '65', '10')
+        self.server = StreamServer(self.tello, port=0)
+        self.server.start()
+        host, port = self.server.address
+        self.base = f'http://{host}:{port}'
+
+    def tearDown(self):
+        self.server.stop()
+
+    def get(self, path):
+        with urllib.request.urlopen(self.base + path, timeout=5) as resp:
+            return resp.headers, resp.read()
+
+    def test_frame_jpeg(self):
+        """/frame.jpg devolve o frame mais recente em JPEG."""
+        self.server.push_frame(np.full((48, 64, 3), 200, dtype=np.uint8))
+        headers, body = self.get('/frame.jpg?quality=90')
+        self.assertEqual(headers['Content-Type'], 'image/jpeg')
+        img = cv2.imdecode(np.frombuffer(body, np.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(img.shape, (48, 64, 3))
+
+    def test_encodes_once_per_quality(self):
+        """Vários pedidos do mesmo frame e qualidade codificam uma única vez."""
+        self.server.push_frame(np.zeros((48, 64, 3), dtype=np.uint8))
+        for _ in range(3):
+            self.get('/frame.jpg?quality=70')
+        self.assertEqual(self.server.encode_count, 1)
+        self.get('/frame.jpg?quality=50')
+        self.get('/frame.jpg?quality=70&hud=1')
+        self.assertEqual(self.server.encode_count, 3)
+
+    def test_frame_is_copied(self):
+        """Alterar o array depois de publicá-lo (ex: overlay do usuário) não afeta o frame servido."""
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        self.server.push_frame(frame)
+        frame[:] = 255
+        _, body = self.get('/frame.jpg?quality=90')
+        img = cv2.imdecode(np.frombuffer(body, np.uint8), cv2.IMREAD_COLOR)
+        self.assertLess(img.mean(), 10)
+
+    def test_telemetry_json(self):
+        """/telemetry.json devolve o estado do drone."""
+        self.server.push_frame(np.zeros((48, 64, 3), dtype=np.uint8))
+        headers, body = self.get('/telemetry.json')
+        data = json.loads(body)
+        self.assertEqual(data['state'], {'bat': '80', 'tof': '10'})
+        self.assertEqual(data['frame_seq'], 1)
+
+    def test_mjpeg_stream(self):
+        """/video.mjpg entrega frames como multipart."""
+        self.server.push_frame(np.zeros((48, 64, 3), dtype=np.uint8))
+        with urllib.request.urlopen(self.base + '/video.mjpg', timeout=5) as resp:
+            self.assertIn(BOUNDARY, resp.headers['Content-Type'])
+            self.assertEqual(resp.readline(), f'--{BOUNDARY}\r\n'.encode())
+            self.assertEqual(resp.readline(), b'Content-Type: image/jpeg\r\n')
+            length = int(resp.readline().split(b':')[1])
+            resp.readline()
+            self.assertEqual(resp.read(length)[:2], b'\xff\xd8')
+
+    def test_no_frame_yet(self):
+        """Sem frames, /frame.jpg responde 503."""
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.get('/frame.jpg')
+        self.assertEqual(ctx.exception.code, 503)
+
+if __name__ == '__main__':
+    unittest.main()
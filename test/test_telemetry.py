@@ -0,0 +1,87 @@
+import unittest
+import numpy as np
+
+from tello_zune.telemetry import TelemetryBuffer
+
+class TestTelemetryBuffer(unittest.TestCase):
+
+    def test_interpolation(self):
+        """O estado é interpolado linearmente entre os pacotes vizinhos."""
+        buf = TelemetryBuffer(capacity=8)
+        buf.push(1.0, {'yaw': '0', 'tof': '100', 'vgx': '10'})
+        buf.push(2.0, {'yaw': '10', 'tof': '200', 'vgx': '-10'})
+        state = buf.at(1.25)
+        self.assertAlmostEqual(state['yaw'], 2.5)
+        self.assertAlmostEqual(state['tof'], 125.0)
+        self.assertAlmostEqual(state['vgx'], 5.0)
+        self.assertEqual(state['timestamp'], 1.25)
+
+    def test_clamps_outside_history(self):
+        """Antes do primeiro ou depois do último pacote usa o pacote mais próximo."""
+        buf = TelemetryBuffer(capacity=8)
+        self.assertEqual(buf.at(1.0), {})
+        buf.push(1.0, {'h': '50'})
+        self.assertEqual(buf.at(5.0)['h'], 50.0)
+        buf.push(2.0, {'h': '70'})
+        self.assertEqual(buf.at(0.0)['h'], 50.0)
+        self.assertEqual(buf.at(9.0)['h'], 70.0)
+
+    def test_yaw_shortest_arc(self):
+        """A guinada atravessa ±180 pelo menor arco."""
+        buf = TelemetryBuffer(capacity=8)
+        buf.push(0.0, {'yaw': '170'})
+        buf.push(1.0, {'yaw': '-170'})
+        self.assertAlmostEqual(abs(buf.at(0.5)['yaw']), 180.0)
+        self.assertAlmostEqual(buf.at(0.25)['yaw'], 175.0)
+        self.assertAlmostEqual(buf.at(0.75)['yaw'], -175.0)
+
+    def test_ring_wraps(self):
+        """Após encher, o anel mantém as últimas amostras em ordem."""
+        buf = TelemetryBuffer(fields=('h',), capacity=4)
+        for i in range(10):
+            buf.push(float(i), {'h': str(i * 10)})
+        times, values = buf._window()
+        np.testing.assert_array_equal(times, [6.0, 7.0, 8.0, 9.0])
+        self.assertAlmostEqual(buf.at(7.5)['h'], 75.0)
+        self.assertEqual(buf.at(2.0)['h'], 60.0) # Amostra antiga já descartada
+        self.assertEqual(buf.latest(), {'h': 90.0, 'timestamp': 9.0})
+
+    def test_window_excludes_slot_being_written(self):
+        """Um push em andamento escreve fora da janela vista pelos leitores."""
+        buf = TelemetryBuffer(fields=('h',), capacity=4)
+        for n in range(12):
+            times, values = buf._window()
+            i = buf.count % buf.slots
+            buf.times[i] = buf.times[i + buf.slots] = np.nan # Metade de um push: tempo sem o valor
+            self.assertFalse(np.isnan(times).any())
+            self.assertEqual(len(times), min(n, 4))
+            buf.push(float(n), {'h': str(n * 10)})
+        np.testing.assert_array_equal(buf._window()[0], [8.0, 9.0, 10.0, 11.0])
+
+    def test_interpolate_retries_when_lapped(self):
+        """Uma leitura que atravessa dois pushes é refeita com a janela nova."""
+        buf = TelemetryBuffer(fields=('h',), capacity=4)
+        for i in range(6):
+            buf.push(float(i), {'h': str(i * 10)})
+        calls = []
+        original = buf._interpolate
+        def slow_reader(window, ts):
+            calls.append(1)
+            if len(calls) == 1: # O escritor avança duas amostras durante a primeira leitura
+                buf.push(6.0, {'h': '60'})
+                buf.push(7.0, {'h': '70'})
+            return original(window, ts)
+        buf._interpolate = slow_reader
+        self.assertAlmostEqual(buf.at(6.5)['h'], 65.0)
+        self.assertEqual(len(calls), 2)
+
+    def test_vectorised_and_missing_fields(self):
+        """Vários instantes de uma vez; campos ausentes repetem o valor anterior."""
+        buf = TelemetryBuffer(fields=('tof', 'h'), capacity=8)
+        buf.push(0.0, {'tof': '10', 'h': '0'})
+        buf.push(1.0, {'tof': '30'})
+        out = buf.interpolate(np.array([0.0, 0.5, 1.0]))
+        np.testing.assert_allclose(out, [[10, 0], [20, 0], [30, 0]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,9 @@ import threading
 import time
 
 # Importa a sua classe (certifique-se de que o arquivo principal se chama tello_zune.py)
-from tello_zune.tello_zune import TelloZune
+from tello_zune.tello_zune import TelloZune, SafeThread
+from tello_zune.clock import VirtualClock
+from tello_zune.timebase import Stamp
 
 class TestTelloZune(unittest.TestCase):
 
@@ -69,17 +71,18 @@ class TestTelloZune(unittest.TestCase):
         self.assertEqual((vx, vy, vz), (0.0, 0.0, 0.0))
 
     @patch.object(TelloZune, 'send_cmd_return')
-    @patch('time.sleep') # Evita que o teste fique lento por causa do sleep
-    def test_land_timeout_loop(self, mock_sleep, mock_send_cmd_return):
+    def test_land_timeout_loop(self, mock_send_cmd_return):
         """Garante que a função land não entra em loop infinito se o drone não responder 'ok'."""
         # Simulamos o drone retornando 'error' continuamente
         mock_send_cmd_return.return_value = 'error'
+        self.tello.clock = VirtualClock() # Pausas entre as tentativas em tempo virtual, sem dormir
         
         # Executa o land
         self.tello.land()
         
         # Verifica se tentou exatamente o número máximo de vezes (1 chamada inicial + 3 retentativas = 4)
         self.assertEqual(mock_send_cmd_return.call_count, 4)
+        self.assertEqual(len(self.tello.clock.sleeps), 3)
 
     def test_add_command_and_clear_queue(self):
         """Testa se a fila de comandos enfileira e limpa corretamente."""
@@ -108,5 +111,274 @@ class TestTelloZune(unittest.TestCase):
         ]
         mock_add_command.assert_has_calls(expected_calls, any_order=False)
 
+    def test_get_frame_timestamp(self):
+        """Testa se get_frame expõe o instante de captura do frame."""
+        from tello_zune.video import VideoFrame
+        import numpy as np
+        frame = np.zeros((6, 8, 3), dtype=np.uint8)
+        self.tello.q.put((VideoFrame.from_bgr(frame), Stamp(7, 123_500_000_000)))
+        self.assertIs(self.tello.get_frame(), frame)
+        self.assertEqual(self.tello.frame_timestamp, 123.5)
+        self.assertEqual(self.tello.frame_stamp.seq, 7)
+
+    def test_frame_state(self):
+        """Testa se o frame vem com o estado interpolado no seu instante de captura."""
+        self.assertEqual(self.tello.get_frame_state(), {})
+        self.tello.enable_telemetry_buffer()
+        self.tello.sock_state.recvfrom.side_effect = [
+            (b'pitch:0;roll:0;yaw:10;tof:100;', ('x', 1)),
+            (b'pitch:0;roll:0;yaw:20;tof:120;', ('x', 1)),
+        ]
+        self.tello.clock = VirtualClock(start=5.0)
+        self.tello._state_receive()
+        self.tello.clock.advance(0.1)
+        self.tello._state_receive()
+        from tello_zune.video import VideoFrame
+        import numpy as np
+        frame = np.zeros((6, 8, 3), dtype=np.uint8)
+        self.tello.q.put((VideoFrame.from_bgr(frame), Stamp(1, 5_050_000_000)))
+        got, state = self.tello.get_frame_with_state()
+        self.assertIs(got, frame)
+        self.assertAlmostEqual(state['yaw'], 15.0)
+        self.assertAlmostEqual(state['tof'], 110.0)
+        self.assertAlmostEqual(self.tello.get_frame_state(latency=0.05)['yaw'], 10.0)
+
+    def test_stream_stamps_and_control_latency(self):
+        """Testa o carimbo dos fluxos no recebimento e a latência frame -> rc."""
+        from tello_zune.video import VideoFrame
+        import numpy as np
+        self.tello.clock = VirtualClock(start=10.0)
+        self.tello.sock_state.recvfrom.return_value = (b'bat:80;', ('x', 1))
+        self.tello._state_receive()
+        self.tello.clock.advance(0.3)
+        self.tello._state_receive()
+        self.assertEqual(self.tello.state_stamp.seq, 2)
+        self.assertEqual(self.tello.stream_stats()['state']['missed'], 2)
+
+        self.tello.q.put((VideoFrame.from_bgr(np.zeros((6, 8, 3), np.uint8)), Stamp(1, self.tello.clock.monotonic_ns())))
+        self.tello.get_frame()
+        self.tello.clock.advance(0.04)
+        self.tello.send_rc_control(0, 10, 0, 0)
+        self.tello.clock.advance(0.04)
+        self.tello.send_rc_control(0, 20, 0, 0) # Mesmo frame: não conta de novo
+        latency = self.tello.control_latency()
+        self.assertEqual(latency['count'], 1)
+        self.assertAlmostEqual(latency['last'], 0.04)
+        self.assertEqual(latency['buckets'][0.05], 1)
+        self.assertEqual(self.tello.cmd_stamp.seq, 2)
+        sent = self.tello.send_cmd('command') # O envio devolve o próprio carimbo
+        self.assertEqual((sent.seq, sent.t_ns), (3, self.tello.clock.monotonic_ns()))
+
+    def test_video_reopens_after_read_failure(self):
+        """Se a leitura do vídeo falha, o decodificador é liberado e reaberto na iteração seguinte."""
+        failed = MagicMock()
+        failed.read.return_value = (False, None)
+        self.tello.video = failed
+        self.tello._video()
+        failed.release.assert_called_once()
+        self.assertIsNone(self.tello.video)
+        with patch('tello_zune.tello_zune.open_decoder') as mock_open:
+            mock_open.return_value.isOpened.return_value = True
+            self.tello._video()
+        mock_open.assert_called_once_with(self.tello.video_source, self.tello.video_backend)
+        self.assertIs(self.tello.video, mock_open.return_value)
+
+    def test_gray_frame(self):
+        """Testa se get_gray_frame entrega a luminância e o frame BGR é convertido só quando pedido."""
+        from tello_zune.video import VideoFrame
+        import numpy as np
+        yuv = np.full((9, 8), 128, dtype=np.uint8)
+        yuv[:6] = 200
+        self.tello.q.put((VideoFrame.from_yuv(yuv), Stamp(1, 10**9)))
+        gray = self.tello.get_gray_frame()
+        self.assertEqual(gray.shape, (6, 8))
+        self.assertTrue(np.shares_memory(gray, yuv))
+        self.tello.set_image_size((8, 6))
+        self.assertEqual(self.tello.get_gray_frame(timeout=0.01).shape, (6, 8)) # Fila vazia: frame preto
+
+    def test_frame_bus(self):
+        """Testa se os frames do vídeo são publicados no anel compartilhado."""
+        from tello_zune.frame_bus import FrameSubscriber
+        import numpy as np
+        self.tello.set_image_size((8, 6))
+        sub = FrameSubscriber(self.tello.start_frame_bus())
+        self.tello.video = MagicMock()
+        self.tello.video.read.return_value = (True, np.full((12, 16, 3), 9, dtype=np.uint8))
+        self.tello._video()
+        seq, frame, _ = sub.read_latest(copy=True)
+        self.assertEqual(seq, 1)
+        self.assertEqual(frame.shape, (6, 8, 3))
+        sub.close()
+        self.tello.stop_frame_bus()
+        self.assertIsNone(self.tello.frame_bus)
+
+    def test_get_state(self):
+        """Testa se o pacote de estado é convertido em dicionário."""
+        self.tello.state_value = 'pitch:1;roll:-2;bat:80;'.replace(';', ':').split(':')
+        self.assertEqual(self.tello.get_state(), {'pitch': '1', 'roll': '-2', 'bat': '80'})
+
+    @patch('cv2.VideoCapture')
+    def test_start_tello_readiness_report(self, mock_capture):
+        """Testa se start_tello espera as fases em paralelo e relata o tempo de cada uma."""
+        import numpy as np
+        def recv_cmd(*args):
+            time.sleep(0.001)
+            return b'ok', ('192.168.10.1', 8889)
+        def recv_state(*args):
+            time.sleep(0.01)
+            return b'bat:80;tof:10;', ('192.168.10.1', 8890)
+        # Sockets distintos: o patch do setUp devolve o mesmo mock para os dois
+        self.tello.sock_cmd = self.mock_sock_cmd = MagicMock()
+        self.tello.sock_state = MagicMock()
+        self.mock_sock_cmd.recvfrom.side_effect = recv_cmd
+        self.tello.sock_state.recvfrom.side_effect = recv_state
+        self.tello.video_backend = 'opencv' # Usa o cv2.VideoCapture mockado mesmo com o PyAV instalado
+        mock_capture.return_value.isOpened.return_value = True
+        mock_capture.return_value.read.return_value = (True, np.zeros((720, 960, 3), dtype=np.uint8))
+
+        report = self.tello.start_tello_async(timeout=5).result(timeout=10)
+        self.tello.stop_video()
+
+        self.assertTrue(report)
+        self.assertTrue(report.complete)
+        self.assertEqual(set(report.phases), {'connect', 'first_state', 'video_open', 'first_frame'})
+        self.assertLess(report.total, 5)
+        self.mock_sock_cmd.sendto.assert_any_call(b'streamon', ('192.168.10.1', 8889))
+
+    @patch.object(TelloZune, 'send_cmd_return', return_value='')
+    def test_wait_till_connected_backoff(self, mock_send_cmd_return):
+        """Testa se as tentativas de conexão começam com poucos milissegundos e dobram até 0.5 s."""
+        self.tello.clock = VirtualClock()
+        self.assertFalse(self.tello.wait_till_connected(timeout=2))
+        delays = self.tello.clock.sleeps
+        self.assertAlmostEqual(delays[0], 0.005)
+        self.assertAlmostEqual(delays[1], 0.01)
+        self.assertTrue(all(d <= 0.5 for d in delays))
+        self.assertAlmostEqual(self.tello.clock.monotonic(), 2.0) # Desiste exatamente no timeout
+
+    def test_telemetry_only_import(self):
+        """Testa se importar a biblioteca e iniciar sem vídeo não carrega OpenCV, NumPy nem os módulos opcionais."""
+        import subprocess, sys
+        code = (
+            "import sys\n"
+            "from unittest.mock import patch\n"
+            "from tello_zune import TelloZune\n"
+            "with patch('socket.socket'):\n"
+            "    TelloZune(video=False)\n"
+            "assert 'cv2' not in sys.modules and 'numpy' not in sys.modules, 'video stack imported'\n"
+            "lazy = [m for m in ('http.server', 'tello_zune.mission', 'tello_zune.relay') if m in sys.modules]\n"
+            "assert not lazy, lazy\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    @patch.object(TelloZune, 'wait_till_connected', return_value=True)
+    @patch.object(TelloZune, 'start_communication')
+    @patch.object(TelloZune, 'start_video')
+    def test_start_tello_without_video(self, mock_start_video, mock_start_comm, mock_wait):
+        """Testa se o modo video=False conecta sem iniciar o vídeo."""
+        self.tello.enable_video = False
+        self.tello.phase_times['connect'] = time.monotonic()
+        self.tello._mark_phase('first_state', self.tello.state_ev)
+        with patch.object(self.tello.stateThread, 'start'):
+            report = self.tello.start_tello(timeout=1)
+        mock_start_video.assert_not_called()
+        self.assertTrue(report.complete)
+        self.assertEqual(set(report.phases), {'connect', 'first_state'})
+
+    def test_metrics_hot_paths(self):
+        """Testa se os caminhos quentes atualizam as métricas."""
+        self.mock_sock_state.recvfrom.return_value = (b'bat:80;', ('192.168.10.1', 8890))
+        self.tello._state_receive()
+        self.tello.add_command('takeoff')
+        with patch.object(self.tello.cmd_recv_ev, 'wait', return_value=False):
+            self.tello.send_cmd_return('battery?')
+        with patch.object(self.tello.cmd_recv_ev, 'wait', return_value=True):
+            self.tello.send_cmd_return('battery?')
+        self.mock_sock_state.recvfrom.side_effect = OSError('falha')
+        with patch('builtins.print'):
+            self.tello._state_receive()
+
+        m = self.tello.metrics()
+        self.assertEqual(m['tello_state_packets_total'][()], 1)
+        self.assertEqual(m['tello_command_queue_depth'][()], 1)
+        self.assertEqual(m['tello_command_timeouts_total'][()], 1)
+        self.assertEqual(m['tello_command_rtt_seconds'][(('command', 'battery?'),)]['count'], 1)
+        self.assertEqual(m['tello_thread_errors_total'][(('thread', 'state'),)], 1)
+
+    def test_thread_stats(self):
+        """Testa se thread_stats reporta todas as threads e os erros tratados pelos handlers."""
+        self.tello.enable_thread_stats()
+        self.assertTrue(all(t.instrument for t in self.tello._threads()))
+        self.mock_sock_state.recvfrom.side_effect = OSError('falha')
+        with patch('builtins.print'):
+            self.tello.stateThread.start()
+            time.sleep(0.05)
+            self.tello.stateThread.stop()
+            self.tello.stateThread.join(1)
+        stats = self.tello.thread_stats()
+        self.assertEqual(set(stats), {'cmd_receive', 'periodic', 'video', 'state', 'moves', 'text_input'})
+        self.assertGreater(stats['state']['iterations'], 0)
+        self.assertEqual(stats['state']['exceptions'], stats['state']['iterations'])
+        self.assertIn('falha', stats['state']['last_exception'])
+
+class TestSafeThread(unittest.TestCase):
+
+    def run_iterations(self, thread, n):
+        """Executa n iterações na thread atual, como run() faria."""
+        for _ in range(n):
+            thread._instrumented_call()
+
+    def test_busy_vs_blocked(self):
+        """Iterações que dormem contam como tempo bloqueado, não ocupado."""
+        thread = SafeThread(target=lambda: time.sleep(0.01), instrument=True)
+        self.run_iterations(thread, 5)
+        stats = thread.stats()
+        self.assertEqual(stats['iterations'], 5)
+        self.assertGreater(stats['blocked_s'], 0.04)
+        self.assertLess(stats['busy_ratio'], 0.5)
+        self.assertGreaterEqual(stats['max_iteration_ms'], 10)
+
+    def test_hook_every_n(self):
+        """O gancho é chamado a cada N iterações com as estatísticas."""
+        calls = []
+        thread = SafeThread(target=lambda: None)
+        thread.set_hook(lambda t, stats: calls.append(stats['iterations']), every=3)
+        self.run_iterations(thread, 7)
+        self.assertEqual(calls, [3, 6])
+
+    def test_profiling_samples(self):
+        """O cProfile amostra uma iteração a cada N."""
+        def work():
+            sum(range(100))
+        thread = SafeThread(target=work)
+        thread.enable_profiling(every=2)
+        self.run_iterations(thread, 4)
+        stats = thread.profile_stats()
+        calls = [v[1] for k, v in stats.stats.items() if k[2] == 'work']
+        self.assertEqual(calls, [2])
+
+    def test_uncaught_exception_is_counted(self):
+        """Exceções não tratadas pelo target são contadas antes de encerrar a thread."""
+        def fail():
+            raise RuntimeError('erro')
+        thread = SafeThread(target=fail)
+        with self.assertRaises(RuntimeError):
+            thread._call()
+        self.assertEqual(thread.stats()['exceptions'], 1)
+
+    def test_counts_without_instrumentation(self):
+        """Iterações e exceções são contadas sem instrumentação e sem limite, inclusive na taxa."""
+        thread = SafeThread(target=lambda: None)
+        for _ in range(3):
+            thread._call()
+        for _ in range(1500):
+            thread.record_exception(RuntimeError('erro'))
+        stats = thread.stats()
+        self.assertEqual(stats['iterations'], 3)
+        self.assertEqual(stats['avg_iteration_ms'], 0.0) # Sem iterações medidas
+        self.assertEqual(stats['exceptions'], 1500)
+        self.assertAlmostEqual(stats['exception_rate'], 1500 / SafeThread.EXCEPTION_RATE_WINDOW)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
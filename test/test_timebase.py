@@ -0,0 +1,54 @@
+import threading
+import unittest
+
+from tello_zune.timebase import Stamp, StreamSequence
+from tello_zune.clock import Clock, VirtualClock
+
+class TestTimebase(unittest.TestCase):
+
+    def test_sequence_and_gaps(self):
+        """Testa a numeração e a detecção de lacunas pelo intervalo nominal."""
+        stream = StreamSequence('state', interval=0.1)
+        stamps = [stream.stamp(t) for t in (0, 100_000_000, 200_000_000, 500_000_000)]
+        self.assertEqual([s.seq for s in stamps], [1, 2, 3, 4])
+        self.assertEqual(stamps[-1].missed, 2) # 300 ms = 3 períodos: 2 pacotes perdidos
+        stats = stream.stats()
+        self.assertEqual((stats['count'], stats['missed'], stats['gaps']), (4, 2, 1))
+        self.assertAlmostEqual(stats['loss_ratio'], 2 / 6)
+        self.assertAlmostEqual(stats['max_interval_ms'], 300.0)
+
+    def test_on_demand_stream(self):
+        """Testa que fluxos sem intervalo nominal não contam perdas."""
+        stream = StreamSequence('cmd')
+        stream.stamp(0)
+        self.assertEqual(stream.stamp(5_000_000_000).missed, 0)
+        self.assertEqual(stream.stats()['seq'], 2)
+
+    def test_concurrent_writers(self):
+        """Com várias threads carimbando (fluxo 'cmd'), as sequências são únicas e last nunca volta."""
+        stream = StreamSequence('cmd')
+        clock = Clock()
+        seen: list[list[int]] = [[] for _ in range(4)]
+        def writer(out):
+            for _ in range(2000):
+                out.append(stream.stamp(clock.monotonic_ns()).seq)
+        threads = [threading.Thread(target=writer, args=(out,)) for out in seen]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        seqs = [seq for out in seen for seq in out]
+        self.assertEqual(sorted(seqs), list(range(1, 8001)))
+        self.assertTrue(all(out == sorted(out) for out in seen))
+        self.assertEqual((stream.last.seq, stream.count), (8000, 8000))
+
+    def test_clock_ns(self):
+        """Testa se o instante em nanossegundos tem a mesma base de monotonic()."""
+        clock = VirtualClock(start=5.1)
+        stamp = Stamp(1, clock.monotonic_ns())
+        self.assertEqual(stamp.seconds, clock.monotonic())
+        real = Clock()
+        self.assertLess(abs(real.monotonic_ns() / 1e9 - real.monotonic()), 0.01)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+
+from tello_zune.timeouts import RttEstimator, TimeoutModel
+from tello_zune.tello_zune import TelloZune
+
+class TestRttEstimator(unittest.TestCase):
+
+    def test_rfc6298(self):
+        """Primeira amostra: SRTT = R, RTTVAR = R/2; depois médias com alpha=1/8 e beta=1/4."""
+        rtt = RttEstimator(min_rto=0.0)
+        self.assertEqual(rtt.rto, 1.0)
+        rtt.observe(0.1)
+        self.assertAlmostEqual(rtt.rto, 0.1 + 4 * 0.05)
+        rtt.observe(0.2)
+        self.assertAlmostEqual(rtt.rttvar, 0.75 * 0.05 + 0.25 * 0.1)
+        self.assertAlmostEqual(rtt.srtt, 0.875 * 0.1 + 0.125 * 0.2)
+
+    def test_backoff(self):
+        """Cada timeout dobra o RTO até o máximo."""
+        rtt = RttEstimator(initial_rto=1.0, max_rto=3.0)
+        rtt.backoff()
+        rtt.backoff()
+        self.assertEqual(rtt.rto, 3.0)
+
+class TestTimeoutModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = TimeoutModel()
+        for _ in range(10):
+            self.model.observe('battery?', 0.03, '80')
+
+    def test_scales_with_arguments(self):
+        """Giros curtos têm timeout curto; movimentos longos, timeout longo."""
+        self.assertLess(self.model.timeout_for('battery?'), 0.5)
+        self.assertLess(self.model.timeout_for('cw 10'), 2.0) # Antes: 8 s
+        self.assertGreater(self.model.timeout_for('forward 500'), 10.0) # Antes: 8 s, cortava o movimento
+        self.assertGreater(self.model.timeout_for('forward 500'), self.model.timeout_for('forward 100'))
+
+    def test_learns_duration(self):
+        """O fator aprendido aproxima o timeout da duração real medida."""
+        before = self.model.timeout_for('forward 100')
+        expected = self.model.expected_duration('forward 100')
+        for _ in range(30):
+            self.model.observe('forward 100', expected * 0.5 + 0.03, 'ok')
+        after = self.model.timeout_for('forward 100')
+        self.assertLess(after, before)
+        self.assertGreater(after, expected * 0.5) # Não corta o movimento
+        self.model.observe('forward 100', 0.05, 'error') # Erros não contam como duração
+        self.assertAlmostEqual(self.model.timeout_for('forward 100'), after)
+
+    def test_speed_and_timeouts(self):
+        """'speed x' confirmado muda a previsão; timeouts alargam a margem."""
+        slow = self.model.timeout_for('forward 200')
+        self.model.observe('speed 100', 0.03, 'ok')
+        self.assertLess(self.model.timeout_for('forward 200'), slow)
+        rto = self.model.rtt.rto
+        self.model.on_timeout('battery?')
+        self.assertEqual(self.model.rtt.rto, rto * 2)
+        before = self.model.timeout_for('cw 90')
+        self.model.on_timeout('cw 90')
+        self.assertGreater(self.model.timeout_for('cw 90'), before)
+
+class TestTelloTimeouts(unittest.TestCase):
+
+    @patch('tello_zune.tello_zune.socket.socket')
+    def setUp(self, mock_socket):
+        self.tello = TelloZune()
+
+    @patch('tello_zune.tello_zune.threading.Event.wait', return_value=False)
+    def test_send_cmd_return_uses_model(self, mock_wait):
+        """Sem timeout explícito, send_cmd_return usa a previsão do modelo e registra o timeout."""
+        expected = self.tello.timeouts.timeout_for('cw 10')
+        self.tello.send_cmd_return('cw 10')
+        mock_wait.assert_called_once_with(expected)
+        self.assertGreater(self.tello.timeouts.timeout_for('cw 10'), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import sys
+import types
+import unittest
+from unittest.mock import patch
+import numpy as np
+
+from tello_zune.video import PyAVDecoder, VideoFrame, open_decoder
+
+class FakeFrame:
+    """Frame do PyAV: I420 (altura * 3 / 2, largura) com o valor do pacote."""
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.format = types.SimpleNamespace(name='yuv420p')
+
+    def to_ndarray(self) -> np.ndarray:
+        return np.full((6, 4), self.value, dtype=np.uint8)
+
+class FakePacket:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def decode(self) -> list:
+        if self.value is None:
+            raise ValueError('Invalid data found when processing input') # Pacote H.264 corrompido
+        return [FakeFrame(self.value)] if self.value >= 0 else [] # Pacotes sem frame (ex: SPS) são normais
+
+class FakeContainer:
+    """Container que entrega os pacotes em ordem e falha na leitura no fim, se pedido."""
+    def __init__(self, values: list, fail_at_end: bool = False) -> None:
+        self.values = values
+        self.fail_at_end = fail_at_end
+        self.streams = types.SimpleNamespace(video=[types.SimpleNamespace(thread_type=None)])
+        self.closed = False
+
+    def demux(self, stream):
+        for value in self.values:
+            yield FakePacket(value)
+        if self.fail_at_end:
+            raise OSError('Connection reset')
+
+    def close(self) -> None:
+        self.closed = True
+
+def fake_av(container: FakeContainer) -> types.ModuleType:
+    module = types.ModuleType('av')
+    module.open = lambda *args, **kwargs: container
+    return module
+
+class TestVideoFrame(unittest.TestCase):
+
+    def make_yuv(self, w: int = 8, h: int = 6) -> np.ndarray:
+        yuv = np.empty((h * 3 // 2, w), dtype=np.uint8)
+        yuv[:h] = np.arange(w * h, dtype=np.uint8).reshape(h, w)
+        yuv[h:] = 128 # Croma neutro: BGR em tons de cinza
+        return yuv
+
+    def test_gray_is_y_plane_view(self):
+        """Testa se a luminância de um frame I420 é uma view do plano Y, sem cópia."""
+        yuv = self.make_yuv()
+        frame = VideoFrame.from_yuv(yuv)
+        self.assertEqual(frame.size, (8, 6))
+        self.assertTrue(np.shares_memory(frame.gray, yuv))
+        np.testing.assert_array_equal(frame.gray, yuv[:6])
+
+    def test_lazy_bgr(self):
+        """Testa se o BGR só é convertido quando pedido, e uma única vez."""
+        frame = VideoFrame.from_yuv(self.make_yuv())
+        self.assertIsNone(frame._bgr)
+        bgr = frame.bgr
+        self.assertEqual(bgr.shape, (6, 8, 3))
+        self.assertIs(frame.bgr, bgr)
+
+    def test_bgr_frame_gray(self):
+        """Testa a luminância de um frame que já chegou em BGR."""
+        frame = VideoFrame.from_bgr(np.full((6, 8, 3), 50, dtype=np.uint8))
+        self.assertFalse(frame.is_yuv)
+        self.assertEqual(frame.gray.shape, (6, 8))
+        self.assertEqual(int(frame.gray[0, 0]), 50)
+
+    def test_resized(self):
+        """Testa se o redimensionamento mantém o formato e é evitado quando o tamanho já confere."""
+        frame = VideoFrame.from_yuv(self.make_yuv())
+        self.assertIs(frame.resized((8, 6)), frame)
+        small = frame.resized((4, 2))
+        self.assertTrue(small.is_yuv)
+        self.assertEqual(small.yuv.shape, (3, 4))
+        self.assertEqual(small.gray.shape, (2, 4))
+        self.assertEqual(VideoFrame.from_bgr(np.zeros((6, 8, 3), np.uint8)).resized((4, 2)).bgr.shape, (2, 4, 3))
+
+    def test_invalid_arguments(self):
+        """Testa os erros de construção e de backend."""
+        with self.assertRaises(ValueError):
+            VideoFrame()
+        with self.assertRaises(ValueError):
+            open_decoder('udp://@0.0.0.0:11111', backend='gstreamer')
+
+class TestPyAVDecoder(unittest.TestCase):
+
+    def open(self, container: FakeContainer) -> PyAVDecoder:
+        with patch.dict(sys.modules, {'av': fake_av(container)}):
+            return PyAVDecoder('udp://@0.0.0.0:11111')
+
+    def test_skips_corrupt_packets(self):
+        """Um pacote corrompido no meio do stream é pulado; os frames seguintes continuam chegando."""
+        decoder = self.open(FakeContainer([1, None, -1, 2, None, 3]))
+        values = []
+        while True:
+            ok, frame = decoder.read()
+            if not ok:
+                break
+            self.assertTrue(frame.is_yuv)
+            values.append(int(frame.gray[0, 0]))
+        self.assertEqual(values, [1, 2, 3])
+        self.assertEqual(decoder.errors, 2)
+        self.assertFalse(decoder.isOpened()) # Fim do stream fecha o decodificador
+
+    def test_stream_failure_closes(self):
+        """Uma falha de leitura do stream fecha o decodificador, para a thread de vídeo reabrir."""
+        container = FakeContainer([1], fail_at_end=True)
+        decoder = self.open(container)
+        self.assertTrue(decoder.read()[0])
+        self.assertEqual(decoder.read(), (False, None))
+        self.assertTrue(container.closed)
+        self.assertEqual(decoder.read(), (False, None))
+
+if __name__ == '__main__':
+    unittest.main()